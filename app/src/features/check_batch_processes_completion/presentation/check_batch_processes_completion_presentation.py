@@ -9,6 +9,9 @@ from app.src.features.cross.infra.mappers.dynamodb_streams_lambda_event_mapper i
 from app.src.features.check_batch_processes_completion.infra.adapters.sns_topic_adapter import (
     SNSTopicAdapter
 )
+from app.src.features.cross.infra.repositories.dynamodb_batch_control_database_repository import (
+    DynamoDBBatchControlDatabaseRepository
+)
 from app.src.features.cross.infra.mappers.http_response_mapper import HTTPResponseMapper
 
 
@@ -16,11 +19,13 @@ from app.src.features.cross.infra.mappers.http_response_mapper import HTTPRespon
 # Initialize mappers, adapters and repositories
 event_mapper = DynamoDBStreamsLambdaEventMapper()
 topic_adapter = SNSTopicAdapter()
+batch_control_database_repository = DynamoDBBatchControlDatabaseRepository()
 
 
 # Initializing use case
 use_case = CheckBatchProcessesCompletionUseCase(
-    topic_adapter=topic_adapter
+    topic_adapter=topic_adapter,
+    batch_control_database_repository=batch_control_database_repository
 )
 
 
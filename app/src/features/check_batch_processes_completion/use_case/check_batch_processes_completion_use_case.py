@@ -5,6 +5,9 @@ from app.src.features.check_batch_processes_completion.domain.interfaces.topic_a
     ITopicAdapter
 )
 
+from app.src.features.cross.domain.interfaces.batch_control_database_repository_interface import (
+    IBatchControlDatabaseRepository
+)
 from app.src.features.cross.domain.dtos.dynamodb_streams_input_dto import DynamoDBStreamsInputDTO
 from app.src.features.cross.utils.log import LogUtils
 from app.src.features.cross.domain.dtos.output_dto import OutputDTO
@@ -25,6 +28,7 @@ class CheckBatchProcessesCompletionUseCase:
     """
 
     topic_adapter: ITopicAdapter
+    batch_control_database_repository: IBatchControlDatabaseRepository
 
 
     def execute(self, input_dto: DynamoDBStreamsInputDTO) -> OutputDTO:
@@ -40,6 +44,7 @@ class CheckBatchProcessesCompletionUseCase:
 
         try:
             logger.info("Checking if any records in the stream event indicate a batch process completion")
+            aggregated_processes = set()
             for record in input_dto.records:
                 table_new_image = record.record_data.new_image
 
@@ -54,7 +59,20 @@ class CheckBatchProcessesCompletionUseCase:
                     finished_at=table_new_image.get("finished_at", None)
                 )
 
-                if batch_process.process_status == ProcessStatus.COMPLETED:
+                if self.batch_control_database_repository.is_batch_process_shard(batch_process):
+                    # Shard records are never published: the process record is completed (and then
+                    # published by its own stream record) once the shards add up to the total items
+                    process_key = (
+                        batch_process.process_name,
+                        batch_process.execution_date.split("#")[0]
+                    )
+                    if batch_process.process_status == ProcessStatus.IN_PROGRESS and \
+                            process_key not in aggregated_processes:
+                        aggregated_processes.add(process_key)
+                        self.batch_control_database_repository.complete_sharded_batch_process(
+                            batch_process
+                        )
+                elif batch_process.process_status == ProcessStatus.COMPLETED:
                     logger.info(
                         f"Batch process '{batch_process.process_name.value}' has been completed "
                         f"at {batch_process.finished_at}. Sending to SNS topic for further processing."
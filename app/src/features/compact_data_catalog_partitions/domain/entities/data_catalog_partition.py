@@ -0,0 +1,40 @@
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class DataCatalogPartition:
+    """
+    Represents a single-column (e.g. event_date or execution_date) partition of a data catalog
+    table.
+
+    Attributes:
+        database (str): The name of the data catalog database.
+        table (str): The name of the table.
+        partition_col (str): The name of the partition column.
+        partition_value (str): The value of the partition, e.g. "2025-10-15".
+        compacted_at (Optional[str]): When the partition was last compacted (ISO 8601), as listed
+            from the data catalog. None when it was never compacted (or wasn't listed).
+    """
+
+    database: str
+    table: str
+    partition_col: str
+    partition_value: str
+    compacted_at: Optional[str] = None
+
+    @property
+    def partition_dir(self) -> str:
+        """
+        The Hive style directory name of the partition, e.g. "event_date=2025-10-15".
+        """
+        return f"{self.partition_col}={self.partition_value}"
+
+    def to_dict(self) -> dict:
+        """
+        Converts the partition to a dictionary.
+
+        Returns:
+            A dictionary representation of the partition.
+        """
+        return asdict(self)
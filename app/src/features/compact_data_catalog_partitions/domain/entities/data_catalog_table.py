@@ -0,0 +1,27 @@
+from dataclasses import dataclass, asdict
+
+
+@dataclass(frozen=True)
+class DataCatalogTable:
+    """
+    Represents a data catalog table partitioned by a single (date) column, whose partitions are
+    compacted on scheduled runs.
+
+    Attributes:
+        database (str): The name of the data catalog database.
+        table (str): The name of the table.
+        partition_col (str): The name of the partition column, e.g. "event_date".
+    """
+
+    database: str
+    table: str
+    partition_col: str
+
+    def to_dict(self) -> dict:
+        """
+        Converts the table to a dictionary.
+
+        Returns:
+            A dictionary representation of the table.
+        """
+        return asdict(self)
@@ -0,0 +1,47 @@
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_partition import (
+    DataCatalogPartition
+)
+
+
+@dataclass(frozen=True)
+class PartitionCompactionReport:
+    """
+    Represents the result of the compaction of a partition.
+
+    Attributes:
+        partition (DataCatalogPartition): The compacted partition.
+        status (str): "compacted" or the reason the partition was skipped ("not_found", "empty",
+            "open_partition" or "already_compacted").
+        files_before (int): The number of data files before the compaction.
+        bytes_before (int): The size of the data files before the compaction.
+        files_after (int): The number of data files after the compaction.
+        bytes_after (int): The size of the data files after the compaction.
+        rows (int): The number of rows rewritten.
+        late_files (int): The number of files appended to the original location of the partition
+            after a previous compaction (invisible until they are compacted).
+        source_location (Optional[str]): The location of the partition before the compaction.
+        target_location (Optional[str]): The location of the partition after the compaction.
+    """
+
+    partition: DataCatalogPartition
+    status: str
+    files_before: int = 0
+    bytes_before: int = 0
+    files_after: int = 0
+    bytes_after: int = 0
+    rows: int = 0
+    late_files: int = 0
+    source_location: Optional[str] = None
+    target_location: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """
+        Converts the compaction report to a dictionary.
+
+        Returns:
+            A dictionary representation of the compaction report.
+        """
+        return asdict(self)
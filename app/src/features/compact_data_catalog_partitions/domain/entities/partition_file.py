@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+
+# Extensions of the data files handled by the compaction (JSON lines written by the CDC sink and
+# Parquet written by the SoR sink and by the compaction itself)
+JSON_FILE_EXTENSIONS = (".json", ".jsonl", ".json.gz", ".jsonl.gz")
+PARQUET_FILE_EXTENSIONS = (".parquet",)
+
+
+@dataclass(frozen=True)
+class PartitionFile:
+    """
+    Represents a data file stored on the location of a partition.
+
+    Attributes:
+        path (str): The full path of the file (an S3 URI or a local filesystem path).
+        size_bytes (int): The size of the file in bytes.
+    """
+
+    path: str
+    size_bytes: int
+
+    @property
+    def is_parquet(self) -> bool:
+        """
+        Whether the file is a Parquet file.
+        """
+        return self.path.endswith(PARQUET_FILE_EXTENSIONS)
+
+    @property
+    def is_json(self) -> bool:
+        """
+        Whether the file is a JSON lines file.
+        """
+        return self.path.endswith(JSON_FILE_EXTENSIONS)
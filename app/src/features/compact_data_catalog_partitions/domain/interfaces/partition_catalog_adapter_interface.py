@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_partition import (
+    DataCatalogPartition
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_table import (
+    DataCatalogTable
+)
+
+
+class IPartitionCatalogAdapter(ABC):
+    """
+    Interface for reading and updating the partitions of a data catalog.
+    """
+
+    @abstractmethod
+    def list_partitions(self, table: DataCatalogTable) -> list[DataCatalogPartition]:
+        """
+        Lists the partitions of a table.
+
+        Args:
+            table (DataCatalogTable): The table.
+
+        Returns:
+            list[DataCatalogPartition]: The partitions of the table, with the time of their last
+                compaction.
+        """
+
+
+    @abstractmethod
+    def get_partition_location(self, partition: DataCatalogPartition) -> Optional[str]:
+        """
+        Gets the storage location of a partition.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            Optional[str]: The location of the partition, or None when it doesn't exist.
+        """
+
+
+    @abstractmethod
+    def get_column_types(self, partition: DataCatalogPartition) -> dict[str, str]:
+        """
+        Gets the column types of the table of a partition.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            dict[str, str]: The catalog (Hive) type of each column, e.g. {"size_bytes": "bigint"}.
+        """
+
+
+    @abstractmethod
+    def swap_partition_location(self, partition: DataCatalogPartition, location: str) -> None:
+        """
+        Points a partition to a new location holding Parquet files, in a single atomic update.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+            location (str): The new location of the partition.
+        """
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+
+import pyarrow as pa
+
+from app.src.features.compact_data_catalog_partitions.domain.entities.partition_file import PartitionFile
+
+
+class IPartitionStorageAdapter(ABC):
+    """
+    Interface for reading and writing the data files of partitions.
+    """
+
+    @abstractmethod
+    def list_files(self, location: str) -> list[PartitionFile]:
+        """
+        Lists the data files (JSON lines and Parquet) stored on a location.
+
+        Args:
+            location (str): The location of the partition.
+
+        Returns:
+            list[PartitionFile]: The data files of the location.
+        """
+
+
+    @abstractmethod
+    def read_files(
+        self,
+        files: list[PartitionFile],
+        column_types: dict[str, str],
+        partition_col: str
+    ) -> pa.Table:
+        """
+        Reads data files into a single Arrow table, conformed to the catalog column types.
+
+        Args:
+            files (list[PartitionFile]): The data files to read.
+            column_types (dict[str, str]): The catalog (Hive) type of each column.
+            partition_col (str): The name of the partition column, dropped from the rows.
+
+        Returns:
+            pa.Table: The rows of all files.
+        """
+
+
+    @abstractmethod
+    def write_parquet_file(self, table: pa.Table, path: str) -> PartitionFile:
+        """
+        Writes an Arrow table to a Snappy compressed Parquet file, keeping its schema.
+
+        Args:
+            table (pa.Table): The rows to write.
+            path (str): The full path of the file.
+
+        Returns:
+            PartitionFile: The written file.
+        """
+
+
+    @abstractmethod
+    def delete_files(self, files: list[PartitionFile]) -> None:
+        """
+        Deletes data files.
+
+        Args:
+            files (list[PartitionFile]): The files to delete.
+        """
@@ -0,0 +1,177 @@
+import copy
+from typing import Optional
+
+import boto3
+
+from app.src.features.compact_data_catalog_partitions.domain.interfaces.partition_catalog_adapter_interface import (
+    IPartitionCatalogAdapter
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_partition import (
+    DataCatalogPartition
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_table import (
+    DataCatalogTable
+)
+from app.src.features.cross.utils.log import LogUtils
+from app.src.features.cross.utils.date_and_time import DateAndTimeUtils
+from app.src.features.cross.value_objects import Timezone
+
+
+# Storage settings of Parquet partitions (the same used by the SoR tables)
+PARQUET_INPUT_FORMAT = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat"
+PARQUET_OUTPUT_FORMAT = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat"
+PARQUET_SERDE_INFO = {
+    "SerializationLibrary": "org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe",
+    "Parameters": {"serialization.format": "1"}
+}
+
+
+class GluePartitionCatalogAdapter(IPartitionCatalogAdapter):
+    """
+    Implementation of IPartitionCatalogAdapter using the AWS Glue Data Catalog.
+    """
+
+    def __init__(self):
+        self.logger = LogUtils.setup_logger(name=__name__)
+        self.glue_client = boto3.client("glue")
+        self.column_types: dict[tuple[str, str], dict[str, str]] = {}
+
+
+    def __get_partition(self, partition: DataCatalogPartition) -> Optional[dict]:
+        """
+        Gets a partition from the Glue Data Catalog.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            Optional[dict]: The Glue partition, or None when it doesn't exist.
+        """
+        try:
+            return self.glue_client.get_partition(
+                DatabaseName=partition.database,
+                TableName=partition.table,
+                PartitionValues=[partition.partition_value]
+            )["Partition"]
+
+        except self.glue_client.exceptions.EntityNotFoundException:
+            return None
+
+
+    def list_partitions(self, table: DataCatalogTable) -> list[DataCatalogPartition]:
+        """
+        Lists the partitions of a table from the Glue Data Catalog (without their column schemas).
+
+        Args:
+            table (DataCatalogTable): The table.
+
+        Returns:
+            list[DataCatalogPartition]: The partitions of the table, with the compacted_at
+                parameter set by the compaction.
+        """
+        partitions = []
+        paginator = self.glue_client.get_paginator("get_partitions")
+        for page in paginator.paginate(
+            DatabaseName=table.database,
+            TableName=table.table,
+            ExcludeColumnSchema=True
+        ):
+            for glue_partition in page.get("Partitions", []):
+                partitions.append(
+                    DataCatalogPartition(
+                        database=table.database,
+                        table=table.table,
+                        partition_col=table.partition_col,
+                        partition_value=glue_partition["Values"][0],
+                        compacted_at=glue_partition.get("Parameters", {}).get("compacted_at")
+                    )
+                )
+
+        return partitions
+
+
+    def get_partition_location(self, partition: DataCatalogPartition) -> Optional[str]:
+        """
+        Gets the storage location of a partition.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            Optional[str]: The location of the partition, or None when it doesn't exist.
+        """
+        glue_partition = self.__get_partition(partition)
+        if glue_partition is None:
+            return None
+
+        return glue_partition["StorageDescriptor"]["Location"]
+
+
+    def get_column_types(self, partition: DataCatalogPartition) -> dict[str, str]:
+        """
+        Gets the column types of the table of a partition (memoized by table).
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            dict[str, str]: The catalog (Hive) type of each column, e.g. {"size_bytes": "bigint"}.
+        """
+        table_key = (partition.database, partition.table)
+        if table_key not in self.column_types:
+            table = self.glue_client.get_table(
+                DatabaseName=partition.database,
+                Name=partition.table
+            )["Table"]
+            self.column_types[table_key] = {
+                column["Name"]: column["Type"] for column in table["StorageDescriptor"]["Columns"]
+            }
+
+        return self.column_types[table_key]
+
+
+    def swap_partition_location(self, partition: DataCatalogPartition, location: str) -> None:
+        """
+        Points a partition to a new location holding Parquet files with a single UpdatePartition
+        call, so queries see either all the original files or all the compacted ones.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+            location (str): The new location of the partition.
+        """
+        glue_partition = self.__get_partition(partition)
+        if glue_partition is None:
+            raise ValueError(f"Partition {partition.partition_dir} of table {partition.database}."
+                             f"{partition.table} doesn't exist")
+
+        storage_descriptor = copy.deepcopy(glue_partition["StorageDescriptor"])
+        storage_descriptor.update(
+            Location=location,
+            InputFormat=PARQUET_INPUT_FORMAT,
+            OutputFormat=PARQUET_OUTPUT_FORMAT,
+            SerdeInfo=copy.deepcopy(PARQUET_SERDE_INFO),
+            Compressed=True
+        )
+
+        compacted_at = DateAndTimeUtils.now(output_type="datetime", timezone=Timezone.SAO_PAULO)
+        try:
+            self.glue_client.update_partition(
+                DatabaseName=partition.database,
+                TableName=partition.table,
+                PartitionValueList=[partition.partition_value],
+                PartitionInput={
+                    "Values": glue_partition["Values"],
+                    "StorageDescriptor": storage_descriptor,
+                    "Parameters": {
+                        **glue_partition.get("Parameters", {}),
+                        "classification": "parquet",
+                        "compressionType": "snappy",
+                        "compacted_at": compacted_at.isoformat()
+                    }
+                }
+            )
+
+        except Exception:
+            self.logger.exception(f"Error swapping the location of partition {partition.partition_dir} "
+                                  f"of table {partition.database}.{partition.table}")
+            raise
@@ -0,0 +1,148 @@
+import os
+import json
+import tempfile
+from typing import Optional
+
+from app.src.features.compact_data_catalog_partitions.domain.interfaces.partition_catalog_adapter_interface import (
+    IPartitionCatalogAdapter
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_partition import (
+    DataCatalogPartition
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_table import (
+    DataCatalogTable
+)
+from app.src.features.cross.utils.log import LogUtils
+from app.src.features.cross.utils.date_and_time import DateAndTimeUtils
+from app.src.features.cross.value_objects import Timezone
+
+
+# Name of the manifest file kept on the base path
+MANIFEST_FILE_NAME = "_catalog_manifest.json"
+
+
+class LocalManifestPartitionCatalogAdapter(IPartitionCatalogAdapter):
+    """
+    Implementation of IPartitionCatalogAdapter over a JSON manifest on the local filesystem, used
+    to run (and test) the compaction without AWS.
+
+    Tables are expected at <base_path>/<table>/<partition_col>=<value>/ (the layout written by the
+    CDC and SoR sinks). The manifest records the column types of each table (optional) and the
+    partitions whose location was swapped (and when), and is replaced atomically (os.replace) on
+    each swap.
+
+    Args:
+        base_path (str): The local directory holding the tables.
+    """
+
+    def __init__(self, base_path: str):
+        self.logger = LogUtils.setup_logger(name=__name__)
+        self.base_path = os.path.abspath(base_path)
+        self.manifest_path = os.path.join(self.base_path, MANIFEST_FILE_NAME)
+
+
+    def __read_manifest(self) -> dict:
+        """
+        Reads the manifest, returning an empty one when it doesn't exist.
+
+        Returns:
+            dict: The tables of the manifest keyed by "<database>.<table>".
+        """
+        if not os.path.exists(self.manifest_path):
+            return {}
+
+        with open(self.manifest_path, "r", encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+
+
+    def list_partitions(self, table: DataCatalogTable) -> list[DataCatalogPartition]:
+        """
+        Lists the partitions of a table: the partition directories of the table plus the
+        partitions swapped on the manifest.
+
+        Args:
+            table (DataCatalogTable): The table.
+
+        Returns:
+            list[DataCatalogPartition]: The partitions of the table, with the time of their last
+                compaction recorded on the manifest.
+        """
+        table_manifest = self.__read_manifest().get(f"{table.database}.{table.table}", {})
+        partition_dirs = set(table_manifest.get("partitions", {}))
+
+        table_path = os.path.join(self.base_path, table.table)
+        if os.path.isdir(table_path):
+            with os.scandir(table_path) as entries:
+                partition_dirs.update(
+                    entry.name for entry in entries
+                    if entry.is_dir() and entry.name.startswith(f"{table.partition_col}=")
+                )
+
+        compacted_at = table_manifest.get("compacted_at", {})
+        return [
+            DataCatalogPartition(
+                database=table.database,
+                table=table.table,
+                partition_col=table.partition_col,
+                partition_value=partition_dir.split("=", 1)[1],
+                compacted_at=compacted_at.get(partition_dir)
+            )
+            for partition_dir in sorted(partition_dirs)
+        ]
+
+
+    def get_partition_location(self, partition: DataCatalogPartition) -> Optional[str]:
+        """
+        Gets the storage location of a partition.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            Optional[str]: The location of the partition, or None when it doesn't exist.
+        """
+        table_manifest = self.__read_manifest().get(f"{partition.database}.{partition.table}", {})
+        location = table_manifest.get("partitions", {}).get(partition.partition_dir)
+        if location is not None:
+            return location
+
+        location = os.path.join(self.base_path, partition.table, partition.partition_dir)
+        return location if os.path.isdir(location) else None
+
+
+    def get_column_types(self, partition: DataCatalogPartition) -> dict[str, str]:
+        """
+        Gets the column types of the table of a partition.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            dict[str, str]: The column types recorded on the manifest (empty when not recorded).
+        """
+        table_manifest = self.__read_manifest().get(f"{partition.database}.{partition.table}", {})
+        return table_manifest.get("columns", {})
+
+
+    def swap_partition_location(self, partition: DataCatalogPartition, location: str) -> None:
+        """
+        Points a partition to a new location by atomically replacing the manifest.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+            location (str): The new location of the partition.
+        """
+        manifest = self.__read_manifest()
+        table_manifest = manifest.setdefault(f"{partition.database}.{partition.table}", {})
+        table_manifest.setdefault("partitions", {})[partition.partition_dir] = location
+        table_manifest.setdefault("compacted_at", {})[partition.partition_dir] = DateAndTimeUtils.now(
+            output_type="datetime",
+            timezone=Timezone.SAO_PAULO
+        ).isoformat()
+
+        os.makedirs(self.base_path, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self.base_path, suffix=".tmp", delete=False,
+                                         encoding="utf-8") as tmp_file:
+            json.dump(manifest, tmp_file, indent=2)
+
+        os.replace(tmp_file.name, self.manifest_path)
@@ -0,0 +1,129 @@
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.src.features.compact_data_catalog_partitions.domain.interfaces.partition_storage_adapter_interface import (
+    IPartitionStorageAdapter
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.partition_file import PartitionFile
+from app.src.features.compact_data_catalog_partitions.infra.mappers.catalog_schema_mapper import (
+    CatalogSchemaMapper
+)
+from app.src.features.cross.utils.log import LogUtils
+
+
+class LocalPartitionStorageAdapter(IPartitionStorageAdapter):
+    """
+    Implementation of IPartitionStorageAdapter over the local filesystem, used to run (and test)
+    the compaction against a copy of the datasets.
+    """
+
+    def __init__(self):
+        self.logger = LogUtils.setup_logger(name=__name__)
+
+
+    def list_files(self, location: str) -> list[PartitionFile]:
+        """
+        Lists the data files (JSON lines and Parquet) stored on a directory.
+
+        Args:
+            location (str): The directory of the partition.
+
+        Returns:
+            list[PartitionFile]: The data files of the directory.
+        """
+        if not os.path.isdir(location):
+            return []
+
+        files = []
+        with os.scandir(location) as entries:
+            for entry in entries:
+                # Hidden and underscore prefixed entries (e.g. _SUCCESS) are not data files
+                if not entry.is_file() or entry.name.startswith(("_", ".")):
+                    continue
+
+                partition_file = PartitionFile(path=entry.path, size_bytes=entry.stat().st_size)
+                if partition_file.is_json or partition_file.is_parquet:
+                    files.append(partition_file)
+
+        return sorted(files, key=lambda partition_file: partition_file.path)
+
+
+    def read_files(
+        self,
+        files: list[PartitionFile],
+        column_types: dict[str, str],
+        partition_col: str
+    ) -> pa.Table:
+        """
+        Reads data files into a single Arrow table, conformed to the catalog column types.
+
+        Parquet files are read as Arrow tables (keeping their nested types) and only the JSON
+        lines files go through pandas.
+
+        Args:
+            files (list[PartitionFile]): The data files to read.
+            column_types (dict[str, str]): The catalog (Hive) type of each column.
+            partition_col (str): The name of the partition column, dropped from the rows.
+
+        Returns:
+            pa.Table: The rows of all files.
+        """
+        schema = CatalogSchemaMapper.build_schema(column_types, partition_col=partition_col)
+
+        tables = [
+            CatalogSchemaMapper.map_table(
+                pq.read_table(partition_file.path),
+                schema=schema,
+                partition_col=partition_col
+            )
+            for partition_file in files if partition_file.is_parquet
+        ]
+
+        json_schema = CatalogSchemaMapper.unify_schema(schema, tables)
+        for partition_file in files:
+            if partition_file.is_json:
+                tables.append(
+                    CatalogSchemaMapper.map_json_frame(
+                        pd.read_json(partition_file.path, lines=True, dtype=False, convert_dates=False),
+                        column_types=column_types,
+                        schema=json_schema,
+                        partition_col=partition_col
+                    )
+                )
+
+        return CatalogSchemaMapper.concat_tables(tables)
+
+
+    def write_parquet_file(self, table: pa.Table, path: str) -> PartitionFile:
+        """
+        Writes an Arrow table to a Snappy compressed Parquet file, keeping its schema.
+
+        Args:
+            table (pa.Table): The rows to write.
+            path (str): The full path of the file.
+
+        Returns:
+            PartitionFile: The written file.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pq.write_table(table, path, compression="snappy")
+
+        return PartitionFile(path=path, size_bytes=os.path.getsize(path))
+
+
+    def delete_files(self, files: list[PartitionFile]) -> None:
+        """
+        Deletes data files, removing the directories left empty.
+
+        Args:
+            files (list[PartitionFile]): The files to delete.
+        """
+        for partition_file in files:
+            os.remove(partition_file.path)
+
+        for directory in {os.path.dirname(partition_file.path) for partition_file in files}:
+            if os.path.isdir(directory) and not os.listdir(directory):
+                os.rmdir(directory)
@@ -0,0 +1,154 @@
+from urllib.parse import urlparse
+
+import boto3
+import awswrangler as wr
+import pyarrow as pa
+import pyarrow.fs
+import pyarrow.parquet as pq
+
+from app.src.features.compact_data_catalog_partitions.domain.interfaces.partition_storage_adapter_interface import (
+    IPartitionStorageAdapter
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.partition_file import PartitionFile
+from app.src.features.compact_data_catalog_partitions.infra.mappers.catalog_schema_mapper import (
+    CatalogSchemaMapper
+)
+from app.src.features.cross.utils.log import LogUtils
+
+
+class S3PartitionStorageAdapter(IPartitionStorageAdapter):
+    """
+    Implementation of IPartitionStorageAdapter for partitions stored in S3. Parquet files are
+    read and written as Arrow tables (pyarrow S3 filesystem) and the JSON lines files are read
+    with AWS Wrangler.
+    """
+
+    def __init__(self):
+        self.logger = LogUtils.setup_logger(name=__name__)
+        self.s3_client = boto3.client("s3")
+        self.s3_filesystem = pyarrow.fs.S3FileSystem(region=boto3.session.Session().region_name)
+
+
+    def list_files(self, location: str) -> list[PartitionFile]:
+        """
+        Lists the data files (JSON lines and Parquet) stored directly under an S3 prefix.
+
+        Args:
+            location (str): The S3 URI of the partition.
+
+        Returns:
+            list[PartitionFile]: The data files of the location.
+        """
+        parsed_location = urlparse(location)
+        bucket_name = parsed_location.netloc
+        prefix = parsed_location.path.lstrip("/").rstrip("/") + "/"
+
+        files = []
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter="/"):
+            for s3_object in page.get("Contents", []):
+                # Hidden and underscore prefixed objects (e.g. _SUCCESS) are not data files
+                if s3_object["Key"].rsplit("/", 1)[-1].startswith(("_", ".")):
+                    continue
+
+                partition_file = PartitionFile(
+                    path=f"s3://{bucket_name}/{s3_object['Key']}",
+                    size_bytes=s3_object["Size"]
+                )
+                if partition_file.is_json or partition_file.is_parquet:
+                    files.append(partition_file)
+
+        return sorted(files, key=lambda partition_file: partition_file.path)
+
+
+    @staticmethod
+    def __to_filesystem_path(path: str) -> str:
+        """
+        Converts an S3 URI to a path of the pyarrow S3 filesystem.
+
+        Args:
+            path (str): The S3 URI, e.g. s3://bucket/key.
+
+        Returns:
+            str: The filesystem path, e.g. bucket/key.
+        """
+        parsed_path = urlparse(path)
+        return f"{parsed_path.netloc}/{parsed_path.path.lstrip('/')}"
+
+
+    def read_files(
+        self,
+        files: list[PartitionFile],
+        column_types: dict[str, str],
+        partition_col: str
+    ) -> pa.Table:
+        """
+        Reads data files into a single Arrow table, conformed to the catalog column types.
+
+        Parquet files are read as Arrow tables (keeping their nested types) and only the JSON
+        lines files go through pandas.
+
+        Args:
+            files (list[PartitionFile]): The data files to read.
+            column_types (dict[str, str]): The catalog (Hive) type of each column.
+            partition_col (str): The name of the partition column, dropped from the rows.
+
+        Returns:
+            pa.Table: The rows of all files.
+        """
+        schema = CatalogSchemaMapper.build_schema(column_types, partition_col=partition_col)
+
+        tables = [
+            CatalogSchemaMapper.map_table(
+                pq.read_table(
+                    self.__to_filesystem_path(partition_file.path),
+                    filesystem=self.s3_filesystem
+                ),
+                schema=schema,
+                partition_col=partition_col
+            )
+            for partition_file in files if partition_file.is_parquet
+        ]
+
+        json_paths = [partition_file.path for partition_file in files if partition_file.is_json]
+        if json_paths:
+            tables.append(
+                CatalogSchemaMapper.map_json_frame(
+                    wr.s3.read_json(path=json_paths, lines=True, dtype=False, convert_dates=False),
+                    column_types=column_types,
+                    schema=CatalogSchemaMapper.unify_schema(schema, tables),
+                    partition_col=partition_col
+                )
+            )
+
+        return CatalogSchemaMapper.concat_tables(tables)
+
+
+    def write_parquet_file(self, table: pa.Table, path: str) -> PartitionFile:
+        """
+        Writes an Arrow table to a Snappy compressed Parquet file, keeping its schema.
+
+        Args:
+            table (pa.Table): The rows to write.
+            path (str): The S3 URI of the file.
+
+        Returns:
+            PartitionFile: The written file.
+        """
+        filesystem_path = self.__to_filesystem_path(path)
+        pq.write_table(table, filesystem_path, filesystem=self.s3_filesystem, compression="snappy")
+
+        return PartitionFile(
+            path=path,
+            size_bytes=self.s3_filesystem.get_file_info(filesystem_path).size
+        )
+
+
+    def delete_files(self, files: list[PartitionFile]) -> None:
+        """
+        Deletes data files.
+
+        Args:
+            files (list[PartitionFile]): The files to delete.
+        """
+        wr.s3.delete_objects(path=[partition_file.path for partition_file in files])
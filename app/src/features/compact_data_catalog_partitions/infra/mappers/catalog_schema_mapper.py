@@ -0,0 +1,367 @@
+import json
+from typing import Any, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+
+# Catalog (Hive) types mapped to the pandas dtypes used on the legacy JSON lines files
+INTEGER_TYPES = ("tinyint", "smallint", "int", "integer", "bigint")
+FLOAT_TYPES = ("float", "double")
+
+# Catalog (Hive) primitive types mapped to the Arrow types of the rewritten Parquet files. The
+# timestamps follow the ones written by the CDC and SoR sinks.
+ARROW_PRIMITIVE_TYPES = {
+    "string": pa.string(),
+    "varchar": pa.string(),
+    "char": pa.string(),
+    "tinyint": pa.int8(),
+    "smallint": pa.int16(),
+    "int": pa.int32(),
+    "integer": pa.int32(),
+    "bigint": pa.int64(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "boolean": pa.bool_(),
+    "binary": pa.binary(),
+    "date": pa.date32(),
+    "timestamp": pa.timestamp("ms", tz="UTC")
+}
+
+
+class CatalogSchemaMapper:
+    """
+    Conforms the rows read from the data files of a partition to the column types of its table.
+
+    Parquet files are kept as Arrow tables and cast to an Arrow schema built from the catalog
+    types, so nested (struct, map and array) columns are rewritten with the exact types declared
+    on the table. JSON lines files carry no schema (timestamps are written as epoch milliseconds
+    and maps as nested objects), so their rows are first coerced with pandas and then converted
+    to the same Arrow schema, which keeps the compacted partitions readable with the table schema.
+    """
+
+    @staticmethod
+    def __split_type_args(type_args: str) -> list[str]:
+        """
+        Splits the arguments of a nested catalog type on its top level commas.
+
+        Args:
+            type_args (str): The arguments, e.g. "a:string,b:map<string,string>".
+
+        Returns:
+            list[str]: The arguments, e.g. ["a:string", "b:map<string,string>"].
+        """
+        args, depth, start = [], 0, 0
+        for idx, char in enumerate(type_args):
+            if char in "<(":
+                depth += 1
+            elif char in ">)":
+                depth -= 1
+            elif char == "," and depth == 0:
+                args.append(type_args[start:idx].strip())
+                start = idx + 1
+
+        args.append(type_args[start:].strip())
+        return args
+
+
+    @staticmethod
+    def to_arrow_type(catalog_type: str) -> pa.DataType:
+        """
+        Maps a catalog (Hive) type to an Arrow type.
+
+        Args:
+            catalog_type (str): The catalog type, e.g. "struct<code:string,tags:map<string,string>>".
+
+        Returns:
+            pa.DataType: The Arrow type (string for unknown types).
+        """
+        catalog_type = catalog_type.strip().lower()
+
+        if catalog_type.startswith("struct<"):
+            fields = []
+            for field_def in CatalogSchemaMapper.__split_type_args(catalog_type[len("struct<"):-1]):
+                name, field_type = field_def.split(":", 1)
+                fields.append(pa.field(name.strip(), CatalogSchemaMapper.to_arrow_type(field_type)))
+            return pa.struct(fields)
+
+        if catalog_type.startswith("map<"):
+            key_type, item_type = CatalogSchemaMapper.__split_type_args(catalog_type[len("map<"):-1])
+            return pa.map_(
+                CatalogSchemaMapper.to_arrow_type(key_type),
+                CatalogSchemaMapper.to_arrow_type(item_type)
+            )
+
+        if catalog_type.startswith("array<"):
+            return pa.list_(CatalogSchemaMapper.to_arrow_type(catalog_type[len("array<"):-1]))
+
+        if catalog_type.startswith("decimal"):
+            # Hive decimals default to decimal(10,0)
+            type_args = catalog_type[len("decimal("):-1].split(",") if "(" in catalog_type else ["10"]
+            return pa.decimal128(int(type_args[0]), int(type_args[1]) if len(type_args) > 1 else 0)
+
+        return ARROW_PRIMITIVE_TYPES.get(catalog_type.split("(", 1)[0], pa.string())
+
+
+    @staticmethod
+    def build_schema(column_types: dict[str, str], partition_col: str) -> Optional[pa.Schema]:
+        """
+        Builds the Arrow schema of the data files of a table from its catalog column types.
+
+        Args:
+            column_types (dict[str, str]): The catalog (Hive) type of each column.
+            partition_col (str): The name of the partition column (not stored on the files).
+
+        Returns:
+            Optional[pa.Schema]: The schema, or None when there are no catalog types.
+        """
+        if not column_types:
+            return None
+
+        return pa.schema([
+            (column, CatalogSchemaMapper.to_arrow_type(column_type))
+            for column, column_type in column_types.items()
+            if column != partition_col
+        ])
+
+
+    @staticmethod
+    def unify_schema(schema: Optional[pa.Schema], tables: list[pa.Table]) -> Optional[pa.Schema]:
+        """
+        Gets the schema the JSON lines files of a partition are converted to: the catalog schema
+        or, when there are no catalog types, the unified schema of its Parquet files.
+
+        Args:
+            schema (Optional[pa.Schema]): The catalog schema.
+            tables (list[pa.Table]): The conformed tables of the Parquet files of the partition.
+
+        Returns:
+            Optional[pa.Schema]: The schema (None when there is neither).
+        """
+        if schema is not None or not tables:
+            return schema
+
+        return pa.unify_schemas([table.schema for table in tables], promote_options="permissive")
+
+
+    @staticmethod
+    def __to_catalog_type(arrow_type: pa.DataType) -> str:
+        """
+        Maps an Arrow type to the catalog (Hive) type family used to coerce JSON lines values.
+
+        Args:
+            arrow_type (pa.DataType): The Arrow type.
+
+        Returns:
+            str: The catalog type family, e.g. "struct" or "bigint".
+        """
+        if pa.types.is_struct(arrow_type):
+            return "struct"
+        if pa.types.is_map(arrow_type):
+            return "map"
+        if pa.types.is_list(arrow_type):
+            return "array"
+        if pa.types.is_timestamp(arrow_type):
+            return "timestamp"
+        if pa.types.is_integer(arrow_type):
+            return "bigint"
+        if pa.types.is_floating(arrow_type):
+            return "double"
+        if pa.types.is_boolean(arrow_type):
+            return "boolean"
+        return "string"
+
+
+    @staticmethod
+    def __cast_column(column: pa.ChunkedArray, arrow_type: pa.DataType) -> pa.ChunkedArray:
+        """
+        Casts a column to an Arrow type, rebuilding it from python values when Arrow has no cast
+        between the types (e.g. inferred structs holding map values).
+
+        Args:
+            column (pa.ChunkedArray): The column.
+            arrow_type (pa.DataType): The target type.
+
+        Returns:
+            pa.ChunkedArray: The cast column.
+        """
+        if column.type == arrow_type:
+            return column
+
+        try:
+            # Timestamps are truncated to the unit of the catalog schema (e.g. ns to ms)
+            return column.cast(arrow_type, safe=not pa.types.is_timestamp(arrow_type))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            return pa.chunked_array([pa.array(column.to_pylist(), type=arrow_type)], type=arrow_type)
+
+
+    @staticmethod
+    def map_table(table: pa.Table, schema: Optional[pa.Schema], partition_col: str) -> pa.Table:
+        """
+        Casts the columns of an Arrow table (read from a Parquet file) to the catalog schema.
+
+        The catalog columns come first, in the catalog order (missing ones are filled with nulls),
+        followed by the columns not described by the catalog as they were read. The partition
+        column is dropped, as its value lives on the partition location.
+
+        Args:
+            table (pa.Table): The rows read from a data file.
+            schema (Optional[pa.Schema]): The catalog schema (the table is kept when None).
+            partition_col (str): The name of the partition column.
+
+        Returns:
+            pa.Table: The conformed rows.
+        """
+        if partition_col in table.column_names:
+            table = table.drop_columns([partition_col])
+
+        if schema is None:
+            return table
+
+        fields = list(schema)
+        columns = [
+            CatalogSchemaMapper.__cast_column(table.column(field.name), field.type)
+            if field.name in table.column_names else pa.nulls(table.num_rows, type=field.type)
+            for field in fields
+        ]
+        for field in table.schema:
+            if field.name not in schema.names:
+                fields.append(field)
+                columns.append(table.column(field.name))
+
+        return pa.Table.from_arrays(columns, schema=pa.schema(fields))
+
+
+    @staticmethod
+    def map_json_frame(
+        df: pd.DataFrame,
+        column_types: dict[str, str],
+        schema: Optional[pa.Schema],
+        partition_col: str
+    ) -> pa.Table:
+        """
+        Converts the rows read from a (legacy) JSON lines file to an Arrow table with the given
+        schema, coercing the values with pandas first.
+
+        Args:
+            df (pd.DataFrame): The rows read from the data file.
+            column_types (dict[str, str]): The catalog (Hive) type of each column.
+            schema (Optional[pa.Schema]): The catalog schema, or the schema of the Parquet files of
+                the partition (types are inferred when None).
+            partition_col (str): The name of the partition column.
+
+        Returns:
+            pa.Table: The conformed rows.
+        """
+        if schema is None:
+            df = CatalogSchemaMapper.map(df, column_types=column_types, partition_col=partition_col)
+            return pa.Table.from_pandas(df, preserve_index=False)
+
+        # Columns typed by the schema (and not by the catalog) keep their nested values
+        column_types = {
+            **{field.name: CatalogSchemaMapper.__to_catalog_type(field.type) for field in schema},
+            **column_types
+        }
+        df = CatalogSchemaMapper.map(df, column_types=column_types, partition_col=partition_col)
+
+        table = pa.Table.from_arrays(
+            [
+                pa.array(df[column], type=schema.field(column).type, from_pandas=True)
+                if column in schema.names else pa.array(df[column], from_pandas=True)
+                for column in df.columns
+            ],
+            names=list(df.columns)
+        )
+        return CatalogSchemaMapper.map_table(table, schema=schema, partition_col=partition_col)
+
+
+    @staticmethod
+    def concat_tables(tables: list[pa.Table]) -> pa.Table:
+        """
+        Concatenates the conformed tables of the files of a partition, unifying the columns not
+        described by the catalog.
+
+        Args:
+            tables (list[pa.Table]): The conformed tables.
+
+        Returns:
+            pa.Table: The rows of all files (an empty table when there are none).
+        """
+        if not tables:
+            return pa.table({})
+
+        return pa.concat_tables(tables, promote_options="permissive")
+
+    @staticmethod
+    def __to_json_string(value: Any) -> Optional[str]:
+        """
+        Converts nested values (dicts and lists) to JSON strings, keeping the other values.
+
+        Args:
+            value (Any): The value to convert.
+
+        Returns:
+            Optional[str]: The string value.
+        """
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False, default=str)
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return None
+        return str(value)
+
+
+    @staticmethod
+    def __to_timestamp(series: pd.Series) -> pd.Series:
+        """
+        Converts a column to UTC timestamps.
+
+        Args:
+            series (pd.Series): Epoch milliseconds (JSON lines), ISO 8601 strings or timestamps.
+
+        Returns:
+            pd.Series: The timestamps.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series if series.dt.tz is not None else series.dt.tz_localize("UTC")
+        if pd.api.types.is_numeric_dtype(series):
+            return pd.to_datetime(series, unit="ms", utc=True)
+        return pd.to_datetime(series, utc=True, format="ISO8601")
+
+
+    @staticmethod
+    def map(df: pd.DataFrame, column_types: dict[str, str], partition_col: str) -> pd.DataFrame:
+        """
+        Casts the columns of a DataFrame (read from a JSON lines file) to the catalog column types.
+
+        Columns not described by the catalog are kept, with nested values converted to JSON
+        strings. The partition column is dropped, as its value lives on the partition location.
+
+        Args:
+            df (pd.DataFrame): The rows read from the data files.
+            column_types (dict[str, str]): The catalog (Hive) type of each column.
+            partition_col (str): The name of the partition column.
+
+        Returns:
+            pd.DataFrame: The conformed rows.
+        """
+        df = df.drop(columns=[partition_col], errors="ignore")
+
+        for column in df.columns:
+            column_type = column_types.get(column, "").lower()
+
+            if column_type in INTEGER_TYPES:
+                df[column] = pd.to_numeric(df[column], errors="coerce").astype("Int64")
+            elif column_type in FLOAT_TYPES or column_type.startswith("decimal"):
+                df[column] = pd.to_numeric(df[column], errors="coerce").astype("float64")
+            elif column_type == "boolean":
+                df[column] = df[column].astype("boolean")
+            elif column_type == "timestamp":
+                df[column] = CatalogSchemaMapper.__to_timestamp(df[column])
+            elif column_type == "date":
+                df[column] = pd.to_datetime(df[column], errors="coerce").dt.date
+            elif column_type.startswith(("array", "struct", "map")):
+                continue
+            elif column_type == "string" or df[column].dtype == object:
+                df[column] = df[column].map(CatalogSchemaMapper.__to_json_string).astype(object)
+
+        return df
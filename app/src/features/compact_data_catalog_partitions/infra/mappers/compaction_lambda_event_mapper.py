@@ -0,0 +1,74 @@
+import os
+import json
+from typing import Any, Optional
+
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_partition import (
+    DataCatalogPartition
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_table import (
+    DataCatalogTable
+)
+
+
+class CompactionLambdaEventMapper:
+    """
+    Maps the AWS Lambda event of the compaction to the partitions (or tables) to be compacted.
+
+    The event may list the partitions explicitly:
+        {"partitions": [{"database": "...", "table": "...", "partition_col": "event_date",
+                         "partition_value": "2025-10-15"}]}
+
+    Or give a "partition_value" to be compacted on all the tables configured on the
+    COMPACTION_TABLES environment variable (a JSON list of {"database", "table", "partition_col"}
+    objects). Otherwise (scheduled runs) the configured tables are mapped, and all their pending
+    partitions are compacted.
+    """
+
+    def __init__(self):
+        self.tables = json.loads(os.getenv("COMPACTION_TABLES", "[]"))
+
+
+    def map_event_to_partitions(self, event: Optional[dict[str, Any]]) -> list[DataCatalogPartition]:
+        """
+        Maps a Lambda event to the partitions to be compacted.
+
+        Args:
+            event (Optional[dict[str, Any]]): The Lambda event (scheduled events carry no partitions).
+
+        Returns:
+            list[DataCatalogPartition]: The partitions to be compacted.
+        """
+        event = event or {}
+        if event.get("partitions"):
+            return [DataCatalogPartition(**partition) for partition in event["partitions"]]
+
+        if not event.get("partition_value"):
+            return []
+
+        return [
+            DataCatalogPartition(
+                database=table["database"],
+                table=table["table"],
+                partition_col=table["partition_col"],
+                partition_value=event["partition_value"]
+            )
+            for table in self.tables
+        ]
+
+
+    def map_event_to_tables(self, event: Optional[dict[str, Any]]) -> list[DataCatalogTable]:
+        """
+        Maps a scheduled Lambda event (with no partitions nor partition value) to the configured
+        tables, whose pending partitions are compacted.
+
+        Args:
+            event (Optional[dict[str, Any]]): The Lambda event.
+
+        Returns:
+            list[DataCatalogTable]: The configured tables (empty when the event selects partitions).
+        """
+        event = event or {}
+        if event.get("partitions") or event.get("partition_value"):
+            return []
+
+        return [DataCatalogTable(**table) for table in self.tables]
@@ -0,0 +1,67 @@
+import os
+from typing import Any
+
+from app.src.features.compact_data_catalog_partitions.infra.mappers.compaction_lambda_event_mapper import (
+    CompactionLambdaEventMapper
+)
+from app.src.features.compact_data_catalog_partitions.use_case.compact_data_catalog_partitions_use_case import (
+    CompactDataCatalogPartitionsUseCase
+)
+from app.src.features.cross.infra.mappers.http_response_mapper import HTTPResponseMapper
+
+
+# Initializing mappers and adapters (S3 and Glue by default, or a local directory for testing)
+event_mapper = CompactionLambdaEventMapper()
+
+if os.getenv("COMPACTION_STORAGE_BACKEND") == "local":
+    from app.src.features.compact_data_catalog_partitions.infra.adapters.local_partition_storage_adapter import (
+        LocalPartitionStorageAdapter
+    )
+    from app.src.features.compact_data_catalog_partitions.infra.adapters.local_manifest_partition_catalog_adapter import (
+        LocalManifestPartitionCatalogAdapter
+    )
+
+    storage_adapter = LocalPartitionStorageAdapter()
+    catalog_adapter = LocalManifestPartitionCatalogAdapter(
+        base_path=os.getenv("COMPACTION_LOCAL_BASE_PATH", ".")
+    )
+else:
+    from app.src.features.compact_data_catalog_partitions.infra.adapters.s3_partition_storage_adapter import (
+        S3PartitionStorageAdapter
+    )
+    from app.src.features.compact_data_catalog_partitions.infra.adapters.glue_partition_catalog_adapter import (
+        GluePartitionCatalogAdapter
+    )
+
+    storage_adapter = S3PartitionStorageAdapter()
+    catalog_adapter = GluePartitionCatalogAdapter()
+
+
+# Initializing use case
+use_case = CompactDataCatalogPartitionsUseCase(
+    storage_adapter=storage_adapter,
+    catalog_adapter=catalog_adapter,
+    target_file_size_bytes=int(os.getenv("COMPACTION_TARGET_FILE_SIZE_BYTES", str(128 * 1024 * 1024))),
+    min_partition_age_days=int(os.getenv("COMPACTION_MIN_PARTITION_AGE_DAYS", "2")),
+    late_files_lookback_days=int(os.getenv("COMPACTION_LATE_FILES_LOOKBACK_DAYS", "7"))
+)
+
+
+# Defining a handler function for executing the use case in AWS Lambda
+def handler(event: dict[str, Any], context: Any = None) -> dict:
+    """
+    AWS Lambda handler function to execute the use case.
+
+    Args:
+        event (dict[str, Any]): The event data passed to the Lambda function.
+        context (Any): The context object provided by AWS Lambda.
+
+    Returns:
+        dict: The result of the use case execution.
+    """
+
+    partitions = event_mapper.map_event_to_partitions(event=event)
+    tables = event_mapper.map_event_to_tables(event=event)
+    output_dto = use_case.execute(partitions=partitions, tables=tables)
+
+    return HTTPResponseMapper.map(output_dto)
@@ -0,0 +1,358 @@
+import math
+import uuid
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from app.src.features.compact_data_catalog_partitions.domain.interfaces.partition_storage_adapter_interface import (
+    IPartitionStorageAdapter
+)
+from app.src.features.compact_data_catalog_partitions.domain.interfaces.partition_catalog_adapter_interface import (
+    IPartitionCatalogAdapter
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_partition import (
+    DataCatalogPartition
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.data_catalog_table import (
+    DataCatalogTable
+)
+from app.src.features.compact_data_catalog_partitions.domain.entities.partition_file import PartitionFile
+from app.src.features.compact_data_catalog_partitions.domain.entities.partition_compaction_report import (
+    PartitionCompactionReport
+)
+from app.src.features.cross.domain.dtos.output_dto import OutputDTO
+from app.src.features.cross.utils.log import LogUtils
+from app.src.features.cross.utils.date_and_time import DateAndTimeUtils
+from app.src.features.cross.value_objects import Timezone, DateFormat
+
+
+logger = LogUtils.setup_logger(name=__name__)
+
+# Directory (under the table location) holding the compacted partitions. Underscore prefixed
+# directories are ignored by the catalog crawlers and by the sinks writing to the table location.
+COMPACTED_DIR_NAME = "_compacted"
+
+
+@dataclass(frozen=True)
+class CompactDataCatalogPartitionsUseCase:
+    """
+    Use case for compacting the small files of closed (past day) data catalog partitions.
+
+    The JSON lines and Parquet files of each partition are rewritten into target sized Snappy
+    Parquet files on a new location, the partition is pointed to it with a single catalog update
+    (so queries never see a mix of original and compacted files) and the original files are
+    deleted afterwards.
+
+    Scheduled runs compact every closed partition of the given tables that was never compacted
+    (so partitions skipped by failed runs are caught up), and check the partitions compacted in the
+    last late_files_lookback_days days for files appended to their original location after the
+    swap, which are compacted together with the previous compacted files.
+    """
+
+    storage_adapter: IPartitionStorageAdapter
+    catalog_adapter: IPartitionCatalogAdapter
+    target_file_size_bytes: int = 128 * 1024 * 1024
+    min_partition_age_days: int = 2
+    late_files_lookback_days: int = 7
+
+
+    def __get_partition_date(self, partition: DataCatalogPartition) -> Optional[date]:
+        """
+        Parses the value of a date partition.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            Optional[date]: The date of the partition, or None when it isn't a date partition.
+        """
+        try:
+            return datetime.strptime(partition.partition_value, DateFormat.DATE.value).date()
+        except ValueError:
+            return None
+
+
+    def __get_closed_partitions_cutoff(self) -> date:
+        """
+        Gets the date of the most recent closed partition (partitions after it may still receive
+        writes from late stream records or staged micro-batches flushed on the next day).
+
+        Returns:
+            date: The date min_partition_age_days days ago.
+        """
+        today = DateAndTimeUtils.datetime_now_date(timezone=Timezone.SAO_PAULO)
+        return today - timedelta(days=self.min_partition_age_days)
+
+
+    def __is_open_partition(self, partition: DataCatalogPartition) -> bool:
+        """
+        Checks whether a date partition may still receive writes, which would land on the original
+        location.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            bool: True when the partition is not old enough to be compacted.
+        """
+        partition_date = self.__get_partition_date(partition)
+        return partition_date is not None and partition_date > self.__get_closed_partitions_cutoff()
+
+
+    def __list_pending_partitions(self, table: DataCatalogTable) -> list[DataCatalogPartition]:
+        """
+        Lists the closed partitions of a table that were never compacted, plus the ones compacted
+        in the late files lookback window (which may have received late files).
+
+        Args:
+            table (DataCatalogTable): The table.
+
+        Returns:
+            list[DataCatalogPartition]: The partitions to compact, sorted by value.
+        """
+        cutoff = self.__get_closed_partitions_cutoff()
+        lookback_cutoff = cutoff - timedelta(days=self.late_files_lookback_days)
+
+        pending_partitions = []
+        for partition in self.catalog_adapter.list_partitions(table):
+            partition_date = self.__get_partition_date(partition)
+            if partition_date is None or partition_date > cutoff:
+                continue
+
+            if partition.compacted_at is None or partition_date > lookback_cutoff:
+                pending_partitions.append(partition)
+
+        return sorted(pending_partitions, key=lambda partition: partition.partition_value)
+
+
+    def __get_table_location(self, location: str) -> str:
+        """
+        Gets the table location from the location of one of its partitions (original or compacted).
+
+        Args:
+            location (str): The location of the partition.
+
+        Returns:
+            str: The location of the table.
+        """
+        location = location.rstrip("/")
+        if f"/{COMPACTED_DIR_NAME}/" in location:
+            # Partition compacted before, so the table location comes before the compacted dir
+            return location.split(f"/{COMPACTED_DIR_NAME}/")[0]
+
+        return location.rsplit("/", 1)[0]
+
+
+    def __build_compacted_location(self, location: str, partition: DataCatalogPartition) -> str:
+        """
+        Builds a new (unique) location for the compacted files of a partition.
+
+        Args:
+            location (str): The current location of the partition.
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            str: The location <table location>/_compacted/<partition dir>/<run id>/.
+        """
+        table_location = self.__get_table_location(location)
+        now = DateAndTimeUtils.now(output_type="datetime", timezone=Timezone.SAO_PAULO)
+        run_id = f"{now:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        return f"{table_location}/{COMPACTED_DIR_NAME}/{partition.partition_dir}/{run_id}/"
+
+
+    def __write_compacted_files(
+        self,
+        partition: DataCatalogPartition,
+        source_files: list[PartitionFile],
+        target_location: str
+    ) -> tuple[list[PartitionFile], int]:
+        """
+        Rewrites the files of a partition into target sized Parquet files.
+
+        The number of rows of the first file is estimated from the size of the source files, and
+        the remaining rows are then spread evenly over the files that the size of the Parquet
+        files actually written calls for.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+            source_files (list[PartitionFile]): The files of the partition.
+            target_location (str): The location of the compacted files.
+
+        Returns:
+            tuple[list[PartitionFile], int]: The written files and the number of rows.
+        """
+        table = self.storage_adapter.read_files(
+            files=source_files,
+            column_types=self.catalog_adapter.get_column_types(partition),
+            partition_col=partition.partition_col
+        )
+        total_rows = table.num_rows
+        if total_rows == 0:
+            return [], 0
+
+        source_bytes = sum(source_file.size_bytes for source_file in source_files)
+        bytes_per_row = max(1.0, source_bytes / total_rows)
+
+        compacted_files: list[PartitionFile] = []
+        start_row = 0
+        while start_row < total_rows:
+            remaining_rows = total_rows - start_row
+            remaining_files = max(
+                1,
+                math.ceil(remaining_rows * bytes_per_row / self.target_file_size_bytes)
+            )
+            end_row = start_row + math.ceil(remaining_rows / remaining_files)
+
+            compacted_file = self.storage_adapter.write_parquet_file(
+                table=table.slice(start_row, end_row - start_row),
+                path=f"{target_location}part-{len(compacted_files):05d}.snappy.parquet"
+            )
+            compacted_files.append(compacted_file)
+
+            # Using the actual Parquet size per row for the next files
+            bytes_per_row = max(1.0, compacted_file.size_bytes / (end_row - start_row))
+            start_row = end_row
+
+        return compacted_files, total_rows
+
+
+    def __compact_partition(self, partition: DataCatalogPartition) -> PartitionCompactionReport:
+        """
+        Compacts a single partition.
+
+        Args:
+            partition (DataCatalogPartition): The partition.
+
+        Returns:
+            PartitionCompactionReport: The result of the compaction.
+        """
+        if self.__is_open_partition(partition):
+            return PartitionCompactionReport(partition=partition, status="open_partition")
+
+        source_location = self.catalog_adapter.get_partition_location(partition)
+        if source_location is None:
+            return PartitionCompactionReport(partition=partition, status="not_found")
+
+        source_files = self.storage_adapter.list_files(source_location)
+
+        # The sinks keep appending to the original location, so files landing there after a
+        # previous compaction aren't visible until they're compacted with the compacted files
+        late_files: list[PartitionFile] = []
+        original_location = f"{self.__get_table_location(source_location)}/{partition.partition_dir}/"
+        if source_location.rstrip("/") != original_location.rstrip("/"):
+            late_files = self.storage_adapter.list_files(original_location)
+            if late_files:
+                logger.warning(f"Found {len(late_files)} files appended to the original location of "
+                               f"compacted partition {partition.partition_dir} of table "
+                               f"{partition.table}")
+            source_files = source_files + late_files
+
+        bytes_before = sum(source_file.size_bytes for source_file in source_files)
+        report = PartitionCompactionReport(
+            partition=partition,
+            status="empty",
+            files_before=len(source_files),
+            bytes_before=bytes_before,
+            files_after=len(source_files),
+            bytes_after=bytes_before,
+            late_files=len(late_files),
+            source_location=source_location,
+            target_location=source_location
+        )
+        if not source_files:
+            return report
+
+        # Parquet partitions with at most one undersized file are already compacted
+        undersized_files = [
+            source_file for source_file in source_files
+            if source_file.size_bytes < self.target_file_size_bytes / 2
+        ]
+        if (
+            not late_files
+            and all(source_file.is_parquet for source_file in source_files)
+            and len(undersized_files) <= 1
+        ):
+            return replace(report, status="already_compacted")
+
+        target_location = self.__build_compacted_location(source_location, partition)
+        compacted_files, rows = self.__write_compacted_files(partition, source_files, target_location)
+
+        try:
+            self.catalog_adapter.swap_partition_location(partition, target_location)
+        except Exception:
+            # The partition still points to the original files, so the compacted ones are dropped
+            self.storage_adapter.delete_files(compacted_files)
+            raise
+
+        self.storage_adapter.delete_files(source_files)
+
+        return PartitionCompactionReport(
+            partition=partition,
+            status="compacted",
+            files_before=len(source_files),
+            bytes_before=bytes_before,
+            files_after=len(compacted_files),
+            bytes_after=sum(compacted_file.size_bytes for compacted_file in compacted_files),
+            rows=rows,
+            late_files=len(late_files),
+            source_location=source_location,
+            target_location=target_location
+        )
+
+
+    def execute(
+        self,
+        partitions: list[DataCatalogPartition],
+        tables: Optional[list[DataCatalogTable]] = None
+    ) -> OutputDTO:
+        """
+        Implements the logic to execute the use case.
+
+        Args:
+            partitions (list[DataCatalogPartition]): The partitions to compact.
+            tables (Optional[list[DataCatalogTable]]): The tables whose pending partitions (never
+                compacted or possibly holding late files) are compacted, on scheduled runs.
+
+        Returns:
+            OutputDTO: An instance of OutputDTO with the report of each partition and the file
+                counts and sizes before and after the compaction.
+        """
+        partitions = list(partitions)
+        for table in tables or []:
+            try:
+                pending_partitions = self.__list_pending_partitions(table)
+
+            except Exception:
+                logger.exception(f"Error listing the partitions of table {table.database}.{table.table}")
+                raise
+
+            logger.info(f"Found {len(pending_partitions)} partitions to compact on table "
+                        f"{table.database}.{table.table}")
+            partitions.extend(pending_partitions)
+
+        reports: list[PartitionCompactionReport] = []
+        for partition in partitions:
+            try:
+                logger.info(f"Compacting partition {partition.partition_dir} of table "
+                            f"{partition.database}.{partition.table}")
+                report = self.__compact_partition(partition)
+
+            except Exception:
+                logger.exception(f"Error compacting partition {partition.partition_dir} of table "
+                                 f"{partition.database}.{partition.table}")
+                raise
+
+            logger.info(f"Partition {partition.partition_dir} of table {partition.table}: "
+                        f"{report.status} ({report.files_before} files / {report.bytes_before} bytes "
+                        f"before, {report.files_after} files / {report.bytes_after} bytes after)")
+            reports.append(report)
+
+        return OutputDTO.ok(
+            data={
+                "partitions": [report.to_dict() for report in reports],
+                "files_before": sum(report.files_before for report in reports),
+                "bytes_before": sum(report.bytes_before for report in reports),
+                "files_after": sum(report.files_after for report in reports),
+                "bytes_after": sum(report.bytes_after for report in reports)
+            }
+        )
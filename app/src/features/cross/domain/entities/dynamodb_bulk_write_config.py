@@ -0,0 +1,29 @@
+from dataclasses import dataclass, asdict
+
+
+@dataclass(frozen=True)
+class DynamoDBBulkWriteConfig:
+    """
+    Represents the configuration of the parallel DynamoDB BatchWriteItem writer.
+
+    Attributes:
+        max_workers (int): The number of BatchWriteItem requests sent at the same time.
+        max_retries (int): The maximum number of retries of the unprocessed (or throttled) items
+            of a chunk before giving up.
+        base_backoff_seconds (float): The base of the exponential backoff between retries.
+        max_backoff_seconds (float): The highest backoff between retries.
+    """
+
+    max_workers: int = 4
+    max_retries: int = 8
+    base_backoff_seconds: float = 0.05
+    max_backoff_seconds: float = 5.0
+
+    def to_dict(self) -> dict:
+        """
+        Converts the bulk write configuration to a dictionary.
+
+        Returns:
+            A dictionary representation of the bulk write configuration.
+        """
+        return asdict(self)
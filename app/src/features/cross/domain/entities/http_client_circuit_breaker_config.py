@@ -0,0 +1,24 @@
+from dataclasses import dataclass, asdict
+
+
+@dataclass(frozen=True)
+class HTTPClientCircuitBreakerConfig:
+    """
+    Represents the configuration of the circuit breaker of a host.
+
+    Attributes:
+        failure_threshold (int): The number of consecutive failures that opens the circuit.
+        recovery_timeout_seconds (float): How long the circuit stays open before a trial request.
+    """
+
+    failure_threshold: int = 5
+    recovery_timeout_seconds: float = 30.0
+
+    def to_dict(self) -> dict:
+        """
+        Converts the circuit breaker configuration to a dictionary.
+
+        Returns:
+            A dictionary representation of the circuit breaker configuration.
+        """
+        return asdict(self)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, asdict
+
+
+@dataclass(frozen=True)
+class HTTPClientRateLimitConfig:
+    """
+    Represents the configuration of the adaptive (AIMD) token bucket rate limiter of a host.
+
+    Attributes:
+        initial_rate (float): The number of requests per second allowed at start.
+        min_rate (float): The lowest rate the limiter can decrease to.
+        max_rate (float): The highest rate the limiter can increase to.
+        burst (float): The capacity of the token bucket.
+        additive_increase (float): How much the rate grows (per second of successful requests).
+        multiplicative_decrease (float): The factor applied to the rate on throttling signals.
+        latency_threshold_seconds (float): Responses slower than this are handled as throttling.
+        decrease_cooldown_seconds (float): The minimum time between two consecutive decreases.
+    """
+
+    initial_rate: float = 5.0
+    min_rate: float = 0.5
+    max_rate: float = 50.0
+    burst: float = 5.0
+    additive_increase: float = 1.0
+    multiplicative_decrease: float = 0.5
+    latency_threshold_seconds: float = 2.0
+    decrease_cooldown_seconds: float = 1.0
+
+    def to_dict(self) -> dict:
+        """
+        Converts the rate limit configuration to a dictionary.
+
+        Returns:
+            A dictionary representation of the rate limit configuration.
+        """
+        return asdict(self)
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -12,9 +13,18 @@ class HTTPClientResponse:
         content (bytes): The content of the response.
         encoding (str): The encoding of the response content.
         elapsed_time (float): The time taken to receive the response in seconds.
+        headers (dict[str, str]): The headers of the response.
     """
     url: str
     status_code: int
     content: bytes
     encoding: str
     elapsed_time: float
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Returns the sha256 hex digest of the response content.
+        """
+        return hashlib.sha256(self.content).hexdigest()
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+
+@dataclass(frozen=True)
+class HTTPClientStreamResponse:
+    """
+    Represents an HTTP response whose content is read incrementally from the connection.
+
+    Attributes:
+        url (str): The URL of the request.
+        status_code (int): The HTTP status code of the response.
+        encoding (str): The encoding of the response content.
+        chunks (Iterator[bytes]): The iterator of content chunks. The connection is released once
+            the iterator is exhausted or closed.
+        headers (dict[str, str]): The headers of the response.
+        release_connection (Optional[Callable[[], None]]): Callback that releases the connection
+            when the response is closed before its chunks are iterated.
+    """
+    url: str
+    status_code: int
+    encoding: str
+    chunks: Iterator[bytes]
+    headers: dict[str, str] = field(default_factory=dict)
+    release_connection: Optional[Callable[[], None]] = None
+
+    def close(self) -> None:
+        """
+        Releases the connection of the response without reading the remaining content.
+        """
+        close = getattr(self.chunks, "close", None)
+        if close is not None:
+            close()
+
+        if self.release_connection is not None:
+            self.release_connection()
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, asdict
+
+
+@dataclass(frozen=True)
+class MicroBatchBufferConfig:
+    """
+    Represents the configuration of the S3 staging buffer used to write few large files per
+    partition instead of one small file per stream invocation.
+
+    Attributes:
+        enabled (bool): Whether the records are buffered on the staging prefix. When disabled,
+            each invocation writes its records straight to the dataset.
+        staging_prefix (str): The prefix (outside the table locations) where the records are
+            staged until they are flushed.
+        max_buffer_bytes (int): The size of the staged objects of a table that triggers a flush.
+        max_buffer_age_seconds (int): The age of the oldest staged object of a table that
+            triggers a flush.
+        lock_timeout_seconds (int): The age after which the flush lock of a table is handled as
+            abandoned (e.g. by an invocation that timed out while flushing).
+    """
+
+    enabled: bool = False
+    staging_prefix: str = "_staging"
+    max_buffer_bytes: int = 32 * 1024 * 1024
+    max_buffer_age_seconds: int = 900
+    lock_timeout_seconds: int = 900
+
+    def to_dict(self) -> dict:
+        """
+        Converts the micro-batch buffer configuration to a dictionary.
+
+        Returns:
+            A dictionary representation of the micro-batch buffer configuration.
+        """
+        return asdict(self)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from app.src.features.cross.domain.entities.batch_process import BatchProcess
 
@@ -9,19 +10,40 @@ class IBatchControlDatabaseRepository(ABC):
     """
 
     @abstractmethod
-    def update_batch_process_control(self, batch_process: BatchProcess) -> None:
+    def update_batch_process_control(self, batch_process: BatchProcess) -> BatchProcess:
         """
-        Updates the batch process control record in the repository.
+        Adds the processed items of a batch to the process control record and marks the process
+        as completed when all of its items were processed.
 
         Args:
             batch_process (BatchProcess): The batch process details to update.
+
+        Returns:
+            BatchProcess: The batch process as it is stored after the update.
         """
 
     @abstractmethod
-    def check_batch_process_completion(self, batch_process: BatchProcess) -> None:
+    def is_batch_process_shard(self, batch_process: BatchProcess) -> bool:
         """
-        Checks if a batch process has completed based on the total and processed items.
+        Checks whether a batch process record is a shard of a sharded process.
 
         Args:
-            batch_process (BatchProcess): The batch process details to check.
+            batch_process (BatchProcess): The batch process record.
+
+        Returns:
+            bool: True when the record is a shard record.
+        """
+
+    @abstractmethod
+    def complete_sharded_batch_process(self, batch_process: BatchProcess) -> Optional[BatchProcess]:
+        """
+        Aggregates the shard records of a sharded process and stores the process as completed
+        when all of its items were processed.
+
+        Args:
+            batch_process (BatchProcess): Any shard record of the process.
+
+        Returns:
+            Optional[BatchProcess]: The completed process, or None when it is not complete yet (or
+                was already completed).
         """
@@ -29,3 +29,16 @@ class ICDCDataCatalogSyncAdapter(ABC):
         Args:
             data (list[DynamoDBStreamsOutputData]): List of data to be stored and synchronized.
         """
+
+    @abstractmethod
+    def flush_staged_data(self, table_name: str) -> dict[str, dict[str, int]]:
+        """
+        Flush the CDC and SoR data staged for a source table when it reached the flush thresholds,
+        so staged data is written even when the source table receives no new changes.
+
+        Args:
+            table_name (str): The name of the source table.
+
+        Returns:
+            dict[str, dict[str, int]]: The metrics of the flush of each output.
+        """
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
 from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+from app.src.features.cross.domain.entities.http_client_stream_response import HTTPClientStreamResponse
 
 
 class IHTTPClientAdapter(ABC):
@@ -20,3 +22,45 @@ class IHTTPClientAdapter(ABC):
         Returns:
             An HTTPClientResponse object representing the response.
         """
+
+    @abstractmethod
+    def stream(
+        self,
+        request_config: HTTPClientRequestConfig,
+        chunk_size: int = 64 * 1024
+    ) -> HTTPClientStreamResponse:
+        """
+        Performs a GET request returning the content as an iterator of chunks read from the
+        connection, so callers can parse it incrementally and stop reading early.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+            chunk_size (int): The maximum size of each chunk in bytes.
+
+        Returns:
+            An HTTPClientStreamResponse object representing the response.
+        """
+
+    @abstractmethod
+    def batch_get(
+        self,
+        request_configs: list[HTTPClientRequestConfig],
+        max_in_flight: int = 10,
+        max_requests_per_second_per_host: Optional[float] = None
+    ) -> list[HTTPClientResponse | Exception]:
+        """
+        Performs a batch of GET requests overlapping their network I/O.
+
+        Results keep the same order of the given request configurations. A request that fails
+        does not interrupt the others: its position on the result list holds the raised exception
+        so callers can report errors for each request individually.
+
+        Args:
+            request_configs (list[HTTPClientRequestConfig]): Configurations for the HTTP requests.
+            max_in_flight (int): The maximum number of requests running at the same time.
+            max_requests_per_second_per_host (Optional[float]): Optional rate cap applied to each
+                host to avoid being throttled by the target server.
+
+        Returns:
+            A list of HTTPClientResponse objects (or exceptions) in the same order of the input.
+        """
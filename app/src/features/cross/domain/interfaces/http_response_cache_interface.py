@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+
+
+class IHTTPResponseCache(ABC):
+    """
+    Interface for caches of raw HTTP responses.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[HTTPClientResponse]:
+        """
+        Gets a cached HTTP response.
+
+        Args:
+            key (str): The cache key of the response.
+
+        Returns:
+            The cached HTTPClientResponse or None if there is no valid (not expired) entry.
+        """
+
+    @abstractmethod
+    def put(self, key: str, response: HTTPClientResponse) -> None:
+        """
+        Stores an HTTP response in the cache.
+
+        Args:
+            key (str): The cache key of the response.
+            response (HTTPClientResponse): The HTTP response to be cached.
+        """
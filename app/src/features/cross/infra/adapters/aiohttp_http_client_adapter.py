@@ -0,0 +1,296 @@
+import time
+import asyncio
+import logging
+from typing import Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from app.src.features.cross.utils.log import LogUtils
+from app.src.features.cross.domain.interfaces.http_client_adapter import IHTTPClientAdapter
+from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
+from app.src.features.cross.domain.entities.http_client_retry_config import HTTPClientRetryConfig
+from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+from app.src.features.cross.domain.entities.http_client_stream_response import HTTPClientStreamResponse
+
+
+# Status codes for which the Retry-After header is honored (same behavior of urllib3 Retry)
+RETRY_AFTER_STATUS_CODES = (413, 429, 503)
+
+
+class AIOHTTPClientAdapter(IHTTPClientAdapter):
+    """
+    Implementation of IHTTPClientAdapter that uses aiohttp to run many HTTP requests on a single
+    asyncio event loop.
+
+    The retry behavior follows the same semantics of HTTPClientRetryConfig used by the requests
+    based adapter: a request is retried up to num_retries times on connection errors or when the
+    response status is in status_forcelist, sleeping backoff_factor * 2 ** (retry - 1) seconds
+    between consecutive retries.
+
+    Args:
+        logger (logging.Logger): The logger used by the adapter.
+        max_in_flight (int): The default maximum number of requests running at the same time.
+        max_requests_per_second_per_host (Optional[float]): The default rate cap per host.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger = LogUtils.setup_logger(name=__name__),
+        max_in_flight: int = 50,
+        max_requests_per_second_per_host: Optional[float] = None
+    ):
+        self.logger = logger
+        self.max_in_flight = max_in_flight
+        self.max_requests_per_second_per_host = max_requests_per_second_per_host
+
+
+    @staticmethod
+    def __get_backoff_time(retry_config: HTTPClientRetryConfig, consecutive_errors: int) -> float:
+        """
+        Computes the time to sleep before the next retry using the urllib3 backoff formula.
+
+        Args:
+            retry_config (HTTPClientRetryConfig): The retry configuration of the request.
+            consecutive_errors (int): The number of consecutive errors observed so far.
+
+        Returns:
+            float: The time to sleep in seconds.
+        """
+        if consecutive_errors <= 1:
+            return 0
+        return retry_config.backoff_factor * (2 ** (consecutive_errors - 1))
+
+
+    async def __wait_for_host_slot(
+        self,
+        url: str,
+        max_requests_per_second: float,
+        next_request_slots: dict[str, float]
+    ) -> None:
+        """
+        Waits until the host of the URL can receive a new request.
+
+        Args:
+            url (str): The URL that is about to be requested.
+            max_requests_per_second (float): The maximum number of requests per second per host.
+            next_request_slots (dict[str, float]): The next free slot of each host in the batch.
+        """
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        slot = max(now, next_request_slots.get(host, now))
+        next_request_slots[host] = slot + 1 / max_requests_per_second
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+    async def __get(
+        self,
+        session: aiohttp.ClientSession,
+        request_config: HTTPClientRequestConfig
+    ) -> HTTPClientResponse:
+        """
+        Performs a single GET request with retries using an open aiohttp session.
+
+        Args:
+            session (aiohttp.ClientSession): The session used to send the request.
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+
+        Returns:
+            An HTTPClientResponse object representing the response.
+        """
+        retry_config = request_config.retry_config or HTTPClientRetryConfig()
+        status_forcelist = set(retry_config.status_forcelist or [])
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=request_config.timeout,
+            sock_read=request_config.timeout
+        )
+
+        consecutive_errors = 0
+        while True:
+            start_time = time.perf_counter()
+            try:
+                async with session.get(
+                    request_config.url,
+                    headers=request_config.headers,
+                    timeout=timeout,
+                    **request_config.request_kwargs
+                ) as r:
+                    content = await r.read()
+                    elapsed_time = time.perf_counter() - start_time
+
+                    if r.status in status_forcelist and consecutive_errors < retry_config.num_retries:
+                        consecutive_errors += 1
+                        retry_after = r.headers.get("Retry-After")
+                        if r.status in RETRY_AFTER_STATUS_CODES and retry_after \
+                                and retry_after.isdigit():
+                            await asyncio.sleep(int(retry_after))
+                        else:
+                            await asyncio.sleep(
+                                self.__get_backoff_time(retry_config, consecutive_errors)
+                            )
+                        continue
+
+                    if r.status in status_forcelist:
+                        r.raise_for_status()
+
+                    if r.charset:
+                        encoding = r.charset
+                    elif r.content_type.startswith("text/"):
+                        encoding = "ISO-8859-1"
+                    else:
+                        encoding = "utf-8"
+
+                    return HTTPClientResponse(
+                        url=str(r.url),
+                        status_code=r.status,
+                        content=content,
+                        encoding=encoding,
+                        elapsed_time=elapsed_time,
+                        headers=dict(r.headers)
+                    )
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                if consecutive_errors >= retry_config.num_retries:
+                    self.logger.exception(
+                        msg=f"Connection error while accessing URL: {request_config.url}",
+                        exc_info=error
+                    )
+                    raise
+
+                consecutive_errors += 1
+                await asyncio.sleep(self.__get_backoff_time(retry_config, consecutive_errors))
+
+            except aiohttp.ClientResponseError as http_error:
+                self.logger.exception(
+                    msg=f"HTTP error while accessing URL: {request_config.url}",
+                    exc_info=http_error
+                )
+                raise
+
+
+    async def get_many(
+        self,
+        request_configs: list[HTTPClientRequestConfig],
+        max_in_flight: Optional[int] = None,
+        max_requests_per_second_per_host: Optional[float] = None
+    ) -> list[HTTPClientResponse | Exception]:
+        """
+        Performs many GET requests concurrently on the running event loop.
+
+        Args:
+            request_configs (list[HTTPClientRequestConfig]): Configurations for the HTTP requests.
+            max_in_flight (Optional[int]): The maximum number of requests running at the same time.
+                Defaults to the value given on the adapter initialization.
+            max_requests_per_second_per_host (Optional[float]): Optional rate cap applied to each
+                host. Defaults to the value given on the adapter initialization.
+
+        Returns:
+            A list of HTTPClientResponse objects (or exceptions) in the same order of the input.
+        """
+        if not request_configs:
+            return []
+
+        max_in_flight = max_in_flight or self.max_in_flight
+        max_requests_per_second = (
+            max_requests_per_second_per_host or self.max_requests_per_second_per_host
+        )
+        semaphore = asyncio.Semaphore(max_in_flight)
+        next_request_slots: dict[str, float] = {}
+
+        async def bounded_get(session: aiohttp.ClientSession, request_config: HTTPClientRequestConfig):
+            async with semaphore:
+                if max_requests_per_second:
+                    await self.__wait_for_host_slot(
+                        url=request_config.url,
+                        max_requests_per_second=max_requests_per_second,
+                        next_request_slots=next_request_slots
+                    )
+                return await self.__get(session=session, request_config=request_config)
+
+        connector = aiohttp.TCPConnector(limit=max_in_flight)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *[bounded_get(session, request_config) for request_config in request_configs],
+                return_exceptions=True
+            )
+
+
+    def get(self, request_config: HTTPClientRequestConfig) -> HTTPClientResponse:
+        """
+        Performs a GET request to the specified URL with optional headers and parameters.
+
+        This method runs its own event loop and, because of that, must not be called from a
+        coroutine. Async callers should await get_many instead.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+
+        Returns:
+            An HTTPClientResponse object representing the response.
+        """
+        response = asyncio.run(self.get_many(request_configs=[request_config]))[0]
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+
+    def stream(
+        self,
+        request_config: HTTPClientRequestConfig,
+        chunk_size: int = 64 * 1024
+    ) -> HTTPClientStreamResponse:
+        """
+        Performs a GET request returning the content as an iterator of chunks.
+
+        The aiohttp stream can't outlive the event loop created by this synchronous method, so the
+        content is read in full and then split in chunks. Async callers should await get_many.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+            chunk_size (int): The maximum size of each chunk in bytes.
+
+        Returns:
+            An HTTPClientStreamResponse object representing the response.
+        """
+        response = self.get(request_config=request_config)
+
+        return HTTPClientStreamResponse(
+            url=response.url,
+            status_code=response.status_code,
+            encoding=response.encoding,
+            chunks=(
+                response.content[idx:idx + chunk_size]
+                for idx in range(0, len(response.content), chunk_size)
+            ),
+            headers=response.headers
+        )
+
+
+    def batch_get(
+        self,
+        request_configs: list[HTTPClientRequestConfig],
+        max_in_flight: int = 10,
+        max_requests_per_second_per_host: Optional[float] = None
+    ) -> list[HTTPClientResponse | Exception]:
+        """
+        Performs a batch of GET requests on a single event loop.
+
+        Args:
+            request_configs (list[HTTPClientRequestConfig]): Configurations for the HTTP requests.
+            max_in_flight (int): The maximum number of requests running at the same time.
+            max_requests_per_second_per_host (Optional[float]): Optional rate cap applied to each
+                host to avoid being throttled by the target server.
+
+        Returns:
+            A list of HTTPClientResponse objects (or exceptions) in the same order of the input.
+        """
+        return asyncio.run(
+            self.get_many(
+                request_configs=request_configs,
+                max_in_flight=max_in_flight,
+                max_requests_per_second_per_host=max_requests_per_second_per_host
+            )
+        )
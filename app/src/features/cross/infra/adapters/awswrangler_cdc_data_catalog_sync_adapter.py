@@ -1,9 +1,12 @@
 import os
-from datetime import datetime, UTC
+import threading
+from datetime import datetime
+from typing import Any, Optional
 
 import boto3
 import awswrangler as wr
 import pandas as pd
+import pyarrow as pa
 
 from app.src.features.cross.domain.interfaces.cdc_data_catalog_sync_adapter_interface import (
     ICDCDataCatalogSyncAdapter
@@ -11,6 +14,10 @@ from app.src.features.cross.domain.interfaces.cdc_data_catalog_sync_adapter_inte
 from app.src.features.cross.domain.entities.dynamodb_streams_output_data import (
     DynamoDBStreamsOutputData
 )
+from app.src.features.cross.domain.entities.micro_batch_buffer_config import MicroBatchBufferConfig
+from app.src.features.cross.infra.adapters.s3_micro_batch_buffer import S3MicroBatchBuffer
+from app.src.features.cross.infra.mappers.dynamodb_streams_arrow_mapper import DynamoDBStreamsArrowMapper
+from app.src.features.cross.infra.mappers.dynamodb_table_arrow_schemas import DynamoDBTableArrowSchema
 
 from app.src.features.cross.utils.log import LogUtils
 from app.src.features.cross.utils.date_and_time import DateAndTimeUtils
@@ -24,15 +31,54 @@ class AWSWranglerCDCDataCatalogSyncAdapter(ICDCDataCatalogSyncAdapter):
     """
     Implementation of ICDCDataCatalogSyncAdapter to store and sync from a database streams source
     with a catalog using AWS Wrangler.
+
+    CDC records are written as Parquet with a declared Arrow schema per source table, where the
+    keys and images are struct columns following the declared schema of the table (tables
+    without a declared schema get map<string, string> columns holding JSON values). The Arrow
+    tables are built straight from the output data, and the SoR table of a batch reuses the new
+    image columns of its CDC table. With the micro-batch buffer enabled, the same Arrow tables are
+    staged (as Parquet) and written as they are on flush.
+
+    The CDC and SoR outputs may be written concurrently: each one uses its own boto3 session
+    (sessions and their clients aren't safe to create from several threads).
+
+    Args:
+        table_schemas (Optional[dict[str, DynamoDBTableArrowSchema]]): The Arrow types of the
+            source tables, keyed by the DynamoDB table name (DYNAMODB_TABLE_ARROW_SCHEMAS when
+            not provided).
     """
 
-    def __init__(self):
+    def __init__(self, table_schemas: Optional[dict[str, DynamoDBTableArrowSchema]] = None):
         self.logger = LogUtils.setup_logger(name=__name__)
+        self.arrow_mapper = DynamoDBStreamsArrowMapper(table_schemas=table_schemas)
+        # CDC table of the last batch, reused to build its SoR table
+        self.cdc_batch_lock = threading.Lock()
+        self.cdc_batch: tuple[Optional[list[DynamoDBStreamsOutputData]], Optional[pa.Table]] = (
+            None,
+            None
+        )
         self.cdc_bucket_name_prefix = os.getenv("S3_ANALYTICS_CDC_BUCKET_NAME_PREFIX")
         self.sor_bucket_name_prefix = os.getenv("S3_ANALYTICS_SOR_BUCKET_NAME_PREFIX")
         self.cdc_data_catalog_database = os.getenv("DATA_CATALOG_CDC_DATABASE_NAME")
         self.sor_data_catalog_database = os.getenv("DATA_CATALOG_SOR_DATABASE_NAME")
         self.bucket_names = self.__build_bucket_names()
+        self.boto3_sessions = {layer: boto3.session.Session() for layer in self.bucket_names}
+
+        # Records are optionally staged and flushed in micro-batches, avoiding one small file per
+        # partition on every stream invocation
+        self.buffer_config = MicroBatchBufferConfig(
+            enabled=os.getenv("CDC_MICRO_BATCH_BUFFER_ENABLED", "false").lower() == "true",
+            max_buffer_bytes=int(os.getenv("CDC_MICRO_BATCH_BUFFER_MAX_BYTES", str(32 * 1024 * 1024))),
+            max_buffer_age_seconds=int(os.getenv("CDC_MICRO_BATCH_BUFFER_MAX_AGE_SECONDS", "900"))
+        )
+        self.buffers = {
+            layer: S3MicroBatchBuffer(
+                bucket_name=bucket_name,
+                config=self.buffer_config,
+                client=self.boto3_sessions[layer].client("s3")
+            )
+            for layer, bucket_name in self.bucket_names.items()
+        }
 
 
     def __build_bucket_names(self) -> dict:
@@ -51,27 +97,59 @@ class AWSWranglerCDCDataCatalogSyncAdapter(ICDCDataCatalogSyncAdapter):
         }
 
 
-    def store_and_sync_cdc_data(self, data: list[DynamoDBStreamsOutputData]) -> None:
+    def __get_cdc_table(self, data: list[DynamoDBStreamsOutputData]) -> pa.Table:
         """
-        Adapter to store CDC data in S3 and sync with AWS Glue Data Catalog using AWS Wrangler.
+        Gets the CDC Arrow table of a batch, mapping it once (the table of the last batch is kept
+        so the SoR output, possibly running on another thread, reuses its new image columns).
 
         Args:
-            data (list[DynamoDBStreamsOutputData]): List of CDC data to be stored and synchronized.
+            data (list[DynamoDBStreamsOutputData]): The output data of the batch.
+
+        Returns:
+            pa.Table: The CDC table of the batch.
+        """
+        with self.cdc_batch_lock:
+            cached_data, cached_table = self.cdc_batch
+            if cached_data is not data:
+                cached_table = self.arrow_mapper.map_cdc_data(data=data)
+                self.cdc_batch = (data, cached_table)
+
+            return cached_table
+
+
+    @staticmethod
+    def __to_dataframe(table: pa.Table) -> pd.DataFrame:
+        """
+        Wraps an Arrow table in a DataFrame backed by the Arrow arrays (no object columns are
+        allocated), so the declared types reach the Parquet files and the catalog.
+
+        Args:
+            table (pa.Table): The Arrow table.
+
+        Returns:
+            pd.DataFrame: The DataFrame.
+        """
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+    def __write_cdc_table(self, table: pa.Table, cdc_table_name: str, event_source_service: str) -> None:
+        """
+        Writes a CDC table in S3 (Parquet format) and syncs it with Glue Data Catalog.
+
+        Args:
+            table (pa.Table): The CDC Arrow table.
+            cdc_table_name (str): The name of the CDC table.
+            event_source_service (str): The source service of the events (prefix of the table).
         """
         try:
-            # Converting list of DynamoDBStreamsOutputData to DataFrame
-            df = pd.DataFrame([tr.__dict__ for tr in data])
+            df = self.__to_dataframe(table)
         except Exception:
             self.logger.exception(f"Error converting event data to DataFrame")
             raise
 
-        # Extracting useful information for saving the data
-        event_source_service = data[0].event_source_service
-        cdc_table_name = f"cdc_{data[0].table_name}"
-
-        # Store DataFrame in S3 (JSON format) and sync with Glue Data Catalog
+        # Store DataFrame in S3 (Parquet format) and sync with Glue Data Catalog
         try:
-            wr.s3.to_json(
+            wr.s3.to_parquet(
                 df=df,
                 path=f"s3://{self.bucket_names['cdc']}/{event_source_service}/{cdc_table_name}/",
                 index=False,
@@ -79,9 +157,9 @@ class AWSWranglerCDCDataCatalogSyncAdapter(ICDCDataCatalogSyncAdapter):
                 database=self.cdc_data_catalog_database,
                 table=cdc_table_name,
                 mode="append",
+                compression="snappy",
                 partition_cols=["event_date"],
-                orient="records",
-                lines=True
+                boto3_session=self.boto3_sessions["cdc"]
             )
 
         except wr.exceptions.InvalidTable:
@@ -94,34 +172,21 @@ class AWSWranglerCDCDataCatalogSyncAdapter(ICDCDataCatalogSyncAdapter):
                                   f"S3 and Glue Data Catalog on table '{cdc_table_name}'.")
             raise
 
-    
-    def store_and_sync_sor_data(self, data: list[DynamoDBStreamsOutputData]) -> None:
+
+    def __write_sor_table(self, table: pa.Table, sor_table_name: str) -> None:
         """
-        Adapter to store raw data taken from the CDC source in S3 and sync with AWS Glue Data
-        Catalog using AWS Wrangler.
+        Writes a SoR table in S3 (Parquet format) and syncs it with Glue Data Catalog.
 
         Args:
-            data (list[DynamoDBStreamsOutputData]): List of data to be stored and synchronized.
+            table (pa.Table): The SoR Arrow table (new images plus execution columns).
+            sor_table_name (str): The name of the SoR table.
         """
         try:
-            # Taken the new image (updated raw data) from each record and converting to DataFrame
-            df = pd.DataFrame([tr.table_new_image for tr in data])
-
-            # Adding execution timestamp and date columns for 
-            df["execution_timestamp"] = DateAndTimeUtils.datetime_now(
-                timezone=Timezone.SAO_PAULO
-            )
-            df["execution_date"] = DateAndTimeUtils.datetime_now_str(
-                timezone=Timezone.SAO_PAULO,
-                format=DateFormat.DATE
-            )
-
+            df = self.__to_dataframe(table)
         except Exception:
             self.logger.exception(f"Error converting new image data to DataFrame")
             raise
 
-        sor_table_name = f"sor_{data[0].table_name}"
-
         # Store DataFrame in S3 (Parquet format) and sync with Glue Data Catalog
         try:
             wr.s3.to_parquet(
@@ -133,7 +198,8 @@ class AWSWranglerCDCDataCatalogSyncAdapter(ICDCDataCatalogSyncAdapter):
                 table=sor_table_name,
                 mode="append",
                 compression="snappy",
-                partition_cols=["execution_date"]
+                partition_cols=["execution_date"],
+                boto3_session=self.boto3_sessions["sor"]
             )
 
         except wr.exceptions.InvalidTable:
@@ -145,3 +211,165 @@ class AWSWranglerCDCDataCatalogSyncAdapter(ICDCDataCatalogSyncAdapter):
             self.logger.exception(f"An unexpected error occurred while storing and syncing data to "
                                   f"S3 and Glue Data Catalog on table '{sor_table_name}'.")
             raise
+
+
+    @staticmethod
+    def __build_sor_records(
+        data: list[DynamoDBStreamsOutputData],
+        execution_timestamp: datetime,
+        execution_date: str
+    ) -> list[dict[str, Any]]:
+        """
+        Builds the SoR records of a batch: the new image (updated raw data) of each record plus
+        the execution timestamp and date columns.
+
+        Args:
+            data (list[DynamoDBStreamsOutputData]): The output data of the batch.
+            execution_timestamp (datetime): The execution timestamp.
+            execution_date (str): The execution date.
+
+        Returns:
+            list[dict[str, Any]]: The SoR records.
+        """
+        return [
+            {
+                **tr.table_new_image,
+                "execution_timestamp": execution_timestamp,
+                "execution_date": execution_date
+            }
+            for tr in data
+        ]
+
+
+    def __build_sor_table(
+        self,
+        data: list[DynamoDBStreamsOutputData],
+        execution_timestamp: datetime,
+        execution_date: str
+    ) -> pa.Table:
+        """
+        Builds the SoR Arrow table of a batch, reusing the new image columns of its CDC table
+        (tables without a declared schema are mapped from the SoR records).
+
+        Args:
+            data (list[DynamoDBStreamsOutputData]): The output data of the batch.
+            execution_timestamp (datetime): The execution timestamp.
+            execution_date (str): The execution date.
+
+        Returns:
+            pa.Table: The SoR table of the batch.
+        """
+        table_name = data[0].table_name
+        table = self.arrow_mapper.map_sor_data(
+            cdc_table=self.__get_cdc_table(data),
+            table_name=table_name,
+            execution_timestamp=execution_timestamp,
+            execution_date=execution_date
+        )
+        if table is None:
+            table = self.arrow_mapper.map_sor_records(
+                records=self.__build_sor_records(data, execution_timestamp, execution_date)
+            )
+
+        return table
+
+
+    def store_and_sync_cdc_data(self, data: list[DynamoDBStreamsOutputData]) -> None:
+        """
+        Adapter to store CDC data in S3 and sync with AWS Glue Data Catalog using AWS Wrangler.
+
+        Args:
+            data (list[DynamoDBStreamsOutputData]): List of CDC data to be stored and synchronized.
+        """
+        cdc_table_name = f"cdc_{data[0].table_name}"
+        event_source_service = data[0].event_source_service
+
+        table = self.__get_cdc_table(data)
+
+        if not self.buffer_config.enabled:
+            self.__write_cdc_table(
+                table=table,
+                cdc_table_name=cdc_table_name,
+                event_source_service=event_source_service
+            )
+            return
+
+        self.buffers["cdc"].stage_and_flush(
+            table_name=cdc_table_name,
+            partition_col="event_date",
+            table=table,
+            write_table=lambda staged_table: self.__write_cdc_table(
+                table=staged_table,
+                cdc_table_name=cdc_table_name,
+                event_source_service=event_source_service
+            )
+        )
+
+    
+    def store_and_sync_sor_data(self, data: list[DynamoDBStreamsOutputData]) -> None:
+        """
+        Adapter to store raw data taken from the CDC source in S3 and sync with AWS Glue Data
+        Catalog using AWS Wrangler.
+
+        Args:
+            data (list[DynamoDBStreamsOutputData]): List of data to be stored and synchronized.
+        """
+        # Execution timestamp and date columns added to the new image (updated raw data) of each record
+        execution_timestamp = DateAndTimeUtils.datetime_now(timezone=Timezone.SAO_PAULO)
+        execution_date = DateAndTimeUtils.datetime_now_str(
+            timezone=Timezone.SAO_PAULO,
+            format=DateFormat.DATE
+        )
+        sor_table_name = f"sor_{data[0].table_name}"
+        table = self.__build_sor_table(data, execution_timestamp, execution_date)
+
+        if not self.buffer_config.enabled:
+            self.__write_sor_table(table=table, sor_table_name=sor_table_name)
+            return
+
+        self.buffers["sor"].stage_and_flush(
+            table_name=sor_table_name,
+            partition_col="execution_date",
+            table=table,
+            write_table=lambda staged_table: self.__write_sor_table(
+                table=staged_table,
+                sor_table_name=sor_table_name
+            )
+        )
+
+
+    def flush_staged_data(self, table_name: str) -> dict[str, dict[str, int]]:
+        """
+        Adapter to flush the CDC and SoR records staged for a source table on the micro-batch
+        buffers (when they reached one of their thresholds), e.g. on a schedule.
+
+        Args:
+            table_name (str): The name of the source table.
+
+        Returns:
+            dict[str, dict[str, int]]: The metrics of the flush of each output (empty when the
+                micro-batch buffer is disabled).
+        """
+        if not self.buffer_config.enabled:
+            return {}
+
+        cdc_table_name = f"cdc_{table_name}"
+        sor_table_name = f"sor_{table_name}"
+
+        return {
+            "cdc": self.buffers["cdc"].flush(
+                table_name=cdc_table_name,
+                write_table=lambda staged_table: self.__write_cdc_table(
+                    table=staged_table,
+                    cdc_table_name=cdc_table_name,
+                    event_source_service=staged_table.column("event_source_service")[0].as_py()
+                )
+            ),
+            "sor": self.buffers["sor"].flush(
+                table_name=sor_table_name,
+                write_table=lambda staged_table: self.__write_sor_table(
+                    table=staged_table,
+                    sor_table_name=sor_table_name
+                )
+            )
+        }
@@ -0,0 +1,162 @@
+import logging
+from typing import Optional
+
+from app.src.features.cross.domain.interfaces.http_client_adapter import IHTTPClientAdapter
+from app.src.features.cross.domain.interfaces.http_response_cache_interface import IHTTPResponseCache
+from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
+from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+from app.src.features.cross.domain.entities.http_client_stream_response import HTTPClientStreamResponse
+from app.src.features.cross.utils.log import LogUtils
+from app.src.features.cross.utils.date_and_time import DateAndTimeUtils
+from app.src.features.cross.value_objects import Timezone, DateFormat
+
+
+class CachedHTTPClientAdapter(IHTTPClientAdapter):
+    """
+    Implementation of IHTTPClientAdapter that wraps another adapter with a response cache.
+
+    Responses are cached by URL and execution date, so reruns of a batch on the same day (and
+    local parser development) don't hit the network again. Only successful responses are cached.
+
+    Args:
+        http_client_adapter (IHTTPClientAdapter): The adapter used on cache misses.
+        response_cache (IHTTPResponseCache): The cache where the responses are stored.
+        execution_date (Optional[str]): The execution date used on the cache keys. Defaults to
+            the current date in the São Paulo timezone.
+        logger (logging.Logger): The logger used by the adapter.
+    """
+
+    def __init__(
+        self,
+        http_client_adapter: IHTTPClientAdapter,
+        response_cache: IHTTPResponseCache,
+        execution_date: Optional[str] = None,
+        logger: logging.Logger = LogUtils.setup_logger(name=__name__)
+    ):
+        self.http_client_adapter = http_client_adapter
+        self.response_cache = response_cache
+        self.execution_date = execution_date
+        self.logger = logger
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+    def __build_cache_key(self, request_config: HTTPClientRequestConfig) -> str:
+        """
+        Builds the cache key of a request.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+
+        Returns:
+            str: The cache key made of the execution date and the URL.
+        """
+        execution_date = self.execution_date or DateAndTimeUtils.datetime_now_str(
+            timezone=Timezone.SAO_PAULO,
+            format=DateFormat.DATE
+        )
+        return f"{execution_date}|{request_config.url}"
+
+
+    def __cache_response(self, cache_key: str, response: HTTPClientResponse) -> None:
+        """
+        Stores a successful response in the cache. Cache errors never fail the request.
+
+        Args:
+            cache_key (str): The cache key of the response.
+            response (HTTPClientResponse): The HTTP response to be cached.
+        """
+        if response.status_code != 200:
+            return
+
+        try:
+            self.response_cache.put(key=cache_key, response=response)
+        except Exception:
+            self.logger.warning(f"Could not cache the response of {response.url}")
+
+
+    def get(self, request_config: HTTPClientRequestConfig) -> HTTPClientResponse:
+        """
+        Gets the response from the cache or performs a GET request on cache misses.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+
+        Returns:
+            An HTTPClientResponse object representing the response.
+        """
+        cache_key = self.__build_cache_key(request_config=request_config)
+
+        cached_response = self.response_cache.get(key=cache_key)
+        if cached_response is not None:
+            self.cache_hits += 1
+            return cached_response
+
+        self.cache_misses += 1
+        response = self.http_client_adapter.get(request_config=request_config)
+        self.__cache_response(cache_key=cache_key, response=response)
+
+        return response
+
+
+    def stream(
+        self,
+        request_config: HTTPClientRequestConfig,
+        chunk_size: int = 64 * 1024
+    ) -> HTTPClientStreamResponse:
+        """
+        Performs a GET request returning the content as an iterator of chunks. Streamed responses
+        bypass the cache, as their content is never held in memory as a whole.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+            chunk_size (int): The maximum size of each chunk in bytes.
+
+        Returns:
+            An HTTPClientStreamResponse object representing the response.
+        """
+        return self.http_client_adapter.stream(request_config=request_config, chunk_size=chunk_size)
+
+
+    def batch_get(
+        self,
+        request_configs: list[HTTPClientRequestConfig],
+        max_in_flight: int = 10,
+        max_requests_per_second_per_host: Optional[float] = None
+    ) -> list[HTTPClientResponse | Exception]:
+        """
+        Gets the cached responses and performs a batch of GET requests only for the misses.
+
+        Args:
+            request_configs (list[HTTPClientRequestConfig]): Configurations for the HTTP requests.
+            max_in_flight (int): The maximum number of requests running at the same time.
+            max_requests_per_second_per_host (Optional[float]): Optional rate cap applied to each
+                host to avoid being throttled by the target server.
+
+        Returns:
+            A list of HTTPClientResponse objects (or exceptions) in the same order of the input.
+        """
+        cache_keys = [self.__build_cache_key(request_config) for request_config in request_configs]
+        http_responses: list[Optional[HTTPClientResponse | Exception]] = [
+            self.response_cache.get(key=cache_key) for cache_key in cache_keys
+        ]
+
+        missed_idxs = [idx for idx, response in enumerate(http_responses) if response is None]
+        self.cache_hits += len(request_configs) - len(missed_idxs)
+        self.cache_misses += len(missed_idxs)
+        self.logger.info(f"HTTP response cache: {len(request_configs) - len(missed_idxs)} hits and "
+                         f"{len(missed_idxs)} misses")
+
+        if missed_idxs:
+            fetched_responses = self.http_client_adapter.batch_get(
+                request_configs=[request_configs[idx] for idx in missed_idxs],
+                max_in_flight=max_in_flight,
+                max_requests_per_second_per_host=max_requests_per_second_per_host
+            )
+
+            for idx, response in zip(missed_idxs, fetched_responses):
+                http_responses[idx] = response
+                if not isinstance(response, Exception):
+                    self.__cache_response(cache_key=cache_keys[idx], response=response)
+
+        return http_responses
@@ -0,0 +1,189 @@
+import zlib
+import logging
+import threading
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from app.src.features.cross.domain.interfaces.http_client_adapter import IHTTPClientAdapter
+from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
+from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+from app.src.features.cross.domain.entities.http_client_stream_response import HTTPClientStreamResponse
+from app.src.features.cross.utils.log import LogUtils
+
+
+@dataclass(frozen=True)
+class _StoredValidators:
+    """
+    Validators and compressed body of the last successful response of a URL.
+    """
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+    compressed_content: bytes
+    encoding: str
+
+
+class ConditionalHTTPClientAdapter(IHTTPClientAdapter):
+    """
+    Implementation of IHTTPClientAdapter that wraps another adapter sending conditional requests.
+
+    The ETag, Last-Modified, body hash and a zlib compressed copy of the body of the last successful
+    response of each URL are kept in memory (i.e. for the lifetime of a warm container). Following
+    requests to the same URL carry If-None-Match/If-Modified-Since headers and a 304 Not Modified
+    answer is turned back into the stored body, keeping the 304 status so callers can tell it apart.
+
+    Args:
+        http_client_adapter (IHTTPClientAdapter): The adapter used to perform the requests.
+        logger (logging.Logger): The logger used by the adapter.
+    """
+
+    def __init__(
+        self,
+        http_client_adapter: IHTTPClientAdapter,
+        logger: logging.Logger = LogUtils.setup_logger(name=__name__)
+    ):
+        self.http_client_adapter = http_client_adapter
+        self.logger = logger
+        self.not_modified_responses = 0
+        self.__validators: dict[str, _StoredValidators] = {}
+        self.__lock = threading.Lock()
+
+
+    def __build_conditional_request_config(
+        self,
+        request_config: HTTPClientRequestConfig
+    ) -> HTTPClientRequestConfig:
+        """
+        Adds the conditional headers of the stored validators (if any) to a request configuration.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+
+        Returns:
+            HTTPClientRequestConfig: The request configuration with the conditional headers.
+        """
+        with self.__lock:
+            validators = self.__validators.get(request_config.url)
+
+        if validators is None or not (validators.etag or validators.last_modified):
+            return request_config
+
+        headers = dict(request_config.headers or {})
+        if validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+
+        return replace(request_config, headers=headers)
+
+
+    def __handle_response(
+        self,
+        request_config: HTTPClientRequestConfig,
+        response: HTTPClientResponse
+    ) -> HTTPClientResponse:
+        """
+        Stores the validators of successful responses and restores the body of 304 responses.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+            response (HTTPClientResponse): The response returned by the wrapped adapter.
+
+        Returns:
+            HTTPClientResponse: The response with the body restored when it was not modified.
+        """
+        if response.status_code == 304:
+            with self.__lock:
+                validators = self.__validators.get(request_config.url)
+                self.not_modified_responses += 1
+
+            if validators is not None:
+                return replace(
+                    response,
+                    content=zlib.decompress(validators.compressed_content),
+                    encoding=validators.encoding
+                )
+            return response
+
+        if response.status_code == 200:
+            headers = {name.lower(): value for name, value in response.headers.items()}
+            with self.__lock:
+                self.__validators[request_config.url] = _StoredValidators(
+                    etag=headers.get("etag"),
+                    last_modified=headers.get("last-modified"),
+                    content_hash=response.content_hash,
+                    compressed_content=zlib.compress(response.content),
+                    encoding=response.encoding
+                )
+
+        return response
+
+
+    def get(self, request_config: HTTPClientRequestConfig) -> HTTPClientResponse:
+        """
+        Performs a conditional GET request to the specified URL.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+
+        Returns:
+            An HTTPClientResponse object representing the response.
+        """
+        response = self.http_client_adapter.get(
+            request_config=self.__build_conditional_request_config(request_config)
+        )
+
+        return self.__handle_response(request_config=request_config, response=response)
+
+
+    def stream(
+        self,
+        request_config: HTTPClientRequestConfig,
+        chunk_size: int = 64 * 1024
+    ) -> HTTPClientStreamResponse:
+        """
+        Performs a GET request returning the content as an iterator of chunks. Streamed responses
+        are sent unconditionally, as their content is never held in memory as a whole.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+            chunk_size (int): The maximum size of each chunk in bytes.
+
+        Returns:
+            An HTTPClientStreamResponse object representing the response.
+        """
+        return self.http_client_adapter.stream(request_config=request_config, chunk_size=chunk_size)
+
+
+    def batch_get(
+        self,
+        request_configs: list[HTTPClientRequestConfig],
+        max_in_flight: int = 10,
+        max_requests_per_second_per_host: Optional[float] = None
+    ) -> list[HTTPClientResponse | Exception]:
+        """
+        Performs a batch of conditional GET requests using the wrapped adapter.
+
+        Args:
+            request_configs (list[HTTPClientRequestConfig]): Configurations for the HTTP requests.
+            max_in_flight (int): The maximum number of requests running at the same time.
+            max_requests_per_second_per_host (Optional[float]): Optional rate cap applied to each
+                host to avoid being throttled by the target server.
+
+        Returns:
+            A list of HTTPClientResponse objects (or exceptions) in the same order of the input.
+        """
+        http_responses = self.http_client_adapter.batch_get(
+            request_configs=[
+                self.__build_conditional_request_config(request_config)
+                for request_config in request_configs
+            ],
+            max_in_flight=max_in_flight,
+            max_requests_per_second_per_host=max_requests_per_second_per_host
+        )
+
+        return [
+            response if isinstance(response, Exception)
+            else self.__handle_response(request_config=request_config, response=response)
+            for request_config, response in zip(request_configs, http_responses)
+        ]
@@ -0,0 +1,183 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional
+
+from app.src.features.cross.domain.interfaces.http_response_cache_interface import IHTTPResponseCache
+from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+from app.src.features.cross.utils.log import LogUtils
+
+
+# Fraction of the max cache size that is kept after an eviction
+EVICTION_TARGET_RATIO = 0.9
+
+class LocalDiskHTTPResponseCache(IHTTPResponseCache):
+    """
+    Implementation of IHTTPResponseCache that stores gzip compressed responses on local disk.
+
+    Bodies are content addressed (stored once per sha256 of the body under blobs/) and each cache
+    key points to a body through a small JSON entry under entries/. The modification time of the
+    entries is refreshed on every hit, so the least recently used ones are evicted first when the
+    cache grows beyond max_size_bytes.
+
+    Args:
+        cache_dir (str): The directory where the cache is stored.
+        ttl_seconds (int): The time to live of the cache entries in seconds.
+        max_size_bytes (int): The maximum size of the stored bodies in bytes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = os.getenv("HTTP_RESPONSE_CACHE_DIR", "/tmp/http_response_cache"),
+        ttl_seconds: int = int(os.getenv("HTTP_RESPONSE_CACHE_TTL_SECONDS", "86400")),
+        max_size_bytes: int = int(os.getenv("HTTP_RESPONSE_CACHE_MAX_SIZE_BYTES", str(256 * 1024 ** 2)))
+    ):
+        self.logger = LogUtils.setup_logger(name=__name__)
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self.entries_dir = Path(cache_dir) / "entries"
+        self.blobs_dir = Path(cache_dir) / "blobs"
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.__lock = threading.Lock()
+        self.__size_bytes = sum(path.stat().st_size for path in self.blobs_dir.glob("*.gz"))
+
+
+    def __get_entry_path(self, key: str) -> Path:
+        """
+        Returns the path of the JSON entry that represents a cache key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Path: The path of the entry file.
+        """
+        return self.entries_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+
+    def __get_blob_path(self, content_hash: str) -> Path:
+        """
+        Returns the path of the compressed body identified by its content hash.
+
+        Args:
+            content_hash (str): The sha256 of the response body.
+
+        Returns:
+            Path: The path of the blob file.
+        """
+        return self.blobs_dir / f"{content_hash}.gz"
+
+
+    def __evict(self) -> None:
+        """
+        Removes the least recently used entries (and unreferenced blobs) until the cache fits
+        into 90% of max_size_bytes, so the next puts don't trigger a new eviction right away.
+        """
+        entry_paths = sorted(self.entries_dir.glob("*.json"), key=lambda path: path.stat().st_mtime)
+        blob_sizes = {path.stem: path.stat().st_size for path in self.blobs_dir.glob("*.gz")}
+        total_size = sum(blob_sizes.values())
+        target_size = int(self.max_size_bytes * EVICTION_TARGET_RATIO)
+
+        referenced_hashes: dict[str, int] = {}
+        entries: list[tuple[Path, str]] = []
+        for entry_path in entry_paths:
+            content_hash = json.loads(entry_path.read_text())["content_hash"]
+            referenced_hashes[content_hash] = referenced_hashes.get(content_hash, 0) + 1
+            entries.append((entry_path, content_hash))
+
+        # Blobs that are not referenced by any entry are removed straight away
+        for content_hash in set(blob_sizes) - set(referenced_hashes):
+            self.__get_blob_path(content_hash).unlink(missing_ok=True)
+            total_size -= blob_sizes.pop(content_hash)
+
+        for entry_path, content_hash in entries:
+            if total_size <= target_size:
+                break
+
+            entry_path.unlink(missing_ok=True)
+            referenced_hashes[content_hash] -= 1
+            if referenced_hashes[content_hash] == 0:
+                self.__get_blob_path(content_hash).unlink(missing_ok=True)
+                total_size -= blob_sizes.pop(content_hash, 0)
+
+        self.__size_bytes = total_size
+
+
+    def get(self, key: str) -> Optional[HTTPClientResponse]:
+        """
+        Gets a cached HTTP response from local disk.
+
+        Args:
+            key (str): The cache key of the response.
+
+        Returns:
+            The cached HTTPClientResponse or None if there is no valid (not expired) entry.
+        """
+        entry_path = self.__get_entry_path(key)
+
+        with self.__lock:
+            try:
+                entry = json.loads(entry_path.read_text())
+                if time.time() - entry["created_at"] > self.ttl_seconds:
+                    entry_path.unlink(missing_ok=True)
+                    return None
+
+                content = gzip.decompress(self.__get_blob_path(entry["content_hash"]).read_bytes())
+                os.utime(entry_path)  # Refreshing the LRU position of the entry
+
+            except FileNotFoundError:
+                return None
+
+            except Exception:
+                self.logger.exception(f"Error reading cached response for key {key}. Ignoring it.")
+                entry_path.unlink(missing_ok=True)
+                return None
+
+        return HTTPClientResponse(
+            url=entry["url"],
+            status_code=entry["status_code"],
+            content=content,
+            encoding=entry["encoding"],
+            elapsed_time=0.0
+        )
+
+
+    def put(self, key: str, response: HTTPClientResponse) -> None:
+        """
+        Stores an HTTP response on local disk.
+
+        Args:
+            key (str): The cache key of the response.
+            response (HTTPClientResponse): The HTTP response to be cached.
+        """
+        content_hash = response.content_hash
+        entry = {
+            "url": response.url,
+            "status_code": response.status_code,
+            "encoding": response.encoding,
+            "content_hash": content_hash,
+            "created_at": time.time()
+        }
+
+        with self.__lock:
+            try:
+                blob_path = self.__get_blob_path(content_hash)
+                if not blob_path.exists():
+                    compressed_content = gzip.compress(response.content)
+                    blob_path.write_bytes(compressed_content)
+                    self.__size_bytes += len(compressed_content)
+
+                self.__get_entry_path(key).write_text(json.dumps(entry))
+
+                # Scanning the cache directory only when the size limit is exceeded
+                if self.__size_bytes > self.max_size_bytes:
+                    self.__evict()
+
+            except Exception:
+                self.logger.exception(f"Error caching response for key {key}")
+                raise
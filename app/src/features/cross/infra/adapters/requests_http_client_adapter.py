@@ -1,77 +1,442 @@
+import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
 
 import requests
 
 from app.src.features.cross.utils.log import LogUtils
 from app.src.features.cross.domain.interfaces.http_client_adapter import IHTTPClientAdapter
 from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
+from app.src.features.cross.domain.entities.http_client_retry_config import HTTPClientRetryConfig
 from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+from app.src.features.cross.domain.entities.http_client_stream_response import HTTPClientStreamResponse
+from app.src.features.cross.domain.entities.http_client_rate_limit_config import (
+    HTTPClientRateLimitConfig
+)
+from app.src.features.cross.domain.entities.http_client_circuit_breaker_config import (
+    HTTPClientCircuitBreakerConfig
+)
+from app.src.features.cross.infra.resilience.adaptive_rate_limiter import AdaptiveRateLimiter
+from app.src.features.cross.infra.resilience.circuit_breaker import CircuitBreaker
+
+
+class RequestsSessionRegistry:
+    """
+    Long-lived registry of requests sessions keyed by retry configuration and host.
+
+    Sessions are kept at module level so their connection pools (and the TCP/TLS connections
+    kept alive inside them) are reused across calls and across warm AWS Lambda invocations.
+
+    Args:
+        pool_maxsize (int): The maximum number of connections kept alive per host pool.
+    """
+
+    def __init__(self, pool_maxsize: int = 10):
+        self.pool_maxsize = pool_maxsize
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self.__sessions: dict[tuple, requests.Session] = {}
+        self.__lock = threading.Lock()
+
+
+    @staticmethod
+    def build_session_key(request_config: HTTPClientRequestConfig) -> tuple:
+        """
+        Builds the key that identifies a reusable session for a given request configuration.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+
+        Returns:
+            A hashable tuple made of the retry configuration values and the URL scheme and host.
+        """
+        retry_config = request_config.retry_config or HTTPClientRetryConfig()
+        url_parts = urlsplit(request_config.url)
+
+        return (
+            retry_config.num_retries,
+            retry_config.backoff_factor,
+            tuple(retry_config.status_forcelist or ()),
+            url_parts.scheme,
+            url_parts.netloc
+        )
+
+
+    def get_session(self, request_config: HTTPClientRequestConfig) -> requests.Session:
+        """
+        Returns a pooled session for the request configuration, creating it on the first use.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+
+        Returns:
+            A requests.Session with retries and connection pooling already mounted.
+        """
+        session_key = self.build_session_key(request_config=request_config)
+
+        with self.__lock:
+            session = self.__sessions.get(session_key)
+            if session is not None:
+                self.pool_hits += 1
+                return session
+
+            self.pool_misses += 1
+            retry_config = request_config.retry_config or HTTPClientRetryConfig()
+            retry = requests.adapters.Retry(
+                total=retry_config.num_retries,
+                backoff_factor=retry_config.backoff_factor,
+                status_forcelist=retry_config.status_forcelist
+            )
+
+            http_adapter = requests.adapters.HTTPAdapter(
+                max_retries=retry,
+                pool_connections=1,
+                pool_maxsize=self.pool_maxsize
+            )
+
+            session = requests.Session()
+            session.mount("https://", http_adapter)
+            session.mount("http://", http_adapter)
+
+            self.__sessions[session_key] = session
+            return session
+
+
+    def get_pool_stats(self) -> dict:
+        """
+        Returns the counters of the registry so they can be logged.
+
+        Returns:
+            A dictionary with the number of sessions, pool hits and pool misses.
+        """
+        with self.__lock:
+            return {
+                "sessions": len(self.__sessions),
+                "pool_maxsize": self.pool_maxsize,
+                "pool_hits": self.pool_hits,
+                "pool_misses": self.pool_misses
+            }
+
+
+    def close(self) -> None:
+        """
+        Closes all the registered sessions and releases their pooled connections.
+        """
+        with self.__lock:
+            for session in self.__sessions.values():
+                session.close()
+            self.__sessions.clear()
+
+
+# Module level registry shared by every adapter instance living in the same container
+SESSION_REGISTRY = RequestsSessionRegistry(
+    pool_maxsize=int(os.getenv("HTTP_CLIENT_POOL_MAXSIZE", "10"))
+)
 
 
 class RequestsHTTPClientAdapter(IHTTPClientAdapter):
     """
     Implementation of IHTTPClientAdapter that uses the requests library to make HTTP requests.
+
+    Each host gets its own adaptive rate limiter and circuit breaker, shared by every thread using
+    the adapter (and by every warm invocation, as adapters are created once per container).
+
+    Args:
+        logger (logging.Logger): The logger used by the adapter.
+        session_registry (RequestsSessionRegistry): The registry of pooled sessions to use.
+        rate_limit_config (Optional[HTTPClientRateLimitConfig]): The configuration of the per host
+            rate limiters. None disables rate limiting.
+        circuit_breaker_config (Optional[HTTPClientCircuitBreakerConfig]): The configuration of the
+            per host circuit breakers. None disables the circuit breakers.
     """
 
-    def __init__(self, logger: logging.Logger = LogUtils.setup_logger(name=__name__)):
+    def __init__(
+        self,
+        logger: logging.Logger = LogUtils.setup_logger(name=__name__),
+        session_registry: RequestsSessionRegistry = SESSION_REGISTRY,
+        rate_limit_config: Optional[HTTPClientRateLimitConfig] = HTTPClientRateLimitConfig(),
+        circuit_breaker_config: Optional[HTTPClientCircuitBreakerConfig] = (
+            HTTPClientCircuitBreakerConfig()
+        )
+    ):
         self.logger = logger
+        self.session_registry = session_registry
+        self.rate_limit_config = rate_limit_config
+        self.circuit_breaker_config = circuit_breaker_config
+        self.__rate_limiters: dict[str, AdaptiveRateLimiter] = {}
+        self.__circuit_breakers: dict[str, CircuitBreaker] = {}
+        self.__resilience_lock = threading.Lock()
 
 
-    def get(self, request_config: HTTPClientRequestConfig) -> HTTPClientResponse:
+    def get_pool_stats(self) -> dict:
         """
-        Performs a GET request to the specified URL with optional headers and parameters.
+        Returns the session pool counters of the adapter.
+
+        Returns:
+            A dictionary with the number of sessions, pool hits and pool misses.
+        """
+        return self.session_registry.get_pool_stats()
+
+
+    def log_pool_stats(self) -> None:
+        """
+        Logs the session pool counters of the adapter.
+        """
+        self.logger.info(f"HTTP session pool stats: {self.get_pool_stats()}")
+
+
+    def __get_rate_limiter(self, host: str) -> Optional[AdaptiveRateLimiter]:
+        """
+        Returns the rate limiter of a host, creating it on the first use.
 
         Args:
-            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+            host (str): The host (netloc) of the request.
 
         Returns:
-            An HTTPClientResponse object representing the response.
+            Optional[AdaptiveRateLimiter]: The rate limiter of the host or None if disabled (and not
+                capped by a batch).
+        """
+        with self.__resilience_lock:
+            if host not in self.__rate_limiters and self.rate_limit_config is not None:
+                self.__rate_limiters[host] = AdaptiveRateLimiter(config=self.rate_limit_config)
+            return self.__rate_limiters.get(host)
+
+
+    def __cap_rate(self, host: str, max_rate: float) -> None:
         """
+        Caps the rate of the requests sent to a host. With rate limiting disabled, the host gets a
+        fixed rate limiter (no burst, no adaptive increase or decrease) at the capped rate.
 
-        # Create a request session
-        session = requests.Session()
+        Args:
+            host (str): The host (netloc) of the requests.
+            max_rate (float): The maximum number of requests per second.
+        """
+        if self.rate_limit_config is not None:
+            self.__get_rate_limiter(host=host).cap_rate(max_rate=max_rate)
+            return
 
-        # Set retry configuration for the session
-        retry_config = requests.adapters.Retry(
-            total=request_config.retry_config.num_retries,
-            backoff_factor=request_config.retry_config.backoff_factor,
-            status_forcelist=request_config.retry_config.status_forcelist
+        fixed_rate_config = HTTPClientRateLimitConfig(
+            initial_rate=max_rate,
+            min_rate=max_rate,
+            max_rate=max_rate,
+            burst=1.0,
+            additive_increase=0.0,
+            multiplicative_decrease=1.0
         )
+        with self.__resilience_lock:
+            self.__rate_limiters[host] = AdaptiveRateLimiter(config=fixed_rate_config)
 
-        http_adapter = requests.adapters.HTTPAdapter(max_retries=retry_config)
-        session.mount("https://", http_adapter)
-        session.mount("http://", http_adapter)
+
+    def __get_circuit_breaker(self, host: str) -> Optional[CircuitBreaker]:
+        """
+        Returns the circuit breaker of a host, creating it on the first use.
+
+        Args:
+            host (str): The host (netloc) of the request.
+
+        Returns:
+            Optional[CircuitBreaker]: The circuit breaker of the host or None if disabled.
+        """
+        if self.circuit_breaker_config is None:
+            return None
+
+        with self.__resilience_lock:
+            if host not in self.__circuit_breakers:
+                self.__circuit_breakers[host] = CircuitBreaker(
+                    name=host,
+                    config=self.circuit_breaker_config
+                )
+            return self.__circuit_breakers[host]
+
+
+    def get_rate_limiter_metrics(self) -> dict:
+        """
+        Returns the state of the rate limiters and circuit breakers of every host.
+
+        Returns:
+            A dictionary keyed by host with the rate limiter and circuit breaker metrics.
+        """
+        with self.__resilience_lock:
+            hosts = set(self.__rate_limiters) | set(self.__circuit_breakers)
+            rate_limiters = dict(self.__rate_limiters)
+            circuit_breakers = dict(self.__circuit_breakers)
+
+        return {
+            host: {
+                "rate_limiter": rate_limiters[host].get_metrics() if host in rate_limiters else None,
+                "circuit_breaker": (
+                    circuit_breakers[host].get_metrics() if host in circuit_breakers else None
+                )
+            }
+            for host in hosts
+        }
+
+
+    def log_rate_limiter_metrics(self) -> None:
+        """
+        Logs the state of the rate limiters and circuit breakers of every host.
+        """
+        self.logger.info(f"HTTP rate limiter metrics: {self.get_rate_limiter_metrics()}")
+
+
+    def __send(self, request_config: HTTPClientRequestConfig, stream: bool = False) -> requests.Response:
+        """
+        Sends a GET request through the circuit breaker and the rate limiter of the host.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+            stream (bool): Whether to defer reading the response content.
+
+        Returns:
+            requests.Response: The response of the request.
+        """
+
+        host = urlsplit(request_config.url).netloc
+        rate_limiter = self.__get_rate_limiter(host=host)
+        circuit_breaker = self.__get_circuit_breaker(host=host)
+
+        # Failing fast (without waiting for a token) while the host is down
+        if circuit_breaker:
+            circuit_breaker.before_call()
+
+        if rate_limiter:
+            rate_limiter.acquire()
+
+        # Getting a pooled session that keeps connections alive between requests
+        session = self.session_registry.get_session(request_config=request_config)
 
         try:
             r = session.get(
                 url=request_config.url,
                 headers=request_config.headers,
                 timeout=request_config.timeout,
+                stream=stream,
                 **request_config.request_kwargs
             )
 
-        except requests.Timeout as to_error:
-            self.logger.exception(
-                msg=f"Timeout error while accessing URL: {request_config.url}",
-                exc_info=to_error
-            )
+        except Exception as error:
+            if rate_limiter:
+                rate_limiter.record(status_code=None, elapsed_time=None)
+            if circuit_breaker:
+                circuit_breaker.record_failure()
 
-        except requests.ConnectionError as conn_error:
-            self.logger.exception(
-                msg=f"Connection error while accessing URL: {request_config.url}",
-                exc_info=conn_error
-            )
+            if isinstance(error, requests.Timeout):
+                self.logger.exception(f"Timeout error while accessing URL: {request_config.url}")
+            elif isinstance(error, requests.ConnectionError):
+                self.logger.exception(f"Connection error while accessing URL: {request_config.url}")
+            elif isinstance(error, requests.HTTPError):
+                self.logger.exception(f"HTTP error while accessing URL: {request_config.url}")
+            raise
 
-        except requests.HTTPError as http_error:
-            self.logger.exception(
-                msg=f"HTTP error while accessing URL: {request_config.url}",
-                exc_info=http_error
-            )
+        if rate_limiter:
+            rate_limiter.record(status_code=r.status_code, elapsed_time=r.elapsed.total_seconds())
+        if circuit_breaker:
+            if r.status_code >= 500:
+                circuit_breaker.record_failure()
+            else:
+                circuit_breaker.record_success()
+
+        return r
+
+
+    def get(self, request_config: HTTPClientRequestConfig) -> HTTPClientResponse:
+        """
+        Performs a GET request to the specified URL with optional headers and parameters.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+
+        Returns:
+            An HTTPClientResponse object representing the response.
+        """
+        r = self.__send(request_config=request_config)
 
         return HTTPClientResponse(
             url=r.url,
             status_code=r.status_code,
             content=r.content,
             encoding=r.encoding,
-            elapsed_time=r.elapsed.total_seconds()
+            elapsed_time=r.elapsed.total_seconds(),
+            headers=dict(r.headers)
+        )
+
+
+    def stream(
+        self,
+        request_config: HTTPClientRequestConfig,
+        chunk_size: int = 64 * 1024
+    ) -> HTTPClientStreamResponse:
+        """
+        Performs a GET request returning the content as an iterator of chunks read from the
+        connection, without buffering the whole content in memory.
+
+        Args:
+            request_config (HTTPClientRequestConfig): Configuration for the HTTP request.
+            chunk_size (int): The maximum size of each chunk in bytes.
+
+        Returns:
+            An HTTPClientStreamResponse object representing the response.
+        """
+        r = self.__send(request_config=request_config, stream=True)
+
+        def iter_chunks() -> Iterator[bytes]:
+            # Releasing the connection back to the pool even if the consumer stops early
+            try:
+                yield from r.iter_content(chunk_size=chunk_size)
+            finally:
+                r.close()
+
+        return HTTPClientStreamResponse(
+            url=r.url,
+            status_code=r.status_code,
+            encoding=r.encoding,
+            chunks=iter_chunks(),
+            headers=dict(r.headers),
+            release_connection=r.close
         )
+
+
+    def batch_get(
+        self,
+        request_configs: list[HTTPClientRequestConfig],
+        max_in_flight: int = 10,
+        max_requests_per_second_per_host: Optional[float] = None
+    ) -> list[HTTPClientResponse | Exception]:
+        """
+        Performs a batch of GET requests overlapping their network I/O on a thread pool.
+
+        Args:
+            request_configs (list[HTTPClientRequestConfig]): Configurations for the HTTP requests.
+            max_in_flight (int): The maximum number of requests running at the same time.
+            max_requests_per_second_per_host (Optional[float]): Optional rate cap applied to each
+                host on top of its adaptive rate limiter (or as a fixed rate when rate limiting is
+                disabled).
+
+        Returns:
+            A list of HTTPClientResponse objects (or exceptions) in the same order of the input.
+        """
+
+        def get_or_error(request_config: HTTPClientRequestConfig) -> HTTPClientResponse | Exception:
+            try:
+                return self.get(request_config=request_config)
+
+            except Exception as e:
+                return e
+
+        if not request_configs:
+            return []
+
+        if max_requests_per_second_per_host:
+            for host in {urlsplit(request_config.url).netloc for request_config in request_configs}:
+                self.__cap_rate(host=host, max_rate=max_requests_per_second_per_host)
+
+        num_workers = max(1, min(max_in_flight, len(request_configs)))
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            http_responses = list(executor.map(get_or_error, request_configs))
+
+        self.log_pool_stats()
+        self.log_rate_limiter_metrics()
+        return http_responses
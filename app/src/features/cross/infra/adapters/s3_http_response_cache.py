@@ -0,0 +1,144 @@
+import os
+import gzip
+import json
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional
+
+import boto3
+
+from app.src.features.cross.domain.interfaces.http_response_cache_interface import IHTTPResponseCache
+from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+from app.src.features.cross.utils.log import LogUtils
+
+
+class S3HTTPResponseCache(IHTTPResponseCache):
+    """
+    Implementation of IHTTPResponseCache that stores gzip compressed responses on S3 (or any S3
+    compatible storage through endpoint_url).
+
+    Bodies are content addressed under {prefix}/blobs/{sha256}.gz and each cache key is a small
+    JSON object under {prefix}/entries/ pointing to its body. Entries older than ttl_seconds are
+    ignored; size limits and eviction are expected to be handled by a bucket lifecycle rule.
+
+    Args:
+        bucket_name (str): The name of the bucket where the cache is stored.
+        prefix (str): The key prefix of the cache objects.
+        ttl_seconds (int): The time to live of the cache entries in seconds.
+        endpoint_url (Optional[str]): Optional endpoint of an S3 compatible storage.
+    """
+
+    def __init__(
+        self,
+        bucket_name: str = os.getenv("HTTP_RESPONSE_CACHE_BUCKET_NAME"),
+        prefix: str = os.getenv("HTTP_RESPONSE_CACHE_PREFIX", "http_response_cache"),
+        ttl_seconds: int = int(os.getenv("HTTP_RESPONSE_CACHE_TTL_SECONDS", "86400")),
+        endpoint_url: Optional[str] = os.getenv("HTTP_RESPONSE_CACHE_ENDPOINT_URL")
+    ):
+        self.logger = LogUtils.setup_logger(name=__name__)
+        self.bucket_name = bucket_name
+        self.prefix = prefix.strip("/")
+        self.ttl_seconds = ttl_seconds
+        self.client = boto3.client(
+            "s3",
+            region_name=boto3.session.Session().region_name,
+            endpoint_url=endpoint_url
+        )
+
+
+    def __get_entry_key(self, key: str) -> str:
+        """
+        Returns the object key of the JSON entry that represents a cache key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str: The object key of the entry.
+        """
+        return f"{self.prefix}/entries/{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+
+    def __get_blob_key(self, content_hash: str) -> str:
+        """
+        Returns the object key of the compressed body identified by its content hash.
+
+        Args:
+            content_hash (str): The sha256 of the response body.
+
+        Returns:
+            str: The object key of the blob.
+        """
+        return f"{self.prefix}/blobs/{content_hash}.gz"
+
+
+    def get(self, key: str) -> Optional[HTTPClientResponse]:
+        """
+        Gets a cached HTTP response from S3.
+
+        Args:
+            key (str): The cache key of the response.
+
+        Returns:
+            The cached HTTPClientResponse or None if there is no valid (not expired) entry.
+        """
+        try:
+            entry_object = self.client.get_object(Bucket=self.bucket_name, Key=self.__get_entry_key(key))
+            age = datetime.now(timezone.utc) - entry_object["LastModified"]
+            if age.total_seconds() > self.ttl_seconds:
+                return None
+
+            entry = json.loads(entry_object["Body"].read())
+            blob_object = self.client.get_object(
+                Bucket=self.bucket_name,
+                Key=self.__get_blob_key(entry["content_hash"])
+            )
+            content = gzip.decompress(blob_object["Body"].read())
+
+        except self.client.exceptions.NoSuchKey:
+            return None
+
+        except Exception:
+            self.logger.exception(f"Error reading cached response for key {key}. Ignoring it.")
+            return None
+
+        return HTTPClientResponse(
+            url=entry["url"],
+            status_code=entry["status_code"],
+            content=content,
+            encoding=entry["encoding"],
+            elapsed_time=0.0
+        )
+
+
+    def put(self, key: str, response: HTTPClientResponse) -> None:
+        """
+        Stores an HTTP response on S3.
+
+        Args:
+            key (str): The cache key of the response.
+            response (HTTPClientResponse): The HTTP response to be cached.
+        """
+        content_hash = response.content_hash
+        entry = {
+            "url": response.url,
+            "status_code": response.status_code,
+            "encoding": response.encoding,
+            "content_hash": content_hash
+        }
+
+        try:
+            self.client.put_object(
+                Bucket=self.bucket_name,
+                Key=self.__get_blob_key(content_hash),
+                Body=gzip.compress(response.content)
+            )
+            self.client.put_object(
+                Bucket=self.bucket_name,
+                Key=self.__get_entry_key(key),
+                Body=json.dumps(entry).encode("utf-8"),
+                ContentType="application/json"
+            )
+        except Exception:
+            self.logger.exception(f"Error caching response for key {key}")
+            raise
@@ -0,0 +1,387 @@
+import io
+import uuid
+import logging
+from collections import defaultdict
+from datetime import datetime, UTC
+from typing import Any, Callable, Optional
+
+import boto3
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from botocore.exceptions import ClientError
+
+from app.src.features.cross.domain.entities.micro_batch_buffer_config import MicroBatchBufferConfig
+from app.src.features.cross.utils.log import LogUtils
+
+
+# Extension of the staged objects (Snappy compressed Parquet written from the Arrow tables)
+STAGED_OBJECT_SUFFIX = ".snappy.parquet"
+
+# Name of the object used as the flush lock of a table
+FLUSH_LOCK_NAME = "_flush.lock"
+
+# Maximum number of keys accepted by a single DeleteObjects call
+MAX_DELETE_OBJECTS_KEYS = 1000
+
+# Error codes returned by S3 when a conditional write (If-None-Match) finds an existing object
+LOCK_CONFLICT_ERROR_CODES = ("PreconditionFailed", "ConditionalRequestConflict")
+
+
+class S3MicroBatchBuffer:
+    """
+    Buffers records on an S3 staging prefix and flushes them in micro-batches.
+
+    Each invocation stages its Arrow table as a single Parquet object per partition (keeping the
+    declared column types), which is a cheap PUT with no catalog sync. Once the staged objects of
+    a table reach a size threshold, or the oldest one reaches an age threshold, the invocation that
+    notices it takes the flush lock of the table (a conditional PUT), reads the staged tables of
+    each partition and hands them to the writer of the dataset in one go, so each partition gets a
+    single right-sized file per flush instead of one small file per invocation. The staged objects
+    of a partition are deleted right after it is written, so a failed flush is resumed by the next
+    one.
+
+    Args:
+        bucket_name (str): The bucket where the records are staged.
+        config (MicroBatchBufferConfig): The staging prefix and flush thresholds of the buffer.
+        client (Optional[Any]): The low level boto3 S3 client. Created on first use when not
+            provided.
+        logger (logging.Logger): The logger used by the buffer.
+    """
+
+    def __init__(
+        self,
+        bucket_name: str,
+        config: MicroBatchBufferConfig = MicroBatchBufferConfig(),
+        client: Optional[Any] = None,
+        logger: logging.Logger = LogUtils.setup_logger(name=__name__)
+    ):
+        self.bucket_name = bucket_name
+        self.config = config
+        self.client = client
+        self.logger = logger
+        # ETags of the flush locks held by this buffer, keyed by table
+        self.lock_etags: dict[str, str] = {}
+
+
+    def __get_client(self) -> Any:
+        """
+        Returns the boto3 S3 client, creating it on first use.
+
+        Returns:
+            The low level boto3 S3 client.
+        """
+        if self.client is None:
+            self.client = boto3.client("s3")
+
+        return self.client
+
+
+    def __get_table_prefix(self, table_name: str) -> str:
+        """
+        Builds the staging prefix of a table.
+
+        Args:
+            table_name (str): The name of the target table.
+
+        Returns:
+            str: The staging prefix of the table, ending with a slash.
+        """
+        return f"{self.config.staging_prefix.strip('/')}/{table_name}/"
+
+
+    def stage(self, table_name: str, partition_col: str, table: pa.Table) -> list[str]:
+        """
+        Stages the rows of a table, writing a single Parquet object per partition.
+
+        Args:
+            table_name (str): The name of the target table.
+            partition_col (str): The column used to partition the target table.
+            table (pa.Table): The rows to stage.
+
+        Returns:
+            list[str]: The keys of the staged objects.
+        """
+        client = self.__get_client()
+        staged_at = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+
+        staged_keys = []
+        for partition_value in pc.unique(table.column(partition_col)).to_pylist():
+            key = (f"{self.__get_table_prefix(table_name)}{partition_col}={partition_value}/"
+                   f"{staged_at}-{uuid.uuid4().hex}{STAGED_OBJECT_SUFFIX}")
+
+            body = io.BytesIO()
+            pq.write_table(
+                table.filter(pc.equal(table.column(partition_col), partition_value)),
+                body,
+                compression="snappy"
+            )
+
+            client.put_object(Bucket=self.bucket_name, Key=key, Body=body.getvalue())
+            staged_keys.append(key)
+
+        return staged_keys
+
+
+    def list_staged_objects(self, table_name: str) -> list[dict[str, Any]]:
+        """
+        Lists the staged objects of a table.
+
+        Args:
+            table_name (str): The name of the target table.
+
+        Returns:
+            list[dict[str, Any]]: The S3 object summaries (Key, Size, LastModified, ...).
+        """
+        paginator = self.__get_client().get_paginator("list_objects_v2")
+
+        staged_objects = []
+        table_prefix = self.__get_table_prefix(table_name)
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=table_prefix):
+            staged_objects.extend(
+                staged_object for staged_object in page.get("Contents", [])
+                if staged_object["Key"].endswith(STAGED_OBJECT_SUFFIX)
+            )
+
+        return staged_objects
+
+
+    def should_flush(self, staged_objects: list[dict[str, Any]]) -> bool:
+        """
+        Checks whether the staged objects of a table reached the size or the age threshold.
+
+        Args:
+            staged_objects (list[dict[str, Any]]): The staged objects of the table.
+
+        Returns:
+            bool: True when the staged objects should be flushed.
+        """
+        if not staged_objects:
+            return False
+
+        staged_bytes = sum(staged_object["Size"] for staged_object in staged_objects)
+        oldest_staged_at = min(staged_object["LastModified"] for staged_object in staged_objects)
+        buffer_age_seconds = (datetime.now(UTC) - oldest_staged_at).total_seconds()
+
+        return (
+            staged_bytes >= self.config.max_buffer_bytes or
+            buffer_age_seconds >= self.config.max_buffer_age_seconds
+        )
+
+
+    def __put_lock(self, table_name: str, **condition: str) -> bool:
+        """
+        Writes the flush lock of a table with a conditional PUT. The lock holds a unique token, so
+        each write gets its own ETag.
+
+        Args:
+            table_name (str): The name of the target table.
+            **condition (str): The condition of the PUT (IfNoneMatch="*" for a new lock, or
+                IfMatch=<ETag> to replace a given lock).
+
+        Returns:
+            bool: True when the lock was written, False when the condition failed.
+        """
+        try:
+            response = self.__get_client().put_object(
+                Bucket=self.bucket_name,
+                Key=f"{self.__get_table_prefix(table_name)}{FLUSH_LOCK_NAME}",
+                Body=uuid.uuid4().hex.encode("utf-8"),
+                **condition
+            )
+        except ClientError as error:
+            if error.response.get("Error", {}).get("Code") not in LOCK_CONFLICT_ERROR_CODES:
+                raise
+            return False
+
+        self.lock_etags[table_name] = response["ETag"]
+        return True
+
+
+    def __acquire_lock(self, table_name: str) -> bool:
+        """
+        Takes the flush lock of a table with a conditional PUT, replacing abandoned locks.
+
+        An abandoned lock is replaced with a PUT conditioned on its ETag, so when several
+        invocations find the same abandoned lock only one of them takes it.
+
+        Args:
+            table_name (str): The name of the target table.
+
+        Returns:
+            bool: True when the lock was taken, False when another invocation holds it.
+        """
+        for _ in range(2):
+            if self.__put_lock(table_name, IfNoneMatch="*"):
+                return True
+
+            try:
+                lock_object = self.__get_client().head_object(
+                    Bucket=self.bucket_name,
+                    Key=f"{self.__get_table_prefix(table_name)}{FLUSH_LOCK_NAME}"
+                )
+            except ClientError:
+                # The lock was released in the meantime
+                continue
+
+            lock_age_seconds = (datetime.now(UTC) - lock_object["LastModified"]).total_seconds()
+            if lock_age_seconds < self.config.lock_timeout_seconds:
+                return False
+
+            self.logger.warning(f"Replacing the abandoned flush lock of table {table_name} "
+                                f"({lock_age_seconds:.0f} seconds old)")
+            return self.__put_lock(table_name, IfMatch=lock_object["ETag"])
+
+        return False
+
+
+    def __release_lock(self, table_name: str) -> None:
+        """
+        Releases the flush lock of a table, unless it was replaced by another invocation (after
+        this one took longer than the lock timeout).
+
+        Args:
+            table_name (str): The name of the target table.
+        """
+        try:
+            self.__get_client().delete_object(
+                Bucket=self.bucket_name,
+                Key=f"{self.__get_table_prefix(table_name)}{FLUSH_LOCK_NAME}",
+                IfMatch=self.lock_etags.pop(table_name)
+            )
+        except ClientError as error:
+            if error.response.get("Error", {}).get("Code") not in LOCK_CONFLICT_ERROR_CODES:
+                raise
+            self.logger.warning(f"The flush lock of table {table_name} was taken by another invocation")
+
+
+    def __read_table(self, keys: list[str]) -> pa.Table:
+        """
+        Reads the rows of staged objects.
+
+        Args:
+            keys (list[str]): The keys of the staged objects.
+
+        Returns:
+            pa.Table: The staged rows, in the order of the keys.
+        """
+        client = self.__get_client()
+
+        tables = [
+            pq.read_table(io.BytesIO(client.get_object(Bucket=self.bucket_name, Key=key)["Body"].read()))
+            for key in keys
+        ]
+
+        return pa.concat_tables(tables, promote_options="permissive")
+
+
+    def __delete_objects(self, keys: list[str]) -> None:
+        """
+        Deletes staged objects.
+
+        Args:
+            keys (list[str]): The keys of the objects to delete.
+        """
+        client = self.__get_client()
+        for idx in range(0, len(keys), MAX_DELETE_OBJECTS_KEYS):
+            client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={
+                    "Objects": [{"Key": key} for key in keys[idx:idx + MAX_DELETE_OBJECTS_KEYS]],
+                    "Quiet": True
+                }
+            )
+
+
+    def flush(
+        self,
+        table_name: str,
+        write_table: Callable[[pa.Table], None],
+        force: bool = False
+    ) -> dict[str, int]:
+        """
+        Writes the staged rows of a table, one partition at a time, when the buffer reached one of
+        its thresholds (or when forced) and no other invocation is flushing it.
+
+        Args:
+            table_name (str): The name of the target table.
+            write_table (Callable[[pa.Table], None]): The function writing the rows of a partition
+                to the dataset.
+            force (bool): Whether the thresholds are ignored.
+
+        Returns:
+            dict[str, int]: The metrics of the flush, with the number of staged objects and bytes
+                and the number of flushed partitions and records.
+        """
+        staged_objects = self.list_staged_objects(table_name)
+        metrics = {
+            "staged_objects": len(staged_objects),
+            "staged_bytes": sum(staged_object["Size"] for staged_object in staged_objects),
+            "flushed_partitions": 0,
+            "flushed_records": 0
+        }
+
+        if not staged_objects or not (force or self.should_flush(staged_objects)):
+            return metrics
+
+        if not self.__acquire_lock(table_name):
+            self.logger.info(f"Table {table_name} is being flushed by another invocation")
+            return metrics
+
+        try:
+            # Listing again under the lock, so the objects flushed by a previous holder are skipped
+            partition_keys: dict[str, list[str]] = defaultdict(list)
+            for staged_object in self.list_staged_objects(table_name):
+                partition_dir = staged_object["Key"].rsplit("/", 1)[0]
+                partition_keys[partition_dir].append(staged_object["Key"])
+
+            for partition_dir, keys in partition_keys.items():
+                table = self.__read_table(sorted(keys))
+                write_table(table)
+                self.__delete_objects(keys)
+
+                metrics["flushed_partitions"] += 1
+                metrics["flushed_records"] += table.num_rows
+
+        except Exception:
+            self.logger.exception(f"Error flushing the staged records of table {table_name}")
+            raise
+
+        finally:
+            self.__release_lock(table_name)
+
+        self.logger.info(f"Flushed the staged records of table {table_name}: {metrics}")
+        return metrics
+
+
+    def stage_and_flush(
+        self,
+        table_name: str,
+        partition_col: str,
+        table: pa.Table,
+        write_table: Callable[[pa.Table], None]
+    ) -> dict[str, int]:
+        """
+        Stages the rows of a table and flushes the buffer when it reached one of its thresholds.
+
+        Flush errors are logged and not raised: the rows are already staged, so raising would make
+        the stream retry the batch and stage them again (duplicating them on the dataset). The
+        staged objects that weren't flushed are kept for the next flush.
+
+        Args:
+            table_name (str): The name of the target table.
+            partition_col (str): The column used to partition the target table.
+            table (pa.Table): The rows to stage.
+            write_table (Callable[[pa.Table], None]): The function writing the rows of a partition
+                to the dataset.
+
+        Returns:
+            dict[str, int]: The metrics of the flush (with flush_failed set when it failed).
+        """
+        self.stage(table_name=table_name, partition_col=partition_col, table=table)
+
+        try:
+            return self.flush(table_name=table_name, write_table=write_table)
+        except Exception:
+            self.logger.warning(f"The staged records of table {table_name} are kept for the next flush")
+            return {"flush_failed": 1}
@@ -0,0 +1,267 @@
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+import pyarrow as pa
+
+from app.src.features.cross.domain.entities.dynamodb_streams_output_data import DynamoDBStreamsOutputData
+from app.src.features.cross.infra.mappers.dynamodb_table_arrow_schemas import (
+    DynamoDBTableArrowSchema,
+    DYNAMODB_TABLE_ARROW_SCHEMAS,
+    JSON_MAP_TYPE
+)
+from app.src.features.cross.utils.log import LogUtils
+
+
+# Arrow type of the timestamps written to the CDC and SoR tables
+TIMESTAMP_TYPE = pa.timestamp("ms", tz="UTC")
+
+# Columns added to the new image of each record on the SoR tables
+SOR_EXECUTION_COLUMNS = ("execution_timestamp", "execution_date")
+
+
+class DynamoDBStreamsArrowMapper:
+    """
+    Maps DynamoDB Streams output data straight into Arrow tables for the CDC and SoR outputs,
+    building one Arrow array per column instead of a DataFrame of dictionaries.
+
+    The schemas are built from the declared keys and item types of each source table (memoized
+    by table). The SoR table of a batch is built from the new image column of its CDC table,
+    sharing its buffers, plus the execution columns.
+
+    Args:
+        table_schemas (Optional[dict[str, DynamoDBTableArrowSchema]]): The Arrow types of the
+            source tables, keyed by the DynamoDB table name (DYNAMODB_TABLE_ARROW_SCHEMAS when
+            not provided).
+    """
+
+    def __init__(self, table_schemas: Optional[dict[str, DynamoDBTableArrowSchema]] = None):
+        self.logger = LogUtils.setup_logger(name=__name__)
+        self.table_schemas = DYNAMODB_TABLE_ARROW_SCHEMAS if table_schemas is None else table_schemas
+        self.cdc_schemas: dict[str, tuple[pa.Schema, list[Callable[[Any], Any]]]] = {}
+        self.sor_schemas: dict[str, pa.Schema] = {}
+
+
+    @staticmethod
+    def build_value_converter(arrow_type: pa.DataType) -> Callable[[Any], Any]:
+        """
+        Builds the function converting the (deserialized) values of a column to python values
+        accepted by Arrow for the given type.
+
+        Args:
+            arrow_type (pa.DataType): The Arrow type of the column.
+
+        Returns:
+            Callable[[Any], Any]: The conversion function. Empty structs become None and values
+                without a declared schema are encoded as JSON strings.
+        """
+        if pa.types.is_struct(arrow_type):
+            field_converters = [
+                (field.name, DynamoDBStreamsArrowMapper.build_value_converter(field.type))
+                for field in arrow_type
+            ]
+
+            def convert_struct(value: Any) -> Any:
+                if not value:
+                    return None
+                return {name: convert(value.get(name)) for name, convert in field_converters}
+
+            return convert_struct
+
+        if pa.types.is_map(arrow_type):
+            convert_item = DynamoDBStreamsArrowMapper.build_value_converter(arrow_type.item_type)
+
+            def convert_map(value: Any) -> Any:
+                if value is None:
+                    return None
+                return {str(key): convert_item(item) for key, item in value.items()}
+
+            return convert_map
+
+        if pa.types.is_list(arrow_type):
+            convert_element = DynamoDBStreamsArrowMapper.build_value_converter(arrow_type.value_type)
+
+            def convert_list(value: Any) -> Any:
+                if value is None:
+                    return None
+                return [convert_element(element) for element in value]
+
+            return convert_list
+
+        if pa.types.is_string(arrow_type):
+            return lambda value: value if value is None or isinstance(value, str) else json.dumps(value)
+
+        if pa.types.is_floating(arrow_type):
+            return lambda value: None if value is None else float(value)
+
+        if pa.types.is_timestamp(arrow_type):
+            # Timestamps may be held as ISO 8601 strings (e.g. on DynamoDB items)
+            return lambda value: datetime.fromisoformat(value) if isinstance(value, str) else value
+
+        return lambda value: value
+
+
+    def __get_cdc_schema(self, table_name: str) -> tuple[pa.Schema, list[Callable[[Any], Any]]]:
+        """
+        Gets the Arrow schema of the CDC table of a source table (memoized by table), following
+        the attributes of DynamoDBStreamsOutputData.
+
+        Args:
+            table_name (str): The name of the source table.
+
+        Returns:
+            tuple[pa.Schema, list[Callable[[Any], Any]]]: The schema and the value conversion
+                function of each of its columns.
+        """
+        if table_name not in self.cdc_schemas:
+            table_schema = self.table_schemas.get(table_name)
+            if table_schema is None:
+                self.logger.warning(f"No schema declared for table {table_name}. Keys and images "
+                                    "will be stored as JSON maps.")
+                keys_type = image_type = JSON_MAP_TYPE
+            else:
+                keys_type = table_schema.keys_type
+                image_type = table_schema.item_type
+
+            schema = pa.schema([
+                ("table_name", pa.string()),
+                ("event_id", pa.string()),
+                ("event_name", pa.string()),
+                ("event_version", pa.string()),
+                ("event_source", pa.string()),
+                ("event_source_service", pa.string()),
+                ("aws_region", pa.string()),
+                ("table_keys", keys_type),
+                ("table_new_image", image_type),
+                ("table_old_image", image_type),
+                ("sequence_number", pa.string()),
+                ("size_bytes", pa.int64()),
+                ("stream_view_type", pa.string()),
+                ("event_source_arn", pa.string()),
+                ("event_timestamp", TIMESTAMP_TYPE),
+                ("event_date", pa.string())
+            ])
+            self.cdc_schemas[table_name] = (
+                schema,
+                [self.build_value_converter(field.type) for field in schema]
+            )
+
+        return self.cdc_schemas[table_name]
+
+
+    def __get_sor_schema(self, table_name: str) -> Optional[pa.Schema]:
+        """
+        Gets the Arrow schema of the SoR table of a source table (memoized by table): the
+        attributes of the items plus the execution columns.
+
+        Args:
+            table_name (str): The name of the source table.
+
+        Returns:
+            Optional[pa.Schema]: The schema, or None when the table has no declared schema.
+        """
+        if table_name not in self.sor_schemas:
+            table_schema = self.table_schemas.get(table_name)
+            if table_schema is None:
+                return None
+
+            self.sor_schemas[table_name] = pa.schema(
+                [field for field in table_schema.item_type if field.name not in SOR_EXECUTION_COLUMNS]
+                + [("execution_timestamp", TIMESTAMP_TYPE), ("execution_date", pa.string())]
+            )
+
+        return self.sor_schemas[table_name]
+
+
+    @staticmethod
+    def __build_table(
+        schema: pa.Schema,
+        converters: list[Callable[[Any], Any]],
+        rows: list[Any]
+    ) -> pa.Table:
+        """
+        Builds an Arrow table column by column.
+
+        Args:
+            schema (pa.Schema): The schema of the table.
+            converters (list[Callable[[Any], Any]]): The value conversion function of each column.
+            rows (list[Any]): The rows (dataclass instances).
+
+        Returns:
+            pa.Table: The Arrow table.
+        """
+        return pa.Table.from_arrays(
+            [
+                pa.array([convert(getattr(row, field.name)) for row in rows], type=field.type)
+                for field, convert in zip(schema, converters)
+            ],
+            schema=schema
+        )
+
+
+    def map_cdc_data(self, data: list[DynamoDBStreamsOutputData]) -> pa.Table:
+        """
+        Maps DynamoDB Streams output data to the Arrow table of the CDC output.
+
+        Args:
+            data (list[DynamoDBStreamsOutputData]): The output data of a batch (same source table).
+
+        Returns:
+            pa.Table: The CDC table.
+        """
+        schema, converters = self.__get_cdc_schema(table_name=data[0].table_name)
+        return self.__build_table(schema, converters, data)
+
+
+    def map_sor_data(
+        self,
+        cdc_table: pa.Table,
+        table_name: str,
+        execution_timestamp: datetime,
+        execution_date: str
+    ) -> Optional[pa.Table]:
+        """
+        Maps the CDC table of a batch to the Arrow table of the SoR output, reusing the arrays of
+        the new image column (without copying them).
+
+        Args:
+            cdc_table (pa.Table): The CDC table of the batch.
+            table_name (str): The name of the source table.
+            execution_timestamp (datetime): The execution timestamp of the batch.
+            execution_date (str): The execution date of the batch.
+
+        Returns:
+            Optional[pa.Table]: The SoR table, or None when the table has no declared schema (the
+                new images have no declared columns).
+        """
+        schema = self.__get_sor_schema(table_name=table_name)
+        if schema is None:
+            return None
+
+        new_images = cdc_table.column("table_new_image").combine_chunks()
+        image_columns = dict(zip([field.name for field in new_images.type], new_images.flatten()))
+        num_rows = cdc_table.num_rows
+
+        return pa.Table.from_arrays(
+            [image_columns[field.name] for field in schema if field.name not in SOR_EXECUTION_COLUMNS]
+            + [
+                pa.repeat(pa.scalar(execution_timestamp, type=TIMESTAMP_TYPE), num_rows),
+                pa.repeat(pa.scalar(execution_date, type=pa.string()), num_rows)
+            ],
+            schema=schema
+        )
+
+
+    @staticmethod
+    def map_sor_records(records: list[dict[str, Any]]) -> pa.Table:
+        """
+        Maps SoR records (new images plus execution columns) of a source table without a declared
+        schema to the Arrow table of the SoR output.
+
+        Args:
+            records (list[dict[str, Any]]): The SoR records.
+
+        Returns:
+            pa.Table: The SoR table, with inferred columns.
+        """
+        return pa.Table.from_pylist(records)
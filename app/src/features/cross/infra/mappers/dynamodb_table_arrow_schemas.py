@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+
+import pyarrow as pa
+
+
+# Arrow type of the values without a declared schema (raw maps and items of unknown tables),
+# stored as a compact map column holding the JSON of each value
+JSON_MAP_TYPE = pa.map_(pa.string(), pa.string())
+
+
+@dataclass(frozen=True)
+class DynamoDBTableArrowSchema:
+    """
+    Arrow types of the keys and items of a DynamoDB table, used as the types of the keys and images
+    columns of its CDC table and of the columns of its SoR table.
+
+    Attributes:
+        keys_type (pa.StructType): The struct type of the primary key (hash key and range key).
+        item_type (pa.StructType): The struct type of the items.
+    """
+    keys_type: pa.StructType
+    item_type: pa.StructType
+
+
+# Schemas of the source tables of the stream Lambdas, keyed by the DynamoDB table name. They are
+# declared here (following the PynamoDB models of the repositories, with NumberAttribute as
+# float64, raw MapAttribute as JSON_MAP_TYPE and ListAttribute as lists) so the stream Lambdas
+# don't depend on PynamoDB nor on the repositories of other features. Keep them in sync with the
+# models and with the CDC tables of the data catalog.
+DYNAMODB_TABLE_ARROW_SCHEMAS: dict[str, DynamoDBTableArrowSchema] = {
+    "tbl_b3stocks_investment_portfolio": DynamoDBTableArrowSchema(
+        keys_type=pa.struct([
+            ("owner_mail", pa.string())
+        ]),
+        item_type=pa.struct([
+            ("created_at", pa.string()),
+            ("owner_mail", pa.string()),
+            ("owner_name", pa.string()),
+            ("source_url", pa.string()),
+            ("stocks", pa.string()),
+            ("updated_at", pa.string())
+        ])
+    ),
+    "tbl_b3stocks_active_stocks": DynamoDBTableArrowSchema(
+        keys_type=pa.struct([
+            ("code", pa.string())
+        ]),
+        item_type=pa.struct([
+            ("code", pa.string()),
+            ("company_name", pa.string()),
+            ("created_at", pa.string()),
+            ("request_config", JSON_MAP_TYPE),
+            ("updated_at", pa.string())
+        ])
+    ),
+    "tbl_b3stocks_fundamentus_eod_stock_metrics": DynamoDBTableArrowSchema(
+        keys_type=pa.struct([
+            ("execution_date", pa.string()),
+            ("nome_papel", pa.string())
+        ]),
+        item_type=pa.struct([
+            ("content_hash", pa.string()),
+            ("dt_ult_balanco_proc", pa.string()),
+            ("dt_ult_cot", pa.string()),
+            ("execution_date", pa.string()),
+            ("execution_timestamp", pa.string()),
+            ("missing_fields", pa.list_(pa.string())),
+            ("nome_empresa", pa.string()),
+            ("nome_papel", pa.string()),
+            ("nome_setor", pa.string()),
+            ("nome_subsetor", pa.string()),
+            ("num_acoes", pa.float64()),
+            ("pct_cresc_rec_liq_ult_5a", pa.float64()),
+            ("pct_var_12m", pa.float64()),
+            ("pct_var_30d", pa.float64()),
+            ("pct_var_ano_a0", pa.float64()),
+            ("pct_var_ano_a1", pa.float64()),
+            ("pct_var_ano_a2", pa.float64()),
+            ("pct_var_ano_a3", pa.float64()),
+            ("pct_var_ano_a4", pa.float64()),
+            ("pct_var_ano_a5", pa.float64()),
+            ("pct_var_dia", pa.float64()),
+            ("pct_var_mes", pa.float64()),
+            ("tipo_papel", pa.string()),
+            ("vlr_ativ_circulante", pa.float64()),
+            ("vlr_ativo", pa.float64()),
+            ("vlr_cot", pa.float64()),
+            ("vlr_cot_max_52_sem", pa.float64()),
+            ("vlr_cot_min_52_sem", pa.float64()),
+            ("vlr_disponibilidades", pa.float64()),
+            ("vlr_div_yield", pa.float64()),
+            ("vlr_divida_bruta", pa.float64()),
+            ("vlr_divida_bruta_sobre_patrim", pa.float64()),
+            ("vlr_divida_liq", pa.float64()),
+            ("vlr_ebit_sobre_ativo", pa.float64()),
+            ("vlr_ebit_ult_12m", pa.float64()),
+            ("vlr_ebit_ult_3m", pa.float64()),
+            ("vlr_ev_sobre_ebit", pa.float64()),
+            ("vlr_ev_sobre_ebitda", pa.float64()),
+            ("vlr_firma", pa.float64()),
+            ("vlr_giro_ativos", pa.float64()),
+            ("vlr_liquidez_corr", pa.float64()),
+            ("vlr_lpa", pa.float64()),
+            ("vlr_lucro_liq_ult_12m", pa.float64()),
+            ("vlr_lucro_liq_ult_3m", pa.float64()),
+            ("vlr_margem_bruta", pa.float64()),
+            ("vlr_margem_ebit", pa.float64()),
+            ("vlr_margem_liq", pa.float64()),
+            ("vlr_mercado", pa.float64()),
+            ("vlr_p_sobre_ativ", pa.float64()),
+            ("vlr_p_sobre_ativ_circ_liq", pa.float64()),
+            ("vlr_p_sobre_cap_giro", pa.float64()),
+            ("vlr_p_sobre_ebit", pa.float64()),
+            ("vlr_p_sobre_l", pa.float64()),
+            ("vlr_p_sobre_vp", pa.float64()),
+            ("vlr_patrim_liq", pa.float64()),
+            ("vlr_psr", pa.float64()),
+            ("vlr_receita_liq_ult_12m", pa.float64()),
+            ("vlr_receita_liq_ult_3m", pa.float64()),
+            ("vlr_roe", pa.float64()),
+            ("vlr_roic", pa.float64()),
+            ("vlr_vpa", pa.float64()),
+            ("vol_med_neg_2m", pa.float64())
+        ])
+    ),
+    "tbl_b3stocks_batch_process_control": DynamoDBTableArrowSchema(
+        keys_type=pa.struct([
+            ("execution_date", pa.string()),
+            ("process_name", pa.string())
+        ]),
+        item_type=pa.struct([
+            ("created_at", pa.string()),
+            ("execution_date", pa.string()),
+            ("finished_at", pa.string()),
+            ("process_name", pa.string()),
+            ("process_status", pa.string()),
+            ("processed_items", pa.float64()),
+            ("total_items", pa.float64()),
+            ("updated_at", pa.string())
+        ])
+    )
+}
@@ -0,0 +1,178 @@
+import codecs
+from typing import Iterable, Iterator, Optional
+
+import lxml.etree
+
+
+# Id of the results table of the Fundamentus screener page (resultado.php)
+SCREENER_TABLE_ID = "resultado"
+
+# Key used on the rows for the company name (taken from the title of the ticker cell)
+COMPANY_NAME_KEY = "Empresa"
+
+
+class FundamentusScreenerTableParser:
+    """
+    Incremental parser of the results table of the Fundamentus screener page (resultado.php).
+
+    The HTML is fed in chunks to a C-backed lxml pull parser and every row of the results table is
+    yielded as soon as it is closed, as a dictionary mapping the table headers to the raw cell
+    strings (plus the company name under COMPANY_NAME_KEY). Rows already yielded are released from
+    the parsed tree and the parser stops consuming events once the results table is closed.
+
+    Args:
+        encoding (Optional[str]): The encoding of the HTML content (latin-1, the encoding of the
+            Fundamentus pages, when the response doesn't declare one).
+    """
+
+    def __init__(self, encoding: Optional[str]):
+        self.headers: list[str] = []
+        self.finished = False
+        # Normalizing the encoding name as libxml2 doesn't know some Python aliases (e.g. latin-1)
+        self.__parser = lxml.etree.HTMLPullParser(
+            events=("start", "end"),
+            encoding=codecs.lookup(encoding or "latin-1").name
+        )
+        self.__inside_table = False
+
+
+    @staticmethod
+    def __is_screener_table(element: lxml.etree._Element) -> bool:
+        """
+        Checks whether an element is the results table of the screener page.
+
+        Args:
+            element (lxml.etree._Element): The element to check.
+
+        Returns:
+            bool: True if the element is the results table.
+        """
+        return element.tag == "table" and element.get("id") == SCREENER_TABLE_ID
+
+
+    @staticmethod
+    def __get_text(element: lxml.etree._Element) -> str:
+        """
+        Returns the stripped text of an element and its children.
+
+        Args:
+            element (lxml.etree._Element): The element to read.
+
+        Returns:
+            str: The text content of the element.
+        """
+        return "".join(element.itertext()).strip()
+
+
+    def __build_row(self, cells: list[lxml.etree._Element]) -> dict[str, str]:
+        """
+        Builds a row dictionary from the cells of a table row.
+
+        Args:
+            cells (list[lxml.etree._Element]): The td elements of the row.
+
+        Returns:
+            dict[str, str]: The raw cell strings keyed by the table headers.
+        """
+        row = {header: self.__get_text(cell) for header, cell in zip(self.headers, cells)}
+
+        company_name_span = cells[0].find(".//span")
+        row[COMPANY_NAME_KEY] = (
+            company_name_span.get("title", "").strip() if company_name_span is not None else ""
+        )
+
+        return row
+
+
+    def __read_events(self) -> Iterator[dict[str, str]]:
+        """
+        Consumes the events already produced by the pull parser, yielding the completed rows.
+
+        Returns:
+            Iterator[dict[str, str]]: The rows of the results table closed so far.
+        """
+        for event, element in self.__parser.read_events():
+            if self.finished:
+                continue
+
+            if event == "start":
+                if self.__is_screener_table(element):
+                    self.__inside_table = True
+                continue
+
+            if not self.__inside_table:
+                continue
+
+            if element.tag == "th":
+                self.headers.append(self.__get_text(element))
+
+            elif element.tag == "tr":
+                cells = element.findall("td")
+                if cells and self.headers:
+                    yield self.__build_row(cells)
+
+                # Releasing the rows already yielded to keep the parsed tree small
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+
+            elif self.__is_screener_table(element):
+                self.finished = True
+
+
+    def feed(self, chunk: bytes) -> Iterator[dict[str, str]]:
+        """
+        Feeds a chunk of HTML to the parser.
+
+        Args:
+            chunk (bytes): The next chunk of the raw HTML content.
+
+        Returns:
+            Iterator[dict[str, str]]: The rows of the results table completed by this chunk.
+        """
+        if self.finished:
+            return
+
+        self.__parser.feed(chunk)
+        yield from self.__read_events()
+
+
+    def close(self) -> Iterator[dict[str, str]]:
+        """
+        Signals the end of the HTML content, flushing the rows still held by the parser.
+
+        Returns:
+            Iterator[dict[str, str]]: The remaining rows of the results table.
+        """
+        if self.finished:
+            return
+
+        self.__parser.close()
+        yield from self.__read_events()
+
+
+    @classmethod
+    def iter_rows(cls, chunks: Iterable[bytes], encoding: Optional[str]) -> Iterator[dict[str, str]]:
+        """
+        Yields the rows of the results table from an iterable of HTML chunks, consuming the
+        chunks only until the results table is closed.
+
+        Args:
+            chunks (Iterable[bytes]): The raw HTML content split in chunks.
+            encoding (Optional[str]): The encoding of the HTML content (latin-1 when None).
+
+        Returns:
+            Iterator[dict[str, str]]: The rows of the results table.
+        """
+        parser = cls(encoding=encoding)
+        for chunk in chunks:
+            yield from parser.feed(chunk)
+            if parser.finished:
+                break
+        else:
+            yield from parser.close()
+
+        if not parser.headers:
+            raise ValueError(f"Table with id '{SCREENER_TABLE_ID}' couldn't be found on the HTML "
+                             "content")
@@ -1,5 +1,7 @@
 import os
+import random
 from datetime import datetime
+from typing import Optional
 
 import boto3
 from pynamodb.models import Model
@@ -7,7 +9,7 @@ from pynamodb.attributes import (
     UnicodeAttribute,
     NumberAttribute,
 )
-from pynamodb.exceptions import DoesNotExist
+from pynamodb.exceptions import UpdateError
 
 from app.src.features.cross.domain.interfaces.batch_control_database_repository_interface import (
     IBatchControlDatabaseRepository
@@ -18,10 +20,15 @@ from app.src.features.cross.utils.serialization import SerializationUtils
 from app.src.features.cross.utils.log import LogUtils
 from app.src.features.cross.value_objects import (
     Timezone,
-    ProcessStatus
+    ProcessStatus,
+    BatchProcessName
 )
 
 
+# Separator between the execution date and the shard number on the range key of shard records
+SHARD_KEY_SEPARATOR = "#shard-"
+
+
 class BatchProcessControlModel(Model):
     """
     PynamoDB model for batch process control data.
@@ -51,78 +58,328 @@ class DynamoDBBatchControlDatabaseRepository(IBatchControlDatabaseRepository):
 
     def __init__(self):
         self.logger = LogUtils.setup_logger(name=__name__)
+        # With more than one shard, each batch increments one of the shard records of the process
+        # (execution_date#shard-NN) instead of the single record, avoiding a hot key when many
+        # invocations run at the same time. The shards are aggregated by the stream consumer.
+        self.num_shards = int(os.getenv("BATCH_PROCESS_CONTROL_NUM_SHARDS", "1"))
 
     
-    def update_batch_process_control(self, batch_process: BatchProcess) -> None:
+    def __increment_processed_items(self, serialized_item: dict) -> BatchProcessControlModel:
         """
-        Updates the batch process control record in the repository.
+        Atomically adds the processed items to the record of a process that is not completed,
+        creating the record when it doesn't exist yet.
 
         Args:
-            batch_process (BatchProcess): The batch process details to update.
-        """
-        serialized_item = SerializationUtils.json_serialize(batch_process)
-        try:
-            current_batch_process = BatchProcessControlModel.get(
-                serialized_item["process_name"],
-                serialized_item["execution_date"]
-            )
+            serialized_item (dict): The serialized batch process.
 
-            # If there is a completed process with the same name and date, reset it
-            if current_batch_process.process_status == ProcessStatus.COMPLETED.value:
-                current_batch_process.update(
-                    actions=[
-                        BatchProcessControlModel.process_status.set(ProcessStatus.IN_PROGRESS.value),
-                        BatchProcessControlModel.processed_items.set(int(serialized_item["processed_items"])),
-                        BatchProcessControlModel.total_items.set(serialized_item["total_items"]),
-                        BatchProcessControlModel.created_at.set(serialized_item["created_at"]),
-                        BatchProcessControlModel.updated_at.set(serialized_item["updated_at"]),
-                        BatchProcessControlModel.finished_at.set(None),
-                    ]
-                )
-            else:
-                # Updates the batch record with the new processed items count and updated timestamp
-                current_batch_process.update(
-                    actions=[
-                        BatchProcessControlModel.process_status.set(ProcessStatus.IN_PROGRESS.value),
-                        BatchProcessControlModel.processed_items.add(int(serialized_item["processed_items"])),
-                        BatchProcessControlModel.updated_at.set(serialized_item["updated_at"]),
-                    ]
-                )
+        Returns:
+            BatchProcessControlModel: The record as it is after the update.
 
-        except DoesNotExist:
-            # If item does not exist, create a new one  
-            try:
-                item = BatchProcessControlModel(**serialized_item)
-                item.save()
-            except Exception:
-                self.logger.exception("Failed to save new batch process control record to DynamoDB.")
-                raise
+        Raises:
+            UpdateError: With a ConditionalCheckFailedException cause when the process is completed.
+        """
+        item = BatchProcessControlModel(
+            serialized_item["process_name"],
+            serialized_item["execution_date"]
+        )
+        item.update(
+            actions=[
+                BatchProcessControlModel.processed_items.add(int(serialized_item["processed_items"])),
+                BatchProcessControlModel.total_items.set(
+                    BatchProcessControlModel.total_items | int(serialized_item["total_items"])
+                ),
+                BatchProcessControlModel.process_status.set(ProcessStatus.IN_PROGRESS.value),
+                BatchProcessControlModel.created_at.set(
+                    BatchProcessControlModel.created_at | serialized_item["created_at"]
+                ),
+                BatchProcessControlModel.updated_at.set(serialized_item["updated_at"]),
+            ],
+            condition=(
+                BatchProcessControlModel.process_status.does_not_exist() |
+                (BatchProcessControlModel.process_status != ProcessStatus.COMPLETED.value)
+            )
+        )
+        return item
 
 
-    def check_batch_process_completion(self, batch_process: BatchProcess) -> None:
+    def __reset_completed_process(self, serialized_item: dict) -> BatchProcessControlModel:
         """
-        Checks if a batch process has completed based on the total and processed items.
+        Restarts the record of a completed process (e.g. a rerun of the same execution date) with
+        the processed items of the current batch.
 
         Args:
-            batch_process (BatchProcess): The batch process details to check.
-        """
+            serialized_item (dict): The serialized batch process.
 
-        serialized_item = SerializationUtils.json_serialize(batch_process)
-        current_batch_process = BatchProcessControlModel.get(
+        Returns:
+            BatchProcessControlModel: The record as it is after the update.
+
+        Raises:
+            UpdateError: With a ConditionalCheckFailedException cause when the process is no longer
+                completed (it was already reset by a concurrent invocation).
+        """
+        item = BatchProcessControlModel(
             serialized_item["process_name"],
             serialized_item["execution_date"]
         )
+        item.update(
+            actions=[
+                BatchProcessControlModel.process_status.set(ProcessStatus.IN_PROGRESS.value),
+                BatchProcessControlModel.processed_items.set(int(serialized_item["processed_items"])),
+                BatchProcessControlModel.total_items.set(int(serialized_item["total_items"])),
+                BatchProcessControlModel.created_at.set(serialized_item["created_at"]),
+                BatchProcessControlModel.updated_at.set(serialized_item["updated_at"]),
+                BatchProcessControlModel.finished_at.remove(),
+            ],
+            condition=BatchProcessControlModel.process_status == ProcessStatus.COMPLETED.value
+        )
+        return item
 
-        if int(current_batch_process.processed_items) >= int(current_batch_process.total_items):
-            # Marks the process as completed
-            finished_at: datetime = DateAndTimeUtils.now(
-                output_type="datetime",
-                timezone=Timezone.SAO_PAULO
-            )
-            current_batch_process.update(
+
+    def __complete_process(self, item: BatchProcessControlModel) -> None:
+        """
+        Marks a process as completed, unless another invocation already did it.
+
+        Args:
+            item (BatchProcessControlModel): The record of the process, updated in place.
+        """
+        finished_at: datetime = DateAndTimeUtils.now(
+            output_type="datetime",
+            timezone=Timezone.SAO_PAULO
+        )
+        try:
+            item.update(
                 actions=[
                     BatchProcessControlModel.process_status.set(ProcessStatus.COMPLETED.value),
                     BatchProcessControlModel.finished_at.set(finished_at.isoformat()),
-                    BatchProcessControlModel.updated_at.set(serialized_item["updated_at"]),
-                ]
+                    BatchProcessControlModel.updated_at.set(finished_at.isoformat()),
+                ],
+                condition=(
+                    (BatchProcessControlModel.process_status == ProcessStatus.IN_PROGRESS.value) &
+                    (BatchProcessControlModel.processed_items >= BatchProcessControlModel.total_items)
+                )
+            )
+        except UpdateError as error:
+            if not self.__is_conditional_check_failure(error):
+                raise
+            self.logger.info(f"Batch process '{item.process_name}' of {item.execution_date} was already "
+                             "completed by another invocation")
+
+
+    @staticmethod
+    def __is_conditional_check_failure(error: UpdateError) -> bool:
+        """
+        Checks whether an update failed because of its condition expression.
+
+        Args:
+            error (UpdateError): The error raised by PynamoDB.
+
+        Returns:
+            bool: True when the condition of the update was not met.
+        """
+        return error.cause_response_code == "ConditionalCheckFailedException"
+
+
+    def __reopen_process(self, process_name: str, execution_date: str) -> None:
+        """
+        Sets a completed (aggregated) process back to in progress, so it can be completed again
+        by a rerun of its shards.
+
+        Args:
+            process_name (str): The name of the process.
+            execution_date (str): The execution date of the process.
+        """
+        try:
+            BatchProcessControlModel(process_name, execution_date).update(
+                actions=[
+                    BatchProcessControlModel.process_status.set(ProcessStatus.IN_PROGRESS.value),
+                    BatchProcessControlModel.finished_at.remove(),
+                ],
+                condition=BatchProcessControlModel.process_status == ProcessStatus.COMPLETED.value
             )
+        except UpdateError as error:
+            if not self.__is_conditional_check_failure(error):
+                raise
+
+
+    @staticmethod
+    def __to_batch_process(item: BatchProcessControlModel) -> BatchProcess:
+        """
+        Converts a batch process control record to a BatchProcess entity.
+
+        Args:
+            item (BatchProcessControlModel): The batch process control record.
+
+        Returns:
+            BatchProcess: The batch process entity.
+        """
+        return BatchProcess(
+            process_name=BatchProcessName(item.process_name),
+            total_items=int(item.total_items),
+            processed_items=int(item.processed_items),
+            process_status=ProcessStatus(item.process_status),
+            execution_date=item.execution_date,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+            finished_at=item.finished_at
+        )
+
+
+    def update_batch_process_control(self, batch_process: BatchProcess) -> BatchProcess:
+        """
+        Adds the processed items of a batch to the process control record and marks the process
+        as completed when all of its items were processed.
+
+        The processed items are added with a single conditional UpdateItem (no reads) that also
+        creates the record when needed. Only the invocation that reaches the total items sends a
+        second (conditional) update to mark the process as completed, and a completed process is
+        restarted by the first batch of a rerun.
+
+        When sharding is enabled, the items are added to a random shard record and the process is
+        completed later by complete_sharded_batch_process.
+
+        Args:
+            batch_process (BatchProcess): The batch process details to update.
+
+        Returns:
+            BatchProcess: The batch process (or shard) record as it is stored after the update.
+        """
+        serialized_item = SerializationUtils.json_serialize(batch_process)
+        execution_date = serialized_item["execution_date"]
+        if self.num_shards > 1:
+            shard = random.randrange(self.num_shards)
+            serialized_item["execution_date"] = f"{execution_date}{SHARD_KEY_SEPARATOR}{shard:02d}"
+
+        try:
+            item = None
+            while item is None:
+                try:
+                    item = self.__increment_processed_items(serialized_item)
+                except UpdateError as error:
+                    if not self.__is_conditional_check_failure(error):
+                        raise
+
+                    # The process is completed, so this is the first batch of a rerun
+                    try:
+                        item = self.__reset_completed_process(serialized_item)
+                    except UpdateError as reset_error:
+                        # Another invocation restarted the process first, so the increment is retried
+                        if not self.__is_conditional_check_failure(reset_error):
+                            raise
+                        continue
+
+                    if self.num_shards > 1:
+                        self.__reopen_process(serialized_item["process_name"], execution_date)
+
+            if self.num_shards == 1 and int(item.processed_items) >= int(item.total_items):
+                self.__complete_process(item)
+
+        except Exception:
+            self.logger.exception("Failed to update the batch process control record of process "
+                                  f"'{serialized_item['process_name']}' on "
+                                  f"{serialized_item['execution_date']}")
+            raise
+
+        return self.__to_batch_process(item)
+
+
+    def is_batch_process_shard(self, batch_process: BatchProcess) -> bool:
+        """
+        Checks whether a batch process record is a shard of a sharded process.
+
+        Args:
+            batch_process (BatchProcess): The batch process record.
+
+        Returns:
+            bool: True when the record is a shard record.
+        """
+        return SHARD_KEY_SEPARATOR in str(batch_process.execution_date)
+
+
+    def complete_sharded_batch_process(self, batch_process: BatchProcess) -> Optional[BatchProcess]:
+        """
+        Aggregates the shard records of a sharded process and, when all of its items were
+        processed, stores the aggregated process record as completed.
+
+        Only the shards still in progress are aggregated (the ones of a previous run are marked
+        as completed along with the process), and the process record is only completed once.
+
+        Args:
+            batch_process (BatchProcess): Any shard record of the process.
+
+        Returns:
+            Optional[BatchProcess]: The completed process, or None when it is not complete yet (or
+                was already completed).
+        """
+        process_name = BatchProcessName(batch_process.process_name).value
+        execution_date = str(batch_process.execution_date).split(SHARD_KEY_SEPARATOR)[0]
+
+        try:
+            shards = [
+                shard for shard in BatchProcessControlModel.query(
+                    process_name,
+                    range_key_condition=BatchProcessControlModel.execution_date.startswith(
+                        f"{execution_date}{SHARD_KEY_SEPARATOR}"
+                    ),
+                    consistent_read=True
+                )
+                if shard.process_status == ProcessStatus.IN_PROGRESS.value
+            ]
+            if not shards:
+                return None
+
+            processed_items = sum(int(shard.processed_items) for shard in shards)
+            total_items = max(int(shard.total_items) for shard in shards)
+            self.logger.info(f"Batch process '{process_name}' of {execution_date} has "
+                             f"{processed_items} of {total_items} items processed across "
+                             f"{len(shards)} shards")
+            if processed_items < total_items:
+                return None
+
+            finished_at = DateAndTimeUtils.now(output_type="datetime", timezone=Timezone.SAO_PAULO)
+            item = BatchProcessControlModel(process_name, execution_date)
+            try:
+                item.update(
+                    actions=[
+                        BatchProcessControlModel.process_status.set(ProcessStatus.COMPLETED.value),
+                        BatchProcessControlModel.processed_items.set(processed_items),
+                        BatchProcessControlModel.total_items.set(total_items),
+                        BatchProcessControlModel.created_at.set(
+                            BatchProcessControlModel.created_at
+                            | min(shard.created_at for shard in shards)
+                        ),
+                        BatchProcessControlModel.updated_at.set(finished_at.isoformat()),
+                        BatchProcessControlModel.finished_at.set(finished_at.isoformat()),
+                    ],
+                    condition=(
+                        BatchProcessControlModel.process_status.does_not_exist() |
+                        (BatchProcessControlModel.process_status != ProcessStatus.COMPLETED.value)
+                    )
+                )
+            except UpdateError as error:
+                if not self.__is_conditional_check_failure(error):
+                    raise
+                self.logger.info(f"Batch process '{process_name}' of {execution_date} was already "
+                                 "completed")
+                return None
+
+            # Closing the shards, so the first batch of a rerun restarts them
+            for shard in shards:
+                try:
+                    shard.update(
+                        actions=[
+                            BatchProcessControlModel.process_status.set(ProcessStatus.COMPLETED.value)
+                        ],
+                        condition=(
+                            BatchProcessControlModel.process_status == ProcessStatus.IN_PROGRESS.value
+                        )
+                    )
+                except UpdateError as error:
+                    if not self.__is_conditional_check_failure(error):
+                        raise
+
+        except Exception:
+            self.logger.exception(f"Failed to aggregate the shards of batch process '{process_name}' "
+                                  f"of {execution_date}")
+            raise
+
+        return self.__to_batch_process(item)
@@ -0,0 +1,177 @@
+import time
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+from app.src.features.cross.domain.entities.dynamodb_bulk_write_config import DynamoDBBulkWriteConfig
+from app.src.features.cross.utils.log import LogUtils
+
+
+# Maximum number of put/delete requests accepted by a single BatchWriteItem call
+MAX_BATCH_WRITE_ITEMS = 25
+
+# Error codes returned by DynamoDB when the table (or the account) is being throttled
+THROTTLING_ERROR_CODES = (
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded"
+)
+
+
+class DynamoDBBulkWriter:
+    """
+    Writes items to a DynamoDB table with BatchWriteItem chunks sent in parallel.
+
+    Items are split into chunks of 25 put requests that are dispatched across a thread pool. The
+    UnprocessedItems returned by DynamoDB (and the chunks rejected by throttling) are retried with
+    exponential backoff and full jitter. The consumed write capacity and the throttling counts are
+    logged and returned as metrics of each write.
+
+    Args:
+        table_name (str): The name of the DynamoDB table.
+        config (DynamoDBBulkWriteConfig): The concurrency and retry configuration of the writer.
+        client (Optional[Any]): The low level boto3 DynamoDB client. Created on first use when not
+            provided.
+        logger (logging.Logger): The logger used by the writer.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        config: DynamoDBBulkWriteConfig = DynamoDBBulkWriteConfig(),
+        client: Optional[Any] = None,
+        logger: logging.Logger = LogUtils.setup_logger(name=__name__)
+    ):
+        self.table_name = table_name
+        self.config = config
+        self.client = client
+        self.logger = logger
+        self.__metrics_lock = threading.Lock()
+
+
+    def __get_client(self) -> Any:
+        """
+        Returns the boto3 DynamoDB client, creating it on first use. boto3 clients are thread safe,
+        so the same client is shared by every worker thread.
+
+        Returns:
+            The low level boto3 DynamoDB client.
+        """
+        if self.client is None:
+            self.client = boto3.client("dynamodb", region_name=boto3.session.Session().region_name)
+
+        return self.client
+
+
+    def __get_backoff_seconds(self, attempt: int) -> float:
+        """
+        Computes the (full jitter) exponential backoff of a retry.
+
+        Args:
+            attempt (int): The number of the retry, starting at 0.
+
+        Returns:
+            float: The number of seconds to wait before the retry.
+        """
+        max_backoff = min(
+            self.config.max_backoff_seconds,
+            self.config.base_backoff_seconds * 2 ** attempt
+        )
+        return random.uniform(0, max_backoff)
+
+
+    def __write_chunk(self, write_requests: list[dict], metrics: dict[str, float]) -> None:
+        """
+        Sends a chunk of write requests, retrying the unprocessed ones until all are written.
+
+        Args:
+            write_requests (list[dict]): Up to 25 BatchWriteItem write requests.
+            metrics (dict[str, float]): The metrics of the bulk write, updated in place.
+        """
+        client = self.__get_client()
+        pending_requests = write_requests
+
+        for attempt in range(self.config.max_retries + 1):
+            if attempt > 0:
+                time.sleep(self.__get_backoff_seconds(attempt - 1))
+
+            try:
+                response = client.batch_write_item(
+                    RequestItems={self.table_name: pending_requests},
+                    ReturnConsumedCapacity="TOTAL"
+                )
+            except ClientError as error:
+                if error.response.get("Error", {}).get("Code") not in THROTTLING_ERROR_CODES:
+                    raise
+
+                with self.__metrics_lock:
+                    metrics["throttled_requests"] += 1
+                continue
+
+            consumed_capacity = sum(
+                capacity.get("CapacityUnits", 0) for capacity in response.get("ConsumedCapacity", [])
+            )
+            pending_requests = response.get("UnprocessedItems", {}).get(self.table_name, [])
+
+            with self.__metrics_lock:
+                metrics["batch_write_requests"] += 1
+                metrics["consumed_capacity_units"] += consumed_capacity
+                if pending_requests:
+                    metrics["unprocessed_items"] += len(pending_requests)
+
+            if not pending_requests:
+                return
+
+        raise RuntimeError(f"Could not write {len(pending_requests)} items to table {self.table_name} "
+                           f"after {self.config.max_retries} retries")
+
+
+    def put_items(self, items: list[dict[str, dict]]) -> dict[str, float]:
+        """
+        Puts items (already in the DynamoDB attribute value format) to the table.
+
+        Args:
+            items (list[dict[str, dict]]): The items to put, e.g. {"code": {"S": "PETR4"}}.
+
+        Returns:
+            dict[str, float]: The metrics of the write, with the number of items and of
+                BatchWriteItem requests, the consumed capacity units, the throttled requests and
+                the unprocessed items that had to be retried.
+        """
+        metrics = {
+            "items": len(items),
+            "batch_write_requests": 0,
+            "consumed_capacity_units": 0.0,
+            "throttled_requests": 0,
+            "unprocessed_items": 0
+        }
+        if not items:
+            return metrics
+
+        chunks = [
+            [{"PutRequest": {"Item": item}} for item in items[idx:idx + MAX_BATCH_WRITE_ITEMS]]
+            for idx in range(0, len(items), MAX_BATCH_WRITE_ITEMS)
+        ]
+
+        # Creating the client before dispatching the chunks so the threads don't race to do it
+        self.__get_client()
+
+        try:
+            num_workers = max(1, min(self.config.max_workers, len(chunks)))
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                futures = [executor.submit(self.__write_chunk, chunk, metrics) for chunk in chunks]
+                for future in futures:
+                    future.result()
+
+        except Exception:
+            self.logger.exception(f"Error bulk writing {len(items)} items to table {self.table_name}")
+            raise
+
+        self.logger.info(f"Bulk wrote {len(items)} items to table {self.table_name} in {len(chunks)} "
+                         f"chunks: {metrics}")
+        return metrics
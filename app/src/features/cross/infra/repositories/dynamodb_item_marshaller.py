@@ -0,0 +1,275 @@
+import json
+import math
+import numbers
+from dataclasses import fields
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from pynamodb.models import Model
+from pynamodb.attributes import (
+    Attribute,
+    BooleanAttribute,
+    JSONAttribute,
+    ListAttribute,
+    MapAttribute,
+    NumberAttribute,
+    UnicodeAttribute
+)
+
+from app.src.features.cross.utils.serialization import SerializationUtils
+
+
+# String values handled as missing data (same rule of SerializationUtils.json_serialize)
+NULL_LIKE_STRINGS = frozenset(("nan", "n/a", "null", ""))
+
+
+class DynamoDBItemMarshaller:
+    """
+    Converts dataclass entities straight into DynamoDB items (attribute value format).
+
+    A field plan (attribute name plus conversion function of each entity field) is built once
+    from the attributes of the PynamoDB model, so each entity is marshalled with a single pass
+    over its fields, without building a serialized dictionary or a model instance. Missing values
+    (None, NaN and null-like strings) are left out of the item, as PynamoDB does.
+
+    Args:
+        model_class (type[Model]): The PynamoDB model describing the table attributes.
+        entity_class (type): The dataclass of the entities to be marshalled.
+    """
+
+    def __init__(self, model_class: type[Model], entity_class: type):
+        self.model_class = model_class
+        self.entity_class = entity_class
+        self.field_plan = self.__build_field_plan()
+
+
+    @staticmethod
+    def __is_missing(value: Any) -> bool:
+        """
+        Checks whether a value is handled as missing data.
+
+        Args:
+            value (Any): The value to check.
+
+        Returns:
+            bool: True for None, NaN and null-like strings.
+        """
+        if value is None:
+            return True
+        if isinstance(value, float):
+            return math.isnan(value)
+        if isinstance(value, str):
+            return value.lower().strip() in NULL_LIKE_STRINGS
+        return False
+
+
+    @staticmethod
+    def marshal_string(value: Any) -> Optional[dict]:
+        """
+        Converts a value to a string attribute value.
+
+        Args:
+            value (Any): The value to convert (str, Enum, date or datetime).
+
+        Returns:
+            Optional[dict]: The attribute value, or None when the value is missing.
+        """
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, (datetime, date)):
+            value = value.isoformat()
+
+        if DynamoDBItemMarshaller.__is_missing(value):
+            return None
+        return {"S": str(value)}
+
+
+    @staticmethod
+    def marshal_number(value: Any) -> Optional[dict]:
+        """
+        Converts a value to a number attribute value.
+
+        Args:
+            value (Any): The value to convert (Python or numpy number).
+
+        Returns:
+            Optional[dict]: The attribute value, or None when the value is missing.
+        """
+        if value is None:
+            return None
+        if isinstance(value, numbers.Integral):
+            return {"N": str(int(value))}
+
+        # repr gives the shortest string that round trips, the same of json.dumps (used by PynamoDB)
+        number = float(value)
+        if math.isnan(number):
+            return None
+        return {"N": repr(number)}
+
+
+    @staticmethod
+    def marshal_boolean(value: Any) -> Optional[dict]:
+        """
+        Converts a value to a boolean attribute value.
+
+        Args:
+            value (Any): The value to convert.
+
+        Returns:
+            Optional[dict]: The attribute value, or None when the value is missing.
+        """
+        if value is None:
+            return None
+        return {"BOOL": bool(value)}
+
+
+    @staticmethod
+    def marshal_json(value: Any) -> Optional[dict]:
+        """
+        Converts a value to the JSON string attribute value of a JSONAttribute.
+
+        Args:
+            value (Any): The value to convert.
+
+        Returns:
+            Optional[dict]: The attribute value, or None when the value is missing.
+        """
+        value = SerializationUtils.json_serialize(value)
+        if value is None:
+            return None
+        return {"S": json.dumps(value)}
+
+
+    @staticmethod
+    def marshal_value(value: Any) -> dict:
+        """
+        Converts a JSON friendly value (as returned by SerializationUtils.json_serialize) to an
+        attribute value, inferring its type. Used for the content of raw maps and lists.
+
+        Args:
+            value (Any): The value to convert.
+
+        Returns:
+            dict: The attribute value.
+        """
+        if value is None:
+            return {"NULL": True}
+        if isinstance(value, bool):
+            return {"BOOL": value}
+        if isinstance(value, numbers.Number):
+            return DynamoDBItemMarshaller.marshal_number(value) or {"NULL": True}
+        if isinstance(value, dict):
+            return {
+                "M": {key: DynamoDBItemMarshaller.marshal_value(item) for key, item in value.items()}
+            }
+        if isinstance(value, (list, tuple)):
+            return {"L": [DynamoDBItemMarshaller.marshal_value(item) for item in value]}
+        return {"S": str(value)}
+
+
+    @staticmethod
+    def marshal_map(value: Any) -> Optional[dict]:
+        """
+        Converts a dictionary (or a dataclass) to a map attribute value.
+
+        Args:
+            value (Any): The value to convert.
+
+        Returns:
+            Optional[dict]: The attribute value, or None when the value is missing.
+        """
+        value = SerializationUtils.json_serialize(value)
+        if value is None:
+            return None
+        return DynamoDBItemMarshaller.marshal_value(value)
+
+
+    def __get_attribute_marshaller(self, attribute: Attribute) -> Callable[[Any], Optional[dict]]:
+        """
+        Returns the conversion function of a PynamoDB attribute.
+
+        Args:
+            attribute (Attribute): The attribute of the model.
+
+        Returns:
+            Callable[[Any], Optional[dict]]: The function converting a value to the attribute
+                value format (or None when the value is missing).
+        """
+        # JSONAttribute and MapAttribute must be checked before their base classes
+        if isinstance(attribute, JSONAttribute):
+            return self.marshal_json
+        if isinstance(attribute, MapAttribute):
+            return self.marshal_map
+        if isinstance(attribute, UnicodeAttribute):
+            return self.marshal_string
+        if isinstance(attribute, NumberAttribute):
+            return self.marshal_number
+        if isinstance(attribute, BooleanAttribute):
+            return self.marshal_boolean
+
+        if isinstance(attribute, ListAttribute):
+            element_marshaller = (
+                self.__get_attribute_marshaller(attribute.element_type())
+                if attribute.element_type else self.marshal_value
+            )
+
+            def marshal_list(value: Any) -> Optional[dict]:
+                if value is None:
+                    return None
+                return {"L": [
+                    element for element in map(element_marshaller, value) if element is not None
+                ]}
+
+            return marshal_list
+
+        raise TypeError(f"Attribute type {type(attribute).__name__} is not supported by the marshaller")
+
+
+    def __build_field_plan(self) -> list[tuple[str, str, Callable[[Any], Optional[dict]], bool]]:
+        """
+        Builds the plan used to marshal every entity field.
+
+        Returns:
+            A list of (entity field name, attribute name, conversion function, nullable) tuples.
+        """
+        attributes = self.model_class.get_attributes()
+
+        field_plan = []
+        for entity_field in fields(self.entity_class):
+            attribute = attributes.get(entity_field.name)
+            if attribute is None:
+                raise ValueError(f"Field {entity_field.name} of {self.entity_class.__name__} is not an "
+                                 f"attribute of {self.model_class.__name__}")
+
+            field_plan.append((
+                entity_field.name,
+                attribute.attr_name,
+                self.__get_attribute_marshaller(attribute),
+                attribute.null
+            ))
+
+        return field_plan
+
+
+    def marshal(self, entity: Any) -> dict[str, dict]:
+        """
+        Converts an entity to a DynamoDB item.
+
+        Args:
+            entity (Any): The entity to convert.
+
+        Returns:
+            dict[str, dict]: The item in the attribute value format, e.g. {"code": {"S": "PETR4"}}.
+        """
+        item = {}
+        for field_name, attr_name, marshal_attribute, nullable in self.field_plan:
+            attribute_value = marshal_attribute(getattr(entity, field_name))
+            if attribute_value is not None:
+                item[attr_name] = attribute_value
+            elif not nullable:
+                raise ValueError(f"Attribute '{attr_name}' of {self.entity_class.__name__} can't be "
+                                 "None")
+
+        return item
+
@@ -0,0 +1,126 @@
+import time
+import threading
+from typing import Optional
+
+from app.src.features.cross.domain.entities.http_client_rate_limit_config import (
+    HTTPClientRateLimitConfig
+)
+
+
+# Status codes handled as a signal that the server is overloaded
+THROTTLING_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket rate limiter shared by every thread sending requests to the same host.
+
+    The refill rate is adjusted with AIMD (additive increase, multiplicative decrease): successful
+    responses slowly raise the rate and throttling signals (429/5xx responses, connection errors or
+    slow responses) cut it by a factor, at most once per cooldown.
+
+    Args:
+        config (HTTPClientRateLimitConfig): The configuration of the limiter.
+    """
+
+    def __init__(self, config: HTTPClientRateLimitConfig = HTTPClientRateLimitConfig()):
+        self.config = config
+        self.max_rate = config.max_rate
+        self.rate = min(config.initial_rate, self.max_rate)
+        self.tokens = config.burst
+        self.successes = 0
+        self.throttles = 0
+        self.total_wait_seconds = 0.0
+        self.__last_refill = time.monotonic()
+        self.__last_decrease = 0.0
+        self.__lock = threading.Lock()
+
+
+    def __refill(self, now: float) -> None:
+        """
+        Adds the tokens generated since the last refill. Must be called holding the lock.
+
+        Args:
+            now (float): The current monotonic time.
+        """
+        self.tokens = min(self.config.burst, self.tokens + (now - self.__last_refill) * self.rate)
+        self.__last_refill = now
+
+
+    def cap_rate(self, max_rate: Optional[float]) -> None:
+        """
+        Caps the rate of the limiter (e.g. with the rate allowed by the caller of a batch).
+
+        Args:
+            max_rate (Optional[float]): The maximum number of requests per second. None resets the
+                cap to the configured max_rate.
+        """
+        with self.__lock:
+            self.max_rate = min(max_rate, self.config.max_rate) if max_rate else self.config.max_rate
+            self.rate = min(self.rate, self.max_rate)
+
+
+    def acquire(self) -> None:
+        """
+        Blocks the calling thread until a token is available.
+
+        Tokens are reserved while holding the lock (the bucket can go negative), so concurrent
+        threads are spread over time instead of waking up all at once.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__refill(now)
+            self.tokens -= 1
+            wait_seconds = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.total_wait_seconds += wait_seconds
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
+    def record(self, status_code: Optional[int], elapsed_time: Optional[float]) -> None:
+        """
+        Adjusts the rate according to the outcome of a request.
+
+        Args:
+            status_code (Optional[int]): The status code of the response or None on errors.
+            elapsed_time (Optional[float]): The time taken by the request in seconds.
+        """
+        is_throttled = (
+            status_code is None
+            or status_code in THROTTLING_STATUS_CODES
+            or (elapsed_time or 0) > self.config.latency_threshold_seconds
+        )
+
+        with self.__lock:
+            now = time.monotonic()
+            self.__refill(now)
+
+            if not is_throttled:
+                self.successes += 1
+                self.rate = min(self.max_rate, self.rate + self.config.additive_increase / self.rate)
+                return
+
+            self.throttles += 1
+            if now - self.__last_decrease >= self.config.decrease_cooldown_seconds:
+                self.rate = max(self.config.min_rate, self.rate * self.config.multiplicative_decrease)
+                self.__last_decrease = now
+
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the current state of the limiter so it can be published as metrics.
+
+        Returns:
+            A dictionary with the current rate, available tokens and counters of the limiter.
+        """
+        with self.__lock:
+            self.__refill(time.monotonic())
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "tokens": round(self.tokens, 3),
+                "successes": self.successes,
+                "throttles": self.throttles,
+                "total_wait_seconds": round(self.total_wait_seconds, 3)
+            }
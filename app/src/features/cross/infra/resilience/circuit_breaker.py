@@ -0,0 +1,105 @@
+import time
+import threading
+
+from app.src.features.cross.domain.entities.http_client_circuit_breaker_config import (
+    HTTPClientCircuitBreakerConfig
+)
+
+
+class CircuitBreakerOpenError(Exception):
+    """
+    Raised when a call is rejected because the circuit of the host is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Thread safe circuit breaker that fails fast while a host is down.
+
+    The circuit opens after failure_threshold consecutive failures. While open, calls are rejected
+    right away with CircuitBreakerOpenError. After recovery_timeout_seconds a single trial call is
+    allowed (half-open state): its success closes the circuit and its failure opens it again.
+
+    Args:
+        name (str): The name of the protected resource (e.g. the host), used on error messages.
+        config (HTTPClientCircuitBreakerConfig): The configuration of the circuit breaker.
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(
+        self,
+        name: str,
+        config: HTTPClientCircuitBreakerConfig = HTTPClientCircuitBreakerConfig()
+    ):
+        self.name = name
+        self.config = config
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.rejected_calls = 0
+        self.__opened_at = 0.0
+        self.__trial_in_flight = False
+        self.__lock = threading.Lock()
+
+
+    def before_call(self) -> None:
+        """
+        Checks whether a call can go through, raising CircuitBreakerOpenError otherwise.
+        """
+        with self.__lock:
+            if self.state == self.CLOSED:
+                return
+
+            elapsed_seconds = time.monotonic() - self.__opened_at
+            if self.state == self.OPEN and elapsed_seconds >= self.config.recovery_timeout_seconds:
+                self.state = self.HALF_OPEN
+
+            if self.state == self.HALF_OPEN and not self.__trial_in_flight:
+                self.__trial_in_flight = True
+                return
+
+            self.rejected_calls += 1
+            raise CircuitBreakerOpenError(
+                f"Circuit of {self.name} is {self.state} after {self.consecutive_failures} consecutive "
+                f"failures. Rejecting the call without sending it."
+            )
+
+
+    def record_success(self) -> None:
+        """
+        Records a successful call, closing the circuit.
+        """
+        with self.__lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.__trial_in_flight = False
+
+
+    def record_failure(self) -> None:
+        """
+        Records a failed call, opening the circuit when the threshold is reached.
+        """
+        with self.__lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN \
+                    or self.consecutive_failures >= self.config.failure_threshold:
+                self.state = self.OPEN
+                self.__opened_at = time.monotonic()
+            self.__trial_in_flight = False
+
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the current state of the circuit breaker so it can be published as metrics.
+
+        Returns:
+            A dictionary with the state and counters of the circuit breaker.
+        """
+        with self.__lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "rejected_calls": self.rejected_calls
+            }
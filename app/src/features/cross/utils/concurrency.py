@@ -0,0 +1,71 @@
+import os
+import threading
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.src.features.cross.utils.log import LogUtils
+
+
+logger = LogUtils.setup_logger(name=__name__)
+
+# Process pools are kept at module level so they live as long as the (warm) container
+_PROCESS_POOLS: dict[tuple[int, Optional[Callable[..., None]]], Optional[Executor]] = {}
+_PROCESS_POOLS_LOCK = threading.Lock()
+
+
+class ConcurrencyUtils:
+    """
+    Utility class for creating and sharing executors across invocations.
+    """
+
+    @staticmethod
+    def get_process_pool(
+        max_workers: Optional[int] = None,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: tuple[Any, ...] = ()
+    ) -> Optional[Executor]:
+        """
+        Returns a process pool shared by every caller in the container, creating it on first use.
+
+        AWS Lambda doesn't provide /dev/shm, so the semaphores used by multiprocessing can't be
+        created there. In that case (or when max_workers is 0) None is returned and callers are
+        expected to fall back to running the work on the current process.
+
+        Args:
+            max_workers (Optional[int]): The number of worker processes. Defaults to the number of
+                CPUs available. A value of 0 disables the process pool.
+            initializer (Optional[Callable[..., None]]): Optional module-level function run once
+                by each worker process (e.g. to build the objects used by the submitted work).
+                Pools are shared by callers with the same number of workers and initializer.
+            initargs (tuple[Any, ...]): The arguments passed to the initializer.
+
+        Returns:
+            Optional[Executor]: The shared process pool or None if it can't be used.
+        """
+        if max_workers == 0:
+            return None
+
+        max_workers = max_workers or os.cpu_count() or 1
+
+        pool_key = (max_workers, initializer)
+        with _PROCESS_POOLS_LOCK:
+            if pool_key in _PROCESS_POOLS:
+                return _PROCESS_POOLS[pool_key]
+
+            try:
+                # Using spawn because the pool is shared with threads (e.g. HTTP thread pools)
+                process_pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=initializer,
+                    initargs=initargs
+                )
+                logger.info(f"Created a process pool with {max_workers} workers")
+            except (OSError, ImportError, NotImplementedError) as e:
+                logger.warning(f"Process pool is not available on this environment ({e}). "
+                               "The work will run on the current process.")
+                process_pool = None
+
+            _PROCESS_POOLS[pool_key] = process_pool
+            return process_pool
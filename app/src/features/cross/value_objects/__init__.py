@@ -3,3 +3,4 @@ from .stock_type import StockType
 from .timezone import Timezone
 from .batch_process_name import BatchProcessName
 from .process_status import ProcessStatus
+from .html_parser_backend import HTMLParserBackend
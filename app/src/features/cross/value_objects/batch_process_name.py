@@ -5,4 +5,5 @@ class BatchProcessName(Enum):
     """
     Enum representing the names of various batch processes.
     """
-    PROCESS_FUNDAMENTUS_EOD_STOCK_METRICS = "PROCESS_FUNDAMENTUS_EOD_STOCK_METRICS"
\ No newline at end of file
+    PROCESS_FUNDAMENTUS_EOD_STOCK_METRICS = "PROCESS_FUNDAMENTUS_EOD_STOCK_METRICS"
+    PROCESS_FUNDAMENTUS_SCREENER_STOCK_METRICS = "PROCESS_FUNDAMENTUS_SCREENER_STOCK_METRICS"
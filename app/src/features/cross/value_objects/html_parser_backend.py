@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class HTMLParserBackend(Enum):
+    """
+    Enum representing the engines that can be used to parse HTML content.
+    """
+    LXML = "lxml"
+    SELECTOLAX = "selectolax"
+    BEAUTIFULSOUP = "beautifulsoup"
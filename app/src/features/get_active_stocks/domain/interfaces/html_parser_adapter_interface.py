@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 
 from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
 from app.src.features.get_active_stocks.domain.entities.stock import Stock
@@ -9,6 +10,38 @@ class IHTMLParserAdapter(ABC):
     Interface for parsing raw text given by a HTTP request into stocks basic information.
     """
 
+    @abstractmethod
+    def iter_stock_tickers(self, chunks: Iterable[bytes], encoding: str) -> Iterator[tuple[str, str]]:
+        """
+        Yields the stock tickers found on the raw HTML content of a HTTP response.
+
+        Args:
+            chunks (Iterable[bytes]): The raw HTML content of the HTTP response split in chunks.
+            encoding (str): The encoding used to decode the HTML content.
+
+        Returns:
+            Iterator[tuple[str, str]]: The (code, company_name) tuples in the order of the page.
+        """
+
+    @abstractmethod
+    def parse_html_stream(
+        self,
+        chunks: Iterable[bytes],
+        encoding: str,
+        request_config: HTTPClientRequestConfig
+    ) -> list[Stock]:
+        """
+        Parses stocks basic data from the HTML content of a HTTP response as it is streamed.
+
+        Args:
+            chunks (Iterable[bytes]): The raw HTML content of the HTTP response split in chunks.
+            encoding (str): The encoding used to decode the HTML content.
+            request_config (HTTPClientRequestConfig): The object containing metadata of the request.
+
+        Returns:
+            A list of B3 stocks data extracted and parsed from the request.
+        """
+
     @abstractmethod
     def parse_html_content(
         self,
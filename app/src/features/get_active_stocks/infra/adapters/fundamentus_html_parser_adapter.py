@@ -1,6 +1,10 @@
-from bs4 import BeautifulSoup
+from typing import Iterable, Iterator
 
 from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
+from app.src.features.cross.infra.parsers.fundamentus_screener_table_parser import (
+    FundamentusScreenerTableParser,
+    COMPANY_NAME_KEY
+)
 from app.src.features.get_active_stocks.domain.interfaces.html_parser_adapter_interface import (
     IHTMLParserAdapter
 )
@@ -9,6 +13,10 @@ from app.src.features.cross.utils.decorators import timing_decorator
 from app.src.features.cross.utils.log import LogUtils
 
 
+# Header of the screener table column that holds the stock ticker
+TICKER_HEADER = "Papel"
+
+
 class FundamentusHTMLParserAdapter(IHTMLParserAdapter):
     """
     Implementation of IHTMLParserAdapter that parses stock tickers from Fundamentus website.
@@ -18,18 +26,49 @@ class FundamentusHTMLParserAdapter(IHTMLParserAdapter):
         self.logger = LogUtils.setup_logger(name=__name__)
 
 
+    def iter_screener_rows(self, chunks: Iterable[bytes], encoding: str) -> Iterator[dict[str, str]]:
+        """
+        Yields every row of the screener results table in a single incremental pass over the HTML
+        chunks, without consuming the chunks after the results table.
+
+        Args:
+            chunks (Iterable[bytes]): The raw HTML content of the HTTP response split in chunks.
+            encoding (str): The encoding used to decode the HTML content.
+
+        Returns:
+            Iterator[dict[str, str]]: The raw cell strings of each row keyed by the table headers,
+                including the numeric columns and the company name.
+        """
+        return FundamentusScreenerTableParser.iter_rows(chunks=chunks, encoding=encoding)
+
+
+    def iter_stock_tickers(self, chunks: Iterable[bytes], encoding: str) -> Iterator[tuple[str, str]]:
+        """
+        Yields the stock tickers found on the screener results table in a single pass.
+
+        Args:
+            chunks (Iterable[bytes]): The raw HTML content of the HTTP response split in chunks.
+            encoding (str): The encoding used to decode the HTML content.
+
+        Returns:
+            Iterator[tuple[str, str]]: The (code, company_name) tuples in the order of the page.
+        """
+        for row in self.iter_screener_rows(chunks=chunks, encoding=encoding):
+            yield row[TICKER_HEADER].upper().strip(), row[COMPANY_NAME_KEY].upper().strip()
+
+
     @timing_decorator
-    def parse_html_content(
+    def parse_html_stream(
         self,
-        html_content: bytes,
+        chunks: Iterable[bytes],
         encoding: str,
         request_config: HTTPClientRequestConfig
     ) -> list[Stock]:
         """
-        Parses stocks basic data from the raw HTML content of a HTTP response.
+        Parses stocks basic data from the HTML content of a HTTP response as it is streamed.
 
         Args:
-            html_content (bytes): The raw HTML content of the HTTP response.
+            chunks (Iterable[bytes]): The raw HTML content of the HTTP response split in chunks.
             encoding (str): The encoding used to decode the HTML content.
             request_config (HTTPClientRequestConfig): The object containing metadata of the request.
 
@@ -37,31 +76,10 @@ class FundamentusHTMLParserAdapter(IHTMLParserAdapter):
             A list of B3 stocks data extracted and parsed from the request.
         """
 
-        # Decoding the raw HTML text and parsing it using BeautifulSoup
-        try:
-            html_text = html_content.decode(encoding)
-            html_parsed = BeautifulSoup(html_text, "html.parser")
-        except Exception as e:
-            self.logger.exception(f"Error decoding and parsing HTML content: {e}")
-            raise
-
         try:
-            # Returning the HTML table containing cells that have stock information
-            stock_tickers_cells = list({
-                row.find("td")  # type: ignore
-                for row in html_parsed.find_all("tr") if row.find("td") is not None  # type: ignore
-            })
-
-            # Extracting and consolidating information into a sorted list of dictionaries
-            stock_tickers_info = sorted(
-                [
-                    {
-                        "code": cell.find("a").text.upper().strip(),  # type: ignore
-                        "company_name": cell.find("span").get("title").upper().strip()  # type: ignore
-                    }
-                    for cell in stock_tickers_cells
-                ],
-                key=lambda x: x["code"]
+            # Deduplicating tickers by code and sorting them by code
+            stock_tickers_info = dict(
+                self.iter_stock_tickers(chunks=chunks, encoding=encoding)
             )
         except Exception as e:
             self.logger.exception(f"Error extracting stock tickers from HTML content: {e}")
@@ -71,14 +89,38 @@ class FundamentusHTMLParserAdapter(IHTMLParserAdapter):
             # Adapting the result as instances of the expected entity
             stocks = [
                 Stock(
-                    code=info["code"],
-                    company_name=info["company_name"],
+                    code=code,
+                    company_name=company_name,
                     request_config=request_config
                 )
-                for info in stock_tickers_info
+                for code, company_name in sorted(stock_tickers_info.items())
             ]
         except Exception as e:
             self.logger.exception(f"Error adapting stock tickers to Stock entities: {e}")
             raise
 
         return stocks
+
+
+    def parse_html_content(
+        self,
+        html_content: bytes,
+        encoding: str,
+        request_config: HTTPClientRequestConfig
+    ) -> list[Stock]:
+        """
+        Parses stocks basic data from the raw HTML content of a HTTP response.
+
+        Args:
+            html_content (bytes): The raw HTML content of the HTTP response.
+            encoding (str): The encoding used to decode the HTML content.
+            request_config (HTTPClientRequestConfig): The object containing metadata of the request.
+
+        Returns:
+            A list of B3 stocks data extracted and parsed from the request.
+        """
+        return self.parse_html_stream(
+            chunks=[html_content],
+            encoding=encoding,
+            request_config=request_config
+        )
@@ -12,9 +12,11 @@ from app.src.features.get_active_stocks.domain.interfaces.database_repository_in
 )
 from app.src.features.get_active_stocks.domain.entities.stock import Stock
 
+from app.src.features.cross.domain.entities.dynamodb_bulk_write_config import DynamoDBBulkWriteConfig
+from app.src.features.cross.infra.repositories.dynamodb_bulk_writer import DynamoDBBulkWriter
+from app.src.features.cross.infra.repositories.dynamodb_item_marshaller import DynamoDBItemMarshaller
 from app.src.features.cross.utils.decorators import timing_decorator
 from app.src.features.cross.utils.log import LogUtils
-from app.src.features.cross.utils.serialization import SerializationUtils
 
 
 class StockModel(Model):
@@ -42,6 +44,13 @@ class DynamoDBDatabaseRepository(IDatabaseRepository):
     """
     def __init__(self):
         self.logger = LogUtils.setup_logger(name=__name__)
+        self.bulk_writer = DynamoDBBulkWriter(
+            table_name=os.getenv("DYNAMODB_ACTIVE_STOCKS_TABLE_NAME"),
+            config=DynamoDBBulkWriteConfig(
+                max_workers=int(os.getenv("DYNAMODB_BULK_WRITE_MAX_WORKERS", "4"))
+            )
+        )
+        self.item_marshaller = DynamoDBItemMarshaller(model_class=StockModel, entity_class=Stock)
 
 
     @timing_decorator
@@ -58,23 +67,13 @@ class DynamoDBDatabaseRepository(IDatabaseRepository):
                 self.logger.warning(f"Company name is None for stock code {item.code}")
 
         try:
-            with StockModel.batch_write() as batch:
-                for idx, stock in enumerate(items):
-                    model = (StockModel(**SerializationUtils.json_serialize(stock)))
-                    batch.save(model)
-
-                    # Logging the status of the loop
-                    LogUtils.log_loop_status(
-                        logger=self.logger,
-                        loop_idx=idx,
-                        total_elements=len(items),
-                        log_pace=200,
-                        log_msg=f"Put {idx} items to the database repository"
-                    )
+            # Marshalling the entities straight into DynamoDB items (no model instances on the hot
+            # path) and writing them in parallel chunks of 25 items
+            self.bulk_writer.put_items([self.item_marshaller.marshal(stock) for stock in items])
 
         except Exception:
             self.logger.exception("Error saving batch of stocks data on table "
-                                  f"{StockModel.Meta.table_name} on stock {stock}")
+                                  f"{StockModel.Meta.table_name}")
             raise
         else:
             self.logger.info("Successfully inserted items to DynamoDB table "
@@ -1,8 +1,10 @@
+import os
 from typing import Any
 
 from app.src.features.cross.infra.adapters.requests_http_client_adapter import (
     RequestsHTTPClientAdapter
 )
+from app.src.features.cross.infra.adapters.aiohttp_http_client_adapter import AIOHTTPClientAdapter
 from app.src.features.get_active_stocks.infra.adapters.fundamentus_html_parser_adapter import (
     FundamentusHTMLParserAdapter
 )
@@ -17,7 +19,10 @@ from app.src.features.cross.infra.mappers.http_response_mapper import HTTPRespon
 
 
 # Initializing mappers, adapters and repositories
-http_client_adapter = RequestsHTTPClientAdapter()
+http_client_adapter = (
+    AIOHTTPClientAdapter() if os.getenv("HTTP_CLIENT_BACKEND") == "aiohttp"
+    else RequestsHTTPClientAdapter()
+)
 html_parser_adapter = FundamentusHTMLParserAdapter()
 database_repository = DynamoDBDatabaseRepository()
 topic_adapter = SNSTopicAdapter()
@@ -27,7 +32,11 @@ use_case = GetActiveStocksUseCase(
     http_client_adapter=http_client_adapter,
     html_parser_adapter=html_parser_adapter,
     database_repository=database_repository,
-    topic_adapter=topic_adapter
+    topic_adapter=topic_adapter,
+    detail_fetch_weekdays=(
+        tuple(int(weekday) for weekday in os.getenv("FUNDAMENTUS_DETAIL_FETCH_WEEKDAYS").split(","))
+        if os.getenv("FUNDAMENTUS_DETAIL_FETCH_WEEKDAYS") else None
+    )
 )
 
 
@@ -46,4 +55,8 @@ def handler(event: dict[str, Any], context: Any = None) -> dict:
 
     output_dto = use_case.execute()
 
+    # Pool stats are only logged by batch_get, which the use case doesn't use
+    if isinstance(http_client_adapter, RequestsHTTPClientAdapter):
+        http_client_adapter.log_pool_stats()
+
     return HTTPResponseMapper.map(output_dto)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from app.src.features.get_active_stocks.domain.interfaces.html_parser_adapter_interface import (
     IHTMLParserAdapter
@@ -14,9 +15,11 @@ from app.src.features.cross.domain.entities.stock_message_envelop import StockMe
 from app.src.features.cross.domain.interfaces.http_client_adapter import IHTTPClientAdapter
 from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
 from app.src.features.cross.domain.entities.http_client_retry_config import HTTPClientRetryConfig
-from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+from app.src.features.cross.domain.entities.http_client_stream_response import HTTPClientStreamResponse
 from app.src.features.cross.domain.dtos.output_dto import OutputDTO
 from app.src.features.cross.utils.log import LogUtils
+from app.src.features.cross.utils.date_and_time import DateAndTimeUtils
+from app.src.features.cross.value_objects import Timezone
 
 
 logger = LogUtils.setup_logger(name=__name__)
@@ -30,12 +33,17 @@ class GetActiveStocksUseCase:
     Args:
         http_client_adapter (IHTTPClientAdapter): Adapter for making HTTP requests.
         html_parser_adapter (IHTMLParserAdapter): Adapter for parsing B3 stock tickers.
+        detail_fetch_weekdays (Optional[tuple[int, ...]]): The weekdays (0 = Monday) on which the
+            per stock messages that trigger the detail pages fetches are published. When None,
+            they are published every day. On the other days only the bulk screener metrics are
+            collected.
     """
 
     http_client_adapter: IHTTPClientAdapter
     html_parser_adapter: IHTMLParserAdapter
     database_repository: IDatabaseRepository
     topic_adapter: ITopicAdapter
+    detail_fetch_weekdays: Optional[tuple[int, ...]] = None
 
 
     def execute(self) -> OutputDTO:
@@ -62,28 +70,41 @@ class GetActiveStocksUseCase:
                 )
             )
 
-            logger.info(f"Scrapping active stocks raw content from URL {request_config.url}")
-            http_response: HTTPClientResponse = self.http_client_adapter.get(request_config=request_config)
-
-            logger.info("Parsing raw text from the HTTP response into stocks data")
-            stocks: list[Stock] = self.html_parser_adapter.parse_html_content(
-                html_content=http_response.content,
-                encoding=http_response.encoding,
+            logger.info(f"Streaming active stocks raw content from URL {request_config.url}")
+            http_response: HTTPClientStreamResponse = self.http_client_adapter.stream(
                 request_config=request_config
             )
 
+            logger.info("Parsing raw text from the HTTP response into stocks data as it is streamed")
+            try:
+                stocks: list[Stock] = self.html_parser_adapter.parse_html_stream(
+                    chunks=http_response.chunks,
+                    encoding=http_response.encoding,
+                    request_config=request_config
+                )
+            finally:
+                http_response.close()
+
             logger.info(f"Saving {len(stocks)} active stocks data to the database repository")
             self.database_repository.batch_insert_items(items=stocks)
 
-            logger.info(f"Publishing {len(stocks)} active stocks data to a topic service")
-            messages = [
-                StockMessageEnvelop(
-                    code=stock.code,
-                    total_expected_messages=len(stocks)
-                )
-                for stock in stocks
-            ]
-            self.topic_adapter.batch_publish_messages(messages=messages)
+            weekday = DateAndTimeUtils.datetime_now_date(timezone=Timezone.SAO_PAULO).weekday()
+            publish_messages = (
+                self.detail_fetch_weekdays is None or weekday in self.detail_fetch_weekdays
+            )
+            if publish_messages:
+                logger.info(f"Publishing {len(stocks)} active stocks data to a topic service")
+                messages = [
+                    StockMessageEnvelop(
+                        code=stock.code,
+                        total_expected_messages=len(stocks)
+                    )
+                    for stock in stocks
+                ]
+                self.topic_adapter.batch_publish_messages(messages=messages)
+            else:
+                logger.info(f"Skipping the publication of active stocks messages as weekday {weekday} "
+                            f"is not one of the detail fetch weekdays {self.detail_fetch_weekdays}")
 
         except Exception:
             logger.exception(f"Error fetching and saving active stocks data")
@@ -92,6 +113,7 @@ class GetActiveStocksUseCase:
         return OutputDTO.ok(
             data={
                 "total_active_stocks": len(stocks),
+                "published_messages": len(stocks) if publish_messages else 0,
                 "active_stocks_table_name": "XPTO",
                 "active_stocks_topic_name": "XPTO"
             }
@@ -76,6 +76,8 @@ class FundamentusStockMetrics:
         vlr_lucro_liq_ult_3m (Optional[float]): Net income in last 3 months
         execution_timestamp (timestamp): Date and time reference for data extraction
         execution_date (str): Date reference for data extraction
+        content_hash (Optional[str]): Hash of the raw page content the metrics were parsed from
+        missing_fields (list[str]): Fields whose headings were not found on the page
     """
 
     nome_papel: str
@@ -148,6 +150,8 @@ class FundamentusStockMetrics:
             timezone=Timezone.SAO_PAULO,
         )
     )
+    content_hash: Optional[str] = None
+    missing_fields: list[str] = field(default_factory=list)
 
     def __post_init__(self):
         # Normalize required string fields
@@ -19,3 +19,14 @@ class IDatabaseRepository(ABC):
             stock_metrics_list (list[FundamentusStockMetrics]): List of stock metrics to save.
         """
 
+    @abstractmethod
+    def get_latest_content_hashes(self, stock_codes: list[str]) -> dict[str, str]:
+        """
+        Gets the content hash of the latest stored stock metrics of each stock code.
+
+        Args:
+            stock_codes (list[str]): The stock codes to look up.
+
+        Returns:
+            A dictionary mapping each stock code to the content hash of its latest stored record.
+        """
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Any, Iterable
 
 from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
+from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
 from app.src.features.get_fundamentus_eod_stock_metrics.domain.entities.fundamentus_stock_metrics import (
     FundamentusStockMetrics
 )
@@ -11,6 +13,25 @@ class IHTMLParserAdapter(ABC):
     Interface for parsing raw text given by a HTTP request into stocks basic information.
     """
 
+    @abstractmethod
+    def parse_stock_metrics_fields(
+        self,
+        html_content: bytes,
+        encoding: str,
+        request_config: HTTPClientRequestConfig
+    ) -> dict[str, Any]:
+        """
+        Parses the raw HTML content of a HTTP response into the converted stock metrics fields.
+
+        Args:
+            html_content (bytes): The raw HTML content of the HTTP response.
+            encoding (str): The encoding used to decode the HTML content.
+            request_config (HTTPClientRequestConfig): The object containing metadata of the request.
+
+        Returns:
+            A dictionary with the keyword arguments of a FundamentusStockMetrics entity.
+        """
+
     @abstractmethod
     def parse_html_content(
         self,
@@ -29,3 +50,56 @@ class IHTMLParserAdapter(ABC):
         Returns:
             A FundamentusStockMetrics entity containing the parsed stock metrics data.
         """
+
+    @abstractmethod
+    def parse_many(
+        self,
+        pages: list[HTTPClientResponse],
+        as_frame: bool = False
+    ) -> list[FundamentusStockMetrics] | Any:
+        """
+        Parses stocks metrics data from many pages at once (e.g. on backfills of cached pages).
+
+        Args:
+            pages (list[HTTPClientResponse]): The HTTP responses of the stock metrics pages.
+            as_frame (bool): Whether to return a columnar table instead of entities.
+
+        Returns:
+            A list of FundamentusStockMetrics entities (in the same order of the pages) or a
+            columnar table with one row per page and one column per entity field.
+        """
+
+    @abstractmethod
+    def parse_screener_html_content(
+        self,
+        html_content: bytes,
+        encoding: str
+    ) -> list[FundamentusStockMetrics]:
+        """
+        Parses partial stocks metrics data of every ticker listed on the screener page.
+
+        Args:
+            html_content (bytes): The raw HTML content of the screener page.
+            encoding (str): The encoding used to decode the HTML content.
+
+        Returns:
+            A list of partial FundamentusStockMetrics entities, one per ticker.
+        """
+
+    @abstractmethod
+    def parse_screener_html_stream(
+        self,
+        chunks: Iterable[bytes],
+        encoding: str
+    ) -> list[FundamentusStockMetrics]:
+        """
+        Parses partial stocks metrics data of every ticker listed on the screener page as the
+        page is streamed.
+
+        Args:
+            chunks (Iterable[bytes]): The raw HTML content of the screener page split in chunks.
+            encoding (str): The encoding used to decode the HTML content.
+
+        Returns:
+            A list of partial FundamentusStockMetrics entities, one per ticker.
+        """
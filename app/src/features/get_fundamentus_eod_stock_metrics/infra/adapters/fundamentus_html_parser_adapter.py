@@ -1,10 +1,35 @@
+import re
+import math
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
 
 from bs4 import BeautifulSoup
 import pandas as pd
 import numpy as np
 
+try:
+    import lxml.html
+except ImportError:  # pragma: no cover - lxml is shipped on the Lambda layer
+    lxml = None
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxHTMLParser
+except ImportError:
+    SelectolaxHTMLParser = None
+
 from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
+from app.src.features.cross.domain.entities.http_client_response import HTTPClientResponse
+from app.src.features.cross.infra.parsers.fundamentus_screener_table_parser import (
+    FundamentusScreenerTableParser
+)
+from app.src.features.get_fundamentus_eod_stock_metrics.infra.parsers.fundamentus_field_matcher import (
+    FundamentusFieldMatcher
+)
+from app.src.features.get_fundamentus_eod_stock_metrics.infra.parsers.stock_metrics_mapping_provider import (
+    StockMetricsMapping,
+    StockMetricsMappingProvider
+)
 from app.src.features.get_fundamentus_eod_stock_metrics.domain.interfaces.html_parser_adapter_interface import (
     IHTMLParserAdapter
 )
@@ -13,149 +38,244 @@ from app.src.features.get_fundamentus_eod_stock_metrics.domain.entities.fundamen
 )
 from app.src.features.cross.utils.decorators import timing_decorator
 from app.src.features.cross.utils.log import LogUtils
-from app.src.features.cross.value_objects import DateFormat
-
+from app.src.features.cross.value_objects import DateFormat, HTMLParserBackend
 
-pd.set_option('future.no_silent_downcasting', True)
 
 # Defining some constants used in the parsing process
-VARIATION_HEADINGS = [
-    "Dia", "Mês", "30 dias", "12 meses"
-] + [str(datetime.now().year - i) for i in range(6)]
-
+FLOAT_FIELD_PREFIXES = ("vlr_", "vol_", "num_", "pct_", "qtd_", "max_", "min_")
+PERCENTAGE_FIELD_PREFIX = "pct_"
+NON_NUMERIC_CHARS_REGEX = re.compile(r"[^0-9,.-]")
+INTEGER_REGEX = re.compile(r"-?[0-9]+")
+FLOAT_TRANSLATION_TABLE = str.maketrans({",": "."})
+PERCENTAGE_TRANSLATION_TABLE = str.maketrans({"%": None, ",": "."})
+
+METRICS_TABLE_CLASS = "w728"
+METRICS_TABLE_XPATH = (
+    f"//table[contains(concat(' ', normalize-space(@class), ' '), ' {METRICS_TABLE_CLASS} ')]"
+)
 
-STOCK_METRICS_MAPPING = {
+# Columns of the screener table (resultado.php) that match the stock metrics entity fields
+SCREENER_METRICS_MAPPING = {
     "Papel": "nome_papel",
-    "Tipo": "tipo_papel",
     "Empresa": "nome_empresa",
-    "Setor": "nome_setor",
-    "Subsetor": "nome_subsetor",
     "Cotação": "vlr_cot",
-    "Data últ cot": "dt_ult_cot",
-    "Min 52 sem": "vlr_cot_min_52_sem",
-    "Max 52 sem": "vlr_cot_max_52_sem",
-    "Vol $ méd (2m)": "vol_med_neg_2m",
-    "Valor de mercado": "vlr_mercado",
-    "Valor da firma": "vlr_firma",
-    "Últ balanço processado": "dt_ult_balanco_proc",
-    "Nro. Ações": "num_acoes",
-    "Dia": "pct_var_dia",
-    "Mês": "pct_var_mes",
-    "30 dias": "pct_var_30d",
-    "12 meses": "pct_var_12m",
-    str(datetime.now().year): "pct_var_ano_a0",
-    str(datetime.now().year - 1): "pct_var_ano_a1",
-    str(datetime.now().year - 2): "pct_var_ano_a2",
-    str(datetime.now().year - 3): "pct_var_ano_a3",
-    str(datetime.now().year - 4): "pct_var_ano_a4",
-    str(datetime.now().year - 5): "pct_var_ano_a5",
     "P/L": "vlr_p_sobre_l",
     "P/VP": "vlr_p_sobre_vp",
-    "P/EBIT": "vlr_p_sobre_ebit",
     "PSR": "vlr_psr",
-    "P/Ativos": "vlr_p_sobre_ativ",
-    "P/Cap. Giro": "vlr_p_sobre_cap_giro",
-    "P/Ativ Circ Liq": "vlr_p_sobre_ativ_circ_liq",
-    "Div. Yield": "vlr_div_yield",
-    "EV / EBITDA": "vlr_ev_sobre_ebitda",
-    "EV / EBIT": "vlr_ev_sobre_ebit",
-    "Cres. Rec (5a)": "pct_cresc_rec_liq_ult_5a",
-    "LPA": "vlr_lpa",
-    "VPA": "vlr_vpa",
-    "Marg. Bruta": "vlr_margem_bruta",
-    "Marg. EBIT": "vlr_margem_ebit",
-    "Marg. Líquida": "vlr_margem_liq",
-    "EBIT / Ativo": "vlr_ebit_sobre_ativo",
+    "Div.Yield": "vlr_div_yield",
+    "P/Ativo": "vlr_p_sobre_ativ",
+    "P/Cap.Giro": "vlr_p_sobre_cap_giro",
+    "P/EBIT": "vlr_p_sobre_ebit",
+    "P/Ativ Circ.Liq": "vlr_p_sobre_ativ_circ_liq",
+    "EV/EBIT": "vlr_ev_sobre_ebit",
+    "EV/EBITDA": "vlr_ev_sobre_ebitda",
+    "Mrg Ebit": "vlr_margem_ebit",
+    "Mrg. Líq.": "vlr_margem_liq",
+    "Liq. Corr.": "vlr_liquidez_corr",
     "ROIC": "vlr_roic",
     "ROE": "vlr_roe",
-    "Liquidez Corr": "vlr_liquidez_corr",
-    "Div Br/ Patrim": "vlr_divida_bruta_sobre_patrim",
-    "Giro Ativos": "vlr_giro_ativos",
-    "Ativo": "vlr_ativo",
-    "Disponibilidades": "vlr_disponibilidades",
-    "Ativo Circulante": "vlr_ativ_circulante",
-    "Dív. Bruta": "vlr_divida_bruta",
-    "Dív. Líquida": "vlr_divida_liq",
+    "Liq.2meses": "vol_med_neg_2m",
     "Patrim. Líq": "vlr_patrim_liq",
-    "Receita Líquida_1": "vlr_receita_liq_ult_12m",
-    "EBIT_1": "vlr_ebit_ult_12m",
-    "Lucro Líquido_1": "vlr_lucro_liq_ult_12m",
-    "Receita Líquida": "vlr_receita_liq_ult_3m",
-    "EBIT": "vlr_ebit_ult_3m",
-    "Lucro Líquido": "vlr_lucro_liq_ult_3m"
+    "Dív.Brut/ Patrim.": "vlr_divida_bruta_sobre_patrim",
+    "Cresc. Rec.5a": "pct_cresc_rec_liq_ult_5a"
 }
 
+# Text fields that are normalized by the entity and can't be None on partial records
+REQUIRED_TEXT_FIELDS = ("tipo_papel", "nome_setor", "nome_subsetor")
+
 
 class FundamentusHTMLParserAdapter(IHTMLParserAdapter):
     """
     Implementation of IHTMLParserAdapter that parses stock tickers from Fundamentus website.
+
+    The HTML tree is built by a pluggable backend. C-backed engines (lxml or selectolax) are
+    used by default and BeautifulSoup is kept as a fallback when they are not installed. All
+    backends only walk the cells of the metrics tables and produce identical entities.
+
+    Args:
+        parser_backend (HTMLParserBackend): The engine used to build the HTML tree.
     """
 
-    def __init__(self):
+    def __init__(self, parser_backend: HTMLParserBackend = HTMLParserBackend.LXML):
         self.logger = LogUtils.setup_logger(name=__name__)
-        self.variation_headings = VARIATION_HEADINGS
-        self.stock_metrics_mapping = STOCK_METRICS_MAPPING
+        self.screener_metrics_mapping = SCREENER_METRICS_MAPPING
+        self.parser_backend = self.__resolve_parser_backend(parser_backend)
+        self.metrics_mapping: Optional[StockMetricsMapping] = None
+        self.__refresh_metrics_mapping()
 
 
-    def __parse_float_cols(self, df: pd.DataFrame, cols_list: list) -> pd.DataFrame:
+    def __refresh_metrics_mapping(self) -> None:
         """
-        Convert columns in a pandas DataFrame from string to float.
+        Rebuilds the field parsers and the field matcher when the stock metrics mapping of the
+        current year (São Paulo timezone) is not the one they were built from.
+        """
+        metrics_mapping = StockMetricsMappingProvider.get_mapping()
+        if metrics_mapping is self.metrics_mapping:
+            return
+
+        self.logger.debug(f"Building the field parsers of the {metrics_mapping.year} stock metrics "
+                          "mapping")
+        self.metrics_mapping = metrics_mapping
+        self.field_parsers = self.__build_field_parsers()
+        self.field_matcher = FundamentusFieldMatcher(
+            stock_metrics_mapping=metrics_mapping.stock_metrics_mapping,
+            variation_headings=metrics_mapping.variation_headings
+        )
 
-        This method can be executed to convert string attributes present in a pandas DataFrame into
-        float attributes (as long as such strings can be converted to floats). This functionality
-        is relevant because, in the raw extraction of information by the scrapper process, all
-        attributes are originally set in the pandas DataFrame as strings, which can make further
-        analysis difficult for users.
+
+    def __resolve_parser_backend(self, parser_backend: HTMLParserBackend) -> HTMLParserBackend:
+        """
+        Falls back to BeautifulSoup when the requested C-backed engine is not installed.
 
         Args:
-            df (pd.DataFrame): The information extracted from the Fundamentus investment website
-            cols_list (list): The columns to be treated and subsequently converted.
+            parser_backend (HTMLParserBackend): The engine requested on the adapter initialization.
 
         Returns:
-            A pandas DataFrame with the float fields already converted.
+            HTMLParserBackend: The engine that will actually be used.
         """
-        for col in cols_list:
-            df[col] = df[col].replace('[^0-9,.-]', '', regex=True)  # Keep negative signs and decimals
-            df[col] = df[col].replace("", np.nan).infer_objects(copy=False)
-            df[col] = df[col].replace(",", ".", regex=True)
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        if (parser_backend == HTMLParserBackend.LXML and lxml is None) or \
+           (parser_backend == HTMLParserBackend.SELECTOLAX and SelectolaxHTMLParser is None):
+            self.logger.warning(f"HTML parser backend '{parser_backend.value}' is not installed. "
+                                "Falling back to BeautifulSoup")
+            return HTMLParserBackend.BEAUTIFULSOUP
 
-        return df
+        return parser_backend
 
 
-    def __parse_percentage_cols(self, df: pd.DataFrame, cols_list: list) -> pd.DataFrame:
+    def __extract_table_rows(self, html_content: bytes, encoding: str) -> list[list[str]]:
         """
-        Convert columns in a pandas DataFrame that represent percentages from string to float.
+        Extracts the text of every cell of the metrics tables, row by row.
 
-        Sometimes, the columns in a pandas DataFrame that represent percentages are represented as
-        strings with a '%' symbol. This method can be executed to convert such string attributes
-        into float attributes (as long as such strings can be converted to floats).
+        Args:
+            html_content (bytes): The raw HTML content of the HTTP response.
+            encoding (str): The encoding used to decode the HTML content.
+
+        Returns:
+            A list of rows, each one being the list of the texts of its cells.
+        """
+        if self.parser_backend == HTMLParserBackend.LXML:
+            html_parsed = lxml.html.fromstring(
+                html_content,
+                parser=lxml.html.HTMLParser(encoding=encoding)
+            )
+            return [
+                [cell.text_content() for cell in row.iter("td")]
+                for table in html_parsed.xpath(METRICS_TABLE_XPATH)
+                for row in table.iter("tr")
+            ]
+
+        if self.parser_backend == HTMLParserBackend.SELECTOLAX:
+            html_parsed = SelectolaxHTMLParser(html_content.decode(encoding))
+            return [
+                [cell.text(deep=True) for cell in row.css("td")]
+                for table in html_parsed.css(f"table.{METRICS_TABLE_CLASS}")
+                for row in table.css("tr")
+            ]
+
+        html_parsed = BeautifulSoup(html_content.decode(encoding), "html.parser")
+        return [
+            [cell.text for cell in row.find_all("td")]
+            for table in html_parsed.find_all("table", attrs={"class": METRICS_TABLE_CLASS})
+            for row in table.find_all("tr")
+        ]
+
+
+    @staticmethod
+    def parse_text_value(value: Optional[str]) -> Optional[str]:
+        """
+        Keeps a raw string extracted from the Fundamentus website as it is.
 
         Args:
-            df (pd.DataFrame): The information extracted from the Fundamentus investment website
-            cols_list (list): The columns to be treated and subsequently converted.
+            value (Optional[str]): The raw string value.
 
         Returns:
-            A pandas DataFrame with the float fields already converted.
+            The same string value (or None when the heading was not found).
         """
-        for col in cols_list:
-            # Remove percentage symbol and clean up the data
-            df[col] = df[col].str.replace("%", "", regex=False)
-            df[col] = df[col].replace("", np.nan).infer_objects(copy=False)
-            df[col] = df[col].replace(",", ".", regex=True)
-            df[col] = pd.to_numeric(df[col], errors='coerce') / 100
+        return value
 
-        return df
 
+    @staticmethod
+    def parse_float_value(value: Optional[str]) -> float | int:
+        """
+        Converts a raw string extracted from the Fundamentus website to a number.
 
-    def parse_html_content(
+        Every character that is not a digit, a comma, a dot or a negative sign is removed and the
+        comma is taken as the decimal separator. Values that can't be converted result in NaN.
+
+        Args:
+            value (Optional[str]): The raw string value.
+
+        Returns:
+            The converted number (int when the cleaned value is an integer) or NaN.
+        """
+        if value is None:
+            return math.nan
+
+        cleaned_value = NON_NUMERIC_CHARS_REGEX.sub("", value).translate(FLOAT_TRANSLATION_TABLE)
+        if INTEGER_REGEX.fullmatch(cleaned_value):
+            return int(cleaned_value)
+
+        try:
+            return float(cleaned_value) if cleaned_value else math.nan
+        except ValueError:
+            return math.nan
+
+
+    @staticmethod
+    def parse_percentage_value(value: Optional[str]) -> float:
+        """
+        Converts a raw percentage string (e.g. "-1,23%") extracted from the Fundamentus website
+        to a float ratio (e.g. -0.0123). Values that can't be converted result in NaN.
+
+        Args:
+            value (Optional[str]): The raw string value.
+
+        Returns:
+            The converted ratio or NaN.
+        """
+        if value is None:
+            return math.nan
+
+        cleaned_value = value.translate(PERCENTAGE_TRANSLATION_TABLE)
+        if not cleaned_value or "_" in cleaned_value:
+            return math.nan
+
+        try:
+            return float(cleaned_value) / 100
+        except ValueError:
+            return math.nan
+
+
+    def __build_field_parsers(self) -> dict[str, tuple[str, Callable[[Optional[str]], object]]]:
+        """
+        Precomputes, for each heading of the stock metrics mapping, the target entity field and
+        the function used to convert its raw value.
+
+        Returns:
+            A dictionary mapping headings to (field name, conversion function) tuples.
+        """
+        field_parsers = {}
+        for heading, field_name in self.metrics_mapping.stock_metrics_mapping.items():
+            if field_name.startswith(PERCENTAGE_FIELD_PREFIX):
+                parse = self.parse_percentage_value
+            elif field_name.startswith(FLOAT_FIELD_PREFIXES):
+                parse = self.parse_float_value
+            else:
+                parse = self.parse_text_value
+
+            field_parsers[heading] = (field_name, parse)
+
+        return field_parsers
+
+
+    def __extract_stock_metrics_data(
         self,
         html_content: bytes,
         encoding: str,
         request_config: HTTPClientRequestConfig
-    ) -> FundamentusStockMetrics:
+    ) -> dict[str, str]:
         """
-        Parses stocks metrics data from the raw HTML content of a HTTP response.
+        Extracts the raw (not converted) stock metrics data from the HTML content of a page.
 
         Args:
             html_content (bytes): The raw HTML content of the HTTP response.
@@ -163,63 +283,23 @@ class FundamentusHTMLParserAdapter(IHTMLParserAdapter):
             request_config (HTTPClientRequestConfig): The object containing metadata of the request.
 
         Returns:
-            A list of B3 stocks data extracted and parsed from the request.
+            A dictionary mapping the headings found on the page to their raw string values.
         """
 
-        self.logger.debug(f"Decoding HTML content and parsing it using BeautifulSoup")
+        self.__refresh_metrics_mapping()
+
+        self.logger.debug(f"Decoding HTML content and parsing it using {self.parser_backend.value}")
         try:
-            html_text = html_content.decode(encoding)
-            html_parsed = BeautifulSoup(html_text, "html.parser")
+            table_rows = self.__extract_table_rows(html_content=html_content, encoding=encoding)
         except Exception:
-            self.logger.exception(f"Error decoding HTML content and parsing it using BeautifulSoup")
+            self.logger.exception(f"Error decoding HTML content and parsing it using "
+                                  f"{self.parser_backend.value}")
             raise
 
         self.logger.debug(f"Extracting stock metrics data from the parsed HTML content")
         try:
-            # Getting the all tables that contains the stock metrics data
-            tables = html_parsed.find_all("table", attrs={'class': 'w728'})
-            
-            # Iterating over all tables
-            stock_metrics_data_raw = []
-            for table in tables:
-                table_row = table.find_all("tr")
-
-                # Iterating over all rows in each table
-                for table_data in table_row:
-                    cells_list = table_data.find_all("td")
-
-                    # Getting the headings (cells that contains "?" or are in the variation headings list)
-                    headings = [
-                        cell.text.replace("?", "").strip()
-                        for cell in cells_list
-                        if "?" in cell.text or cell.text in self.variation_headings
-                    ]
-
-                    # Handling duplicated headings by appending a suffix to make them unique
-                    for header in headings:
-                        if headings.count(header) > 1:
-                            new_header_name = header + "_1"
-                            headings[headings.index(header)] = new_header_name
-
-                    # Getting all values (cells that are not "?" and not in the headings list)
-                    values = [
-                        cell.text.strip() for cell in cells_list
-                        if ("?" not in cell.text) and (cell.text not in headings)
-                    ]
-
-                    # Building a dictionary with headings as keys and values as values
-                    table_data_dict = {
-                        header: value for header, value in zip(headings, values)
-                    }
-
-                    if table_data_dict != {}:
-                        stock_metrics_data_raw.append(table_data_dict)
-            
-            # Building a consolidated dictionary with all stock metrics data
-            stock_metrics_data = {
-                name: value for dictionary in stock_metrics_data_raw
-                for name, value in dictionary.items()
-            }
+            # Matching the headings to the values of every row of the metrics tables
+            stock_metrics_data = self.field_matcher.match_rows(table_rows)
 
             if not "Papel" in stock_metrics_data:
                 raise ValueError(f"Error parsing stock metrics on URL {request_config.url} because "
@@ -229,62 +309,327 @@ class FundamentusHTMLParserAdapter(IHTMLParserAdapter):
             self.logger.exception("Error extracting stock metrics from HTML content")
             raise
 
-        self.logger.debug("Initializing a pandas DataFrame to manipulate the stock metrics data")
+        return stock_metrics_data
+
+
+    def parse_stock_metrics_fields(
+        self,
+        html_content: bytes,
+        encoding: str,
+        request_config: HTTPClientRequestConfig
+    ) -> dict[str, Any]:
+        """
+        Parses the raw HTML content of a HTTP response into the converted stock metrics fields.
+
+        The returned dictionary only holds builtin types, so this method can run on a worker
+        process and have its (compact) result sent back to the parent process.
+
+        Args:
+            html_content (bytes): The raw HTML content of the HTTP response.
+            encoding (str): The encoding used to decode the HTML content.
+            request_config (HTTPClientRequestConfig): The object containing metadata of the request.
+
+        Returns:
+            A dictionary with the keyword arguments of a FundamentusStockMetrics entity.
+        """
+
+        stock_metrics_data = self.__extract_stock_metrics_data(
+            html_content=html_content,
+            encoding=encoding,
+            request_config=request_config
+        )
+
+        self.logger.debug("Converting the stock metrics data to the entity fields")
         try:
-            df_stock_metrics = pd.DataFrame(stock_metrics_data, index=[0])
-            df_stock_metrics.rename(
-                columns=self.stock_metrics_mapping,
-                errors="ignore",
-                inplace=True
+            stock_metrics_fields = {
+                field_name: parse(stock_metrics_data.get(heading))
+                for heading, (field_name, parse) in self.field_parsers.items()
+            }
+            stock_metrics_fields["execution_date"] = datetime.now().strftime(DateFormat.DATE.value)
+
+            # Missing headings are probably due to changes in the HTML structure of the Fundamentus
+            # website. Their fields are filled with None/NaN values and listed on the entity.
+            stock_metrics_fields["missing_fields"] = self.field_matcher.get_missing_fields(
+                stock_metrics_data
             )
 
-            dataset_cols = list(self.stock_metrics_mapping.values())
-            df_stock_metrics = df_stock_metrics[dataset_cols]
-        
-        except KeyError:
-            self.logger.debug(f"Error adapting stock metrics to a DataFrame because some expected "
-                              "columns are missing and this is probably due to changes in the HTML "
-                              "structure of the Fundamentus website. Columns that are missing will "
-                              "be filled with None values.")
-            for col in dataset_cols:
-                if col not in list(df_stock_metrics.columns):
-                    df_stock_metrics[col] = None
-        
-        # Reordering columns and adding the execution date column
-        df_stock_metrics = df_stock_metrics[dataset_cols]
-        df_stock_metrics.loc[:, ["execution_date"]] = datetime.now().strftime(DateFormat.DATE.value)
+        except Exception:
+            self.logger.exception("Error parsing and converting the numeric data types of the "
+                                  "stock metrics fields")
+            raise
 
-        self.logger.debug("Parsing and converting the numeric data types of the DataFrame columns")
+        return stock_metrics_fields
+
+
+    def parse_html_content(
+        self,
+        html_content: bytes,
+        encoding: str,
+        request_config: HTTPClientRequestConfig
+    ) -> FundamentusStockMetrics:
+        """
+        Parses stocks metrics data from the raw HTML content of a HTTP response.
+
+        Args:
+            html_content (bytes): The raw HTML content of the HTTP response.
+            encoding (str): The encoding used to decode the HTML content.
+            request_config (HTTPClientRequestConfig): The object containing metadata of the request.
+
+        Returns:
+            A FundamentusStockMetrics entity containing the parsed stock metrics data.
+        """
+
+        stock_metrics_fields = self.parse_stock_metrics_fields(
+            html_content=html_content,
+            encoding=encoding,
+            request_config=request_config
+        )
+
+        self.logger.debug("Adapting the stock metrics data to an instance of FundamentusStockMetrics")
         try:
-            float_cols_to_parse = [
-                col for col in list(df_stock_metrics.columns)
-                if col[:4] in ("vlr_", "vol_", "num_", "pct_", "qtd_", "max_", "min_", "total_")
-            ]
-            percent_cols_to_parse = [col for col in float_cols_to_parse if col[:4] in ("pct_")]
+            stock_metrics = FundamentusStockMetrics(**stock_metrics_fields)
+        except Exception:
+            self.logger.exception("Error adapting the stock metrics data to FundamentusStockMetrics "
+                                  "entity")
+            raise
+
+        return stock_metrics
 
-            # First parse percentage columns (while they're still strings)
-            df_stock_metrics_percent_prep = self.__parse_percentage_cols(
-                df=df_stock_metrics,
-                cols_list=percent_cols_to_parse
-            )
 
-            # Then parse remaining float columns (excluding percentage columns)
-            non_percent_float_cols = [col for col in float_cols_to_parse if col not in percent_cols_to_parse]
-            df_stock_metrics_prep = self.__parse_float_cols(
-                df=df_stock_metrics_percent_prep,
-                cols_list=non_percent_float_cols
+    def __parse_float_series(self, series: pd.Series) -> pd.Series:
+        """
+        Vectorized version of parse_float_value applied over a whole column of raw strings.
+
+        Args:
+            series (pd.Series): The column of raw string values.
+
+        Returns:
+            A numeric pandas Series.
+        """
+        cleaned_series = series.str.replace(NON_NUMERIC_CHARS_REGEX, "", regex=True) \
+                               .str.replace(",", ".", regex=False) \
+                               .replace("", np.nan)
+        return pd.to_numeric(cleaned_series, errors="coerce")
+
+
+    def __parse_percentage_series(self, series: pd.Series) -> pd.Series:
+        """
+        Vectorized version of parse_percentage_value applied over a whole column of raw strings.
+
+        Args:
+            series (pd.Series): The column of raw string values.
+
+        Returns:
+            A numeric pandas Series with the percentage ratios.
+        """
+        cleaned_series = series.str.replace("%", "", regex=False) \
+                               .str.replace(",", ".", regex=False) \
+                               .replace("", np.nan)
+        return pd.to_numeric(cleaned_series, errors="coerce") / 100
+
+
+    def parse_many(
+        self,
+        pages: list[HTTPClientResponse],
+        as_frame: bool = False
+    ) -> list[FundamentusStockMetrics] | pd.DataFrame:
+        """
+        Parses stocks metrics data from many pages at once.
+
+        The raw cell strings of all pages are extracted first and the numeric and percentage
+        conversions are then applied only once per column over the whole batch.
+
+        Args:
+            pages (list[HTTPClientResponse]): The HTTP responses of the stock metrics pages.
+            as_frame (bool): Whether to return a columnar pandas DataFrame instead of entities.
+
+        Returns:
+            A list of FundamentusStockMetrics entities (in the same order of the pages) or a
+            pandas DataFrame with one row per page and one column per entity field.
+        """
+
+        self.logger.debug(f"Extracting raw stock metrics data from {len(pages)} pages")
+        raw_records = [
+            self.__extract_stock_metrics_data(
+                html_content=page.content,
+                encoding=page.encoding,
+                request_config=HTTPClientRequestConfig(url=page.url)
             )
-        
+            for page in pages
+        ]
+
+        self.logger.debug("Converting the stock metrics data columns of the whole batch")
+        try:
+            df_stock_metrics = pd.DataFrame({
+                field_name: pd.Series(
+                    [raw_record.get(heading) for raw_record in raw_records],
+                    dtype="object"
+                )
+                for heading, (field_name, _) in self.field_parsers.items()
+            })
+
+            for field_name in df_stock_metrics.columns:
+                if field_name.startswith(PERCENTAGE_FIELD_PREFIX):
+                    df_stock_metrics[field_name] = self.__parse_percentage_series(
+                        df_stock_metrics[field_name]
+                    )
+                elif field_name.startswith(FLOAT_FIELD_PREFIXES):
+                    df_stock_metrics[field_name] = self.__parse_float_series(
+                        df_stock_metrics[field_name]
+                    )
+
+            df_stock_metrics["execution_date"] = datetime.now().strftime(DateFormat.DATE.value)
+            df_stock_metrics["missing_fields"] = [
+                self.field_matcher.get_missing_fields(raw_record) for raw_record in raw_records
+            ]
+
         except Exception:
             self.logger.exception("Error parsing and converting the numeric data types of the "
-                                  "DataFrame columns")
+                                  "stock metrics columns")
             raise
 
-        self.logger.debug("Adapting the DataFrame to an instance of FundamentusStockMetrics entity")
+        if as_frame:
+            return df_stock_metrics
+
+        self.logger.debug("Adapting the stock metrics rows to instances of FundamentusStockMetrics")
         try:
-            stock_metrics = FundamentusStockMetrics(**df_stock_metrics_prep.to_dict(orient="records")[0])
+            return [
+                FundamentusStockMetrics(**record)
+                for record in df_stock_metrics.to_dict(orient="records")
+            ]
         except Exception:
-            self.logger.exception("Error adapting the DataFrame to FundamentusStockMetrics entity")
+            self.logger.exception("Error adapting the stock metrics rows to FundamentusStockMetrics "
+                                  "entities")
             raise
 
-        return stock_metrics
+
+    @timing_decorator
+    def parse_screener_html_stream(
+        self,
+        chunks: Iterable[bytes],
+        encoding: str
+    ) -> list[FundamentusStockMetrics]:
+        """
+        Parses partial stocks metrics data of every ticker listed on the screener page as the
+        page is streamed. The chunks are fed to an incremental parser and are no longer consumed
+        once the results table is closed.
+
+        Only the fields available as columns of the screener table are filled. The remaining
+        ones are left empty (None/NaN), listed on missing_fields, to be filled by the per ticker
+        detail pages.
+
+        Args:
+            chunks (Iterable[bytes]): The raw HTML content of the screener page split in chunks.
+            encoding (str): The encoding used to decode the HTML content.
+
+        Returns:
+            A list of partial FundamentusStockMetrics entities, one per ticker (sorted by ticker).
+        """
+
+        self.__refresh_metrics_mapping()
+
+        # The same conversion used on the detail pages is applied to each screener column
+        parsers_by_field = {field_name: parse for field_name, parse in self.field_parsers.values()}
+        empty_fields = {field_name: parse(None) for field_name, parse in parsers_by_field.items()}
+        empty_fields.update({field_name: "" for field_name in REQUIRED_TEXT_FIELDS})
+        execution_date = datetime.now().strftime(DateFormat.DATE.value)
+
+        self.logger.debug("Extracting partial stock metrics from the screener table")
+        stock_metrics_by_code: dict[str, FundamentusStockMetrics] = {}
+        try:
+            for row in FundamentusScreenerTableParser.iter_rows(chunks=chunks, encoding=encoding):
+                screener_fields = {
+                    field_name: parsers_by_field[field_name](row[heading])
+                    for heading, field_name in self.screener_metrics_mapping.items()
+                    if heading in row
+                }
+                stock_metrics_fields = {
+                    **empty_fields,
+                    **screener_fields,
+                    "execution_date": execution_date,
+                    "missing_fields": [
+                        field_name for field_name in parsers_by_field
+                        if field_name not in screener_fields
+                    ]
+                }
+
+                stock_metrics = FundamentusStockMetrics(**stock_metrics_fields)
+                stock_metrics_by_code[stock_metrics.nome_papel] = stock_metrics
+
+        except Exception:
+            self.logger.exception("Error extracting partial stock metrics from the screener table")
+            raise
+
+        return [stock_metrics_by_code[code] for code in sorted(stock_metrics_by_code)]
+
+
+    def parse_screener_html_content(
+        self,
+        html_content: bytes,
+        encoding: str
+    ) -> list[FundamentusStockMetrics]:
+        """
+        Parses partial stocks metrics data of every ticker listed on the screener page.
+
+        Args:
+            html_content (bytes): The raw HTML content of the screener page (resultado.php).
+            encoding (str): The encoding used to decode the HTML content.
+
+        Returns:
+            A list of partial FundamentusStockMetrics entities, one per ticker (sorted by ticker).
+        """
+        return self.parse_screener_html_stream(chunks=[html_content], encoding=encoding)
+
+
+@lru_cache(maxsize=None)
+def get_worker_html_parser_adapter(
+    parser_backend: HTMLParserBackend = HTMLParserBackend.LXML
+) -> FundamentusHTMLParserAdapter:
+    """
+    Gets the parser adapter of a parse worker process, built once per parser backend and cached
+    for the lifetime of the process.
+
+    Args:
+        parser_backend (HTMLParserBackend): The engine used to build the HTML tree.
+
+    Returns:
+        FundamentusHTMLParserAdapter: The parser adapter of the worker process.
+    """
+    return FundamentusHTMLParserAdapter(parser_backend=parser_backend)
+
+
+def init_parse_worker(parser_backend: HTMLParserBackend = HTMLParserBackend.LXML) -> None:
+    """
+    Process pool initializer building the parser adapter of a worker process once, so the pages
+    submitted to the pool don't carry (and pickle) the adapter.
+
+    Args:
+        parser_backend (HTMLParserBackend): The engine used to build the HTML tree.
+    """
+    get_worker_html_parser_adapter(parser_backend=parser_backend)
+
+
+def parse_stock_metrics_fields_on_worker(
+    html_content: bytes,
+    encoding: str,
+    request_config: HTTPClientRequestConfig,
+    parser_backend: HTMLParserBackend = HTMLParserBackend.LXML
+) -> dict[str, Any]:
+    """
+    Parses a stock metrics page on a parse worker process with the cached parser adapter of the
+    worker (built by init_parse_worker, or on first use when the pool has no initializer).
+
+    Args:
+        html_content (bytes): The raw HTML content of the HTTP response.
+        encoding (str): The encoding used to decode the HTML content.
+        request_config (HTTPClientRequestConfig): The object containing metadata of the request.
+        parser_backend (HTMLParserBackend): The engine used to build the HTML tree.
+
+    Returns:
+        A dictionary with the keyword arguments of a FundamentusStockMetrics entity.
+    """
+    return get_worker_html_parser_adapter(parser_backend=parser_backend).parse_stock_metrics_fields(
+        html_content=html_content,
+        encoding=encoding,
+        request_config=request_config
+    )
@@ -0,0 +1,127 @@
+from typing import Iterable, Mapping, Optional
+
+
+# Character shown on the label cells of the Fundamentus metrics tables (help tooltip)
+HEADING_MARKER = "?"
+
+
+class FundamentusFieldMatcher:
+    """
+    Matches the cells of the Fundamentus metrics tables to the stock metrics headings.
+
+    The lookup structures are built once from the stock metrics mapping and the variation
+    headings, so each cell is classified as a heading or a value with a constant time check and
+    each row is matched in a single pass over its cells.
+
+    Headings repeated on the same row (e.g. "Receita Líquida" for the last 12 and 3 months) are
+    resolved by their position: the last occurrence keeps the heading name and the previous ones
+    get a "_<n>" suffix counting down to it (for two occurrences, "Receita Líquida_1" and then
+    "Receita Líquida").
+
+    Args:
+        stock_metrics_mapping (Mapping[str, str]): The headings mapped to the entity field names.
+        variation_headings (Iterable[str]): The headings of the price variation table, which are
+            not marked as labels on the page.
+    """
+
+    def __init__(self, stock_metrics_mapping: Mapping[str, str], variation_headings: Iterable[str]):
+        self.stock_metrics_mapping = dict(stock_metrics_mapping)
+        self.variation_headings = frozenset(variation_headings)
+
+
+    def match_heading(self, cell: str) -> Optional[str]:
+        """
+        Classifies a cell text as a heading.
+
+        Args:
+            cell (str): The text of the cell.
+
+        Returns:
+            Optional[str]: The heading name, or None when the cell holds a value.
+        """
+        if HEADING_MARKER in cell:
+            return cell.replace(HEADING_MARKER, "").strip()
+
+        if cell in self.variation_headings:
+            return cell
+
+        return None
+
+
+    def match_row(self, cells: Iterable[str]) -> dict[str, str]:
+        """
+        Matches the headings of a table row to its values, in the order they appear.
+
+        Args:
+            cells (Iterable[str]): The texts of the cells of the row.
+
+        Returns:
+            dict[str, str]: The raw values keyed by the (deduplicated) headings.
+        """
+        headings: list[str] = []
+        values: list[str] = []
+        for cell in cells:
+            heading = self.match_heading(cell)
+            if heading is None:
+                values.append(cell.strip())
+            else:
+                headings.append(heading)
+
+        remaining_occurrences: dict[str, int] = {}
+        for heading in headings:
+            remaining_occurrences[heading] = remaining_occurrences.get(heading, 0) + 1
+
+        row_data = {}
+        for heading, value in zip(headings, values):
+            remaining_occurrences[heading] -= 1
+            occurrence = remaining_occurrences[heading]
+            row_data[f"{heading}_{occurrence}" if occurrence else heading] = value
+
+        return row_data
+
+
+    def match_rows(self, rows: Iterable[Iterable[str]]) -> dict[str, str]:
+        """
+        Matches all rows of the metrics tables into a single dictionary.
+
+        Args:
+            rows (Iterable[Iterable[str]]): The texts of the cells of each row.
+
+        Returns:
+            dict[str, str]: The raw values of the whole page keyed by heading. When the same
+                heading appears on different rows, the last one wins.
+        """
+        stock_metrics_data: dict[str, str] = {}
+        for cells in rows:
+            stock_metrics_data.update(self.match_row(cells))
+
+        return stock_metrics_data
+
+
+    def get_missing_headings(self, stock_metrics_data: Mapping[str, str]) -> list[str]:
+        """
+        Lists the expected headings that were not found on a page.
+
+        Args:
+            stock_metrics_data (Mapping[str, str]): The raw values keyed by heading.
+
+        Returns:
+            list[str]: The missing headings, in the order of the stock metrics mapping.
+        """
+        return [heading for heading in self.stock_metrics_mapping if heading not in stock_metrics_data]
+
+
+    def get_missing_fields(self, stock_metrics_data: Mapping[str, str]) -> list[str]:
+        """
+        Lists the entity fields whose headings were not found on a page.
+
+        Args:
+            stock_metrics_data (Mapping[str, str]): The raw values keyed by heading.
+
+        Returns:
+            list[str]: The missing field names, in the order of the stock metrics mapping.
+        """
+        return [
+            self.stock_metrics_mapping[heading]
+            for heading in self.get_missing_headings(stock_metrics_data)
+        ]
@@ -0,0 +1,169 @@
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional
+
+from app.src.features.cross.utils.date_and_time import DateAndTimeUtils
+from app.src.features.cross.value_objects import Timezone
+
+
+# Headings of the price variation table that don't depend on the current year
+FIXED_VARIATION_HEADINGS = ("Dia", "Mês", "30 dias", "12 meses")
+
+# Fields of the yearly price variations, from the current year (a0) to five years ago (a5)
+YEAR_VARIATION_FIELDS = (
+    "pct_var_ano_a0",
+    "pct_var_ano_a1",
+    "pct_var_ano_a2",
+    "pct_var_ano_a3",
+    "pct_var_ano_a4",
+    "pct_var_ano_a5"
+)
+
+# Headings placed before the yearly price variations on the stock metrics mapping
+LEADING_STOCK_METRICS_MAPPING = {
+    "Papel": "nome_papel",
+    "Tipo": "tipo_papel",
+    "Empresa": "nome_empresa",
+    "Setor": "nome_setor",
+    "Subsetor": "nome_subsetor",
+    "Cotação": "vlr_cot",
+    "Data últ cot": "dt_ult_cot",
+    "Min 52 sem": "vlr_cot_min_52_sem",
+    "Max 52 sem": "vlr_cot_max_52_sem",
+    "Vol $ méd (2m)": "vol_med_neg_2m",
+    "Valor de mercado": "vlr_mercado",
+    "Valor da firma": "vlr_firma",
+    "Últ balanço processado": "dt_ult_balanco_proc",
+    "Nro. Ações": "num_acoes",
+    "Dia": "pct_var_dia",
+    "Mês": "pct_var_mes",
+    "30 dias": "pct_var_30d",
+    "12 meses": "pct_var_12m"
+}
+
+# Headings placed after the yearly price variations on the stock metrics mapping
+TRAILING_STOCK_METRICS_MAPPING = {
+    "P/L": "vlr_p_sobre_l",
+    "P/VP": "vlr_p_sobre_vp",
+    "P/EBIT": "vlr_p_sobre_ebit",
+    "PSR": "vlr_psr",
+    "P/Ativos": "vlr_p_sobre_ativ",
+    "P/Cap. Giro": "vlr_p_sobre_cap_giro",
+    "P/Ativ Circ Liq": "vlr_p_sobre_ativ_circ_liq",
+    "Div. Yield": "vlr_div_yield",
+    "EV / EBITDA": "vlr_ev_sobre_ebitda",
+    "EV / EBIT": "vlr_ev_sobre_ebit",
+    "Cres. Rec (5a)": "pct_cresc_rec_liq_ult_5a",
+    "LPA": "vlr_lpa",
+    "VPA": "vlr_vpa",
+    "Marg. Bruta": "vlr_margem_bruta",
+    "Marg. EBIT": "vlr_margem_ebit",
+    "Marg. Líquida": "vlr_margem_liq",
+    "EBIT / Ativo": "vlr_ebit_sobre_ativo",
+    "ROIC": "vlr_roic",
+    "ROE": "vlr_roe",
+    "Liquidez Corr": "vlr_liquidez_corr",
+    "Div Br/ Patrim": "vlr_divida_bruta_sobre_patrim",
+    "Giro Ativos": "vlr_giro_ativos",
+    "Ativo": "vlr_ativo",
+    "Disponibilidades": "vlr_disponibilidades",
+    "Ativo Circulante": "vlr_ativ_circulante",
+    "Dív. Bruta": "vlr_divida_bruta",
+    "Dív. Líquida": "vlr_divida_liq",
+    "Patrim. Líq": "vlr_patrim_liq",
+    "Receita Líquida_1": "vlr_receita_liq_ult_12m",
+    "EBIT_1": "vlr_ebit_ult_12m",
+    "Lucro Líquido_1": "vlr_lucro_liq_ult_12m",
+    "Receita Líquida": "vlr_receita_liq_ult_3m",
+    "EBIT": "vlr_ebit_ult_3m",
+    "Lucro Líquido": "vlr_lucro_liq_ult_3m"
+}
+
+# Mappings are kept at module level so they are shared by every parser in the (warm) container
+_STOCK_METRICS_MAPPINGS: dict[int, "StockMetricsMapping"] = {}
+_STOCK_METRICS_MAPPINGS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class StockMetricsMapping:
+    """
+    Represents the headings of the Fundamentus metrics tables of a calendar year.
+
+    Attributes:
+        year (int): The calendar year the yearly price variation headings refer to.
+        stock_metrics_mapping (MappingProxyType[str, str]): Read-only mapping of the headings to
+            the entity field names.
+        variation_headings (frozenset[str]): The headings of the price variation table.
+    """
+
+    year: int
+    stock_metrics_mapping: MappingProxyType
+    variation_headings: frozenset[str]
+
+    def __reduce__(self):
+        # Read-only mappings can't be pickled, so the mapping is rebuilt from the year (e.g. when
+        # it is sent to a worker process along with the parser)
+        return StockMetricsMappingProvider.get_mapping, (self.year,)
+
+
+class StockMetricsMappingProvider:
+    """
+    Provides the stock metrics mapping of the current calendar year in the São Paulo timezone.
+
+    The yearly price variation headings (e.g. "2025") shift every New Year, so the mapping is
+    built once per year, memoized and replaced as soon as the year changes, which keeps warm
+    containers that live across the year boundary mapping the pct_var_ano_* fields correctly.
+    """
+
+    @staticmethod
+    def build_mapping(year: int) -> StockMetricsMapping:
+        """
+        Builds the stock metrics mapping of a calendar year.
+
+        Args:
+            year (int): The calendar year of the yearly price variation headings.
+
+        Returns:
+            StockMetricsMapping: The mapping of the headings of the given year.
+        """
+        year_headings = [str(year - offset) for offset in range(len(YEAR_VARIATION_FIELDS))]
+
+        stock_metrics_mapping = {
+            **LEADING_STOCK_METRICS_MAPPING,
+            **dict(zip(year_headings, YEAR_VARIATION_FIELDS)),
+            **TRAILING_STOCK_METRICS_MAPPING
+        }
+
+        return StockMetricsMapping(
+            year=year,
+            stock_metrics_mapping=MappingProxyType(stock_metrics_mapping),
+            variation_headings=frozenset(FIXED_VARIATION_HEADINGS + tuple(year_headings))
+        )
+
+
+    @staticmethod
+    def get_mapping(year: Optional[int] = None) -> StockMetricsMapping:
+        """
+        Returns the memoized stock metrics mapping of a calendar year, building it on first use.
+
+        Args:
+            year (Optional[int]): The calendar year. Defaults to the current year in the São Paulo
+                timezone.
+
+        Returns:
+            StockMetricsMapping: The mapping of the headings of the year.
+        """
+        year = year or DateAndTimeUtils.datetime_now(timezone=Timezone.SAO_PAULO).year
+
+        stock_metrics_mapping = _STOCK_METRICS_MAPPINGS.get(year)
+        if stock_metrics_mapping is not None:
+            return stock_metrics_mapping
+
+        with _STOCK_METRICS_MAPPINGS_LOCK:
+            if year not in _STOCK_METRICS_MAPPINGS:
+                # Dropping the mappings of the previous years
+                _STOCK_METRICS_MAPPINGS.clear()
+                _STOCK_METRICS_MAPPINGS[year] = StockMetricsMappingProvider.build_mapping(year)
+
+            return _STOCK_METRICS_MAPPINGS[year]
@@ -1,9 +1,11 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
+from typing import Optional
 
 import boto3
 from pynamodb.models import Model
-from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute, ListAttribute
 
 from app.src.features.get_fundamentus_eod_stock_metrics.domain.interfaces.database_repository_interface import (
     IDatabaseRepository
@@ -12,8 +14,10 @@ from app.src.features.get_fundamentus_eod_stock_metrics.domain.entities.fundamen
     FundamentusStockMetrics
 )
 
+from app.src.features.cross.domain.entities.dynamodb_bulk_write_config import DynamoDBBulkWriteConfig
+from app.src.features.cross.infra.repositories.dynamodb_bulk_writer import DynamoDBBulkWriter
+from app.src.features.cross.infra.repositories.dynamodb_item_marshaller import DynamoDBItemMarshaller
 from app.src.features.cross.utils.log import LogUtils
-from app.src.features.cross.utils.serialization import SerializationUtils
 from app.src.features.cross.utils.decorators import timing_decorator
 
 
@@ -113,6 +117,12 @@ class FundamentusStockMetricsModel(Model):
     vlr_ebit_ult_3m = NumberAttribute(null=True)
     vlr_lucro_liq_ult_3m = NumberAttribute(null=True)
 
+    # Hash of the raw page content used to detect unchanged pages (nullable)
+    content_hash = UnicodeAttribute(null=True)
+
+    # Fields whose headings were not found on the page (nullable)
+    missing_fields = ListAttribute(of=UnicodeAttribute, null=True)
+
     def __init__(self, *args, **kwargs):
         self.Meta.table_name = os.getenv("DYNAMODB_FUNDAMENTUS_EOD_STOCK_METRICS_TABLE_NAME")
         super().__init__(*args, **kwargs)
@@ -124,6 +134,16 @@ class DynamoDBDatabaseRepository(IDatabaseRepository):
     """
     def __init__(self):
         self.logger = LogUtils.setup_logger(name=__name__)
+        self.bulk_writer = DynamoDBBulkWriter(
+            table_name=os.getenv("DYNAMODB_FUNDAMENTUS_EOD_STOCK_METRICS_TABLE_NAME"),
+            config=DynamoDBBulkWriteConfig(
+                max_workers=int(os.getenv("DYNAMODB_BULK_WRITE_MAX_WORKERS", "4"))
+            )
+        )
+        self.item_marshaller = DynamoDBItemMarshaller(
+            model_class=FundamentusStockMetricsModel,
+            entity_class=FundamentusStockMetrics
+        )
 
 
     @timing_decorator
@@ -135,11 +155,10 @@ class DynamoDBDatabaseRepository(IDatabaseRepository):
             items (list[FundamentusStockMetrics]): List of stock metrics to save.
         """
         try:
-            with FundamentusStockMetricsModel.batch_write() as batch:
-                for _, item in enumerate(items):
-                    model = FundamentusStockMetricsModel(**SerializationUtils.json_serialize(item))
-                    batch.save(model)
-                    
+            # Marshalling the entities straight into DynamoDB items (no model instances on the hot
+            # path) and writing them in parallel chunks of 25 items
+            self.bulk_writer.put_items([self.item_marshaller.marshal(item) for item in items])
+
             self.logger.info(f"Successfully batch saved {len(items)} stock metrics "
                              f"to table {FundamentusStockMetricsModel.Meta.table_name}")
 
@@ -147,3 +166,59 @@ class DynamoDBDatabaseRepository(IDatabaseRepository):
             self.logger.exception(f"Error batch saving stock metrics to table "
                                  f"{FundamentusStockMetricsModel.Meta.table_name}")
             raise
+
+
+    def __get_latest_content_hash(self, stock_code: str) -> Optional[str]:
+        """
+        Gets the content hash of the latest stored stock metrics of a stock code.
+
+        Args:
+            stock_code (str): The stock code to look up.
+
+        Returns:
+            The content hash of its latest stored record, or None when there is no record (or no
+            stored hash).
+        """
+        latest_items = FundamentusStockMetricsModel.query(
+            stock_code,
+            scan_index_forward=False,
+            limit=1,
+            attributes_to_get=["nome_papel", "content_hash"]
+        )
+        for item in latest_items:
+            return item.content_hash
+
+        return None
+
+
+    def get_latest_content_hashes(self, stock_codes: list[str]) -> dict[str, str]:
+        """
+        Gets the content hash of the latest stored stock metrics of each stock code.
+
+        The lookups (one Query per stock code) are sent in parallel on a thread pool.
+
+        Args:
+            stock_codes (list[str]): The stock codes to look up.
+
+        Returns:
+            A dictionary mapping each stock code to the content hash of its latest stored record.
+            Stock codes without records (or without a stored hash) are not included.
+        """
+        if not stock_codes:
+            return {}
+
+        try:
+            max_workers = max(1, min(self.bulk_writer.config.max_workers, len(stock_codes)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                latest_content_hashes = list(executor.map(self.__get_latest_content_hash, stock_codes))
+
+        except Exception:
+            self.logger.exception(f"Error getting the latest content hashes from table "
+                                  f"{FundamentusStockMetricsModel.Meta.table_name}")
+            raise
+
+        return {
+            stock_code: content_hash
+            for stock_code, content_hash in zip(stock_codes, latest_content_hashes)
+            if content_hash
+        }
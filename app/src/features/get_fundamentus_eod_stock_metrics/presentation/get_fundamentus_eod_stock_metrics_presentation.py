@@ -1,10 +1,14 @@
+import os
+from functools import partial
 from typing import Any
 
 from app.src.features.get_fundamentus_eod_stock_metrics.infra.mappers.sqs_messages_lambda_event_mapper import (
     SQSMessagesLambdaEventMapper
 )
 from app.src.features.get_fundamentus_eod_stock_metrics.infra.adapters.fundamentus_html_parser_adapter import (
-    FundamentusHTMLParserAdapter
+    FundamentusHTMLParserAdapter,
+    init_parse_worker,
+    parse_stock_metrics_fields_on_worker
 )
 from app.src.features.get_fundamentus_eod_stock_metrics.infra.repositories.dynamodb_database_repository import (
     DynamoDBDatabaseRepository
@@ -14,7 +18,17 @@ from app.src.features.get_fundamentus_eod_stock_metrics.use_case.get_fundamentus
 )
 
 from app.src.features.cross.infra.adapters.requests_http_client_adapter import RequestsHTTPClientAdapter
+from app.src.features.cross.infra.adapters.aiohttp_http_client_adapter import AIOHTTPClientAdapter
+from app.src.features.cross.infra.adapters.cached_http_client_adapter import CachedHTTPClientAdapter
+from app.src.features.cross.infra.adapters.conditional_http_client_adapter import (
+    ConditionalHTTPClientAdapter
+)
+from app.src.features.cross.infra.adapters.local_disk_http_response_cache import (
+    LocalDiskHTTPResponseCache
+)
+from app.src.features.cross.infra.adapters.s3_http_response_cache import S3HTTPResponseCache
 from app.src.features.cross.infra.mappers.http_response_mapper import HTTPResponseMapper
+from app.src.features.cross.utils.concurrency import ConcurrencyUtils
 from app.src.features.cross.infra.repositories.dynamodb_batch_control_database_repository import (
     DynamoDBBatchControlDatabaseRepository
 )
@@ -22,17 +36,51 @@ from app.src.features.cross.infra.repositories.dynamodb_batch_control_database_r
 
 # Initializing mappers, adapters and repositories
 event_mapper = SQSMessagesLambdaEventMapper()
-http_client_adapter = RequestsHTTPClientAdapter()
+http_client_adapter = (
+    AIOHTTPClientAdapter() if os.getenv("HTTP_CLIENT_BACKEND") == "aiohttp"
+    else RequestsHTTPClientAdapter()
+)
+
+# Sending conditional requests for the pages already fetched by this (warm) container
+http_client_adapter = ConditionalHTTPClientAdapter(http_client_adapter=http_client_adapter)
+
+# Optionally caching the raw responses so reruns of the same day skip the network
+if os.getenv("HTTP_RESPONSE_CACHE_BACKEND") == "local":
+    http_client_adapter = CachedHTTPClientAdapter(
+        http_client_adapter=http_client_adapter,
+        response_cache=LocalDiskHTTPResponseCache()
+    )
+elif os.getenv("HTTP_RESPONSE_CACHE_BACKEND") == "s3":
+    http_client_adapter = CachedHTTPClientAdapter(
+        http_client_adapter=http_client_adapter,
+        response_cache=S3HTTPResponseCache()
+    )
+
 html_parser_adapter = FundamentusHTMLParserAdapter()
 database_repository = DynamoDBDatabaseRepository()
 batch_control_database_repository = DynamoDBBatchControlDatabaseRepository()
 
+# The parse process pool (if enabled and available) lives as long as the warm container, and
+# each of its workers builds its own parser adapter once
+parse_executor = ConcurrencyUtils.get_process_pool(
+    max_workers=int(os.getenv("FUNDAMENTUS_PARSER_PROCESSES", "0")),
+    initializer=init_parse_worker,
+    initargs=(html_parser_adapter.parser_backend,)
+)
+
 # Initializing use case
 use_case = GetFundamentusEodStockMetricsUseCase(
     http_client_adapter=http_client_adapter,
     html_parser_adapter=html_parser_adapter,
     database_repository=database_repository,
-    batch_control_database_repository=batch_control_database_repository
+    batch_control_database_repository=batch_control_database_repository,
+    max_in_flight_requests=int(os.getenv("FUNDAMENTUS_MAX_IN_FLIGHT_REQUESTS", "8")),
+    max_requests_per_second_per_host=float(os.getenv("FUNDAMENTUS_MAX_REQUESTS_PER_SECOND", "10")),
+    parse_executor=parse_executor,
+    parse_worker=partial(
+        parse_stock_metrics_fields_on_worker,
+        parser_backend=html_parser_adapter.parser_backend
+    )
 )
 
 
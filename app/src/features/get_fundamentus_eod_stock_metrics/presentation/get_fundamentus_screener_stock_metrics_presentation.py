@@ -0,0 +1,59 @@
+import os
+from typing import Any
+
+from app.src.features.get_fundamentus_eod_stock_metrics.infra.adapters.fundamentus_html_parser_adapter import (
+    FundamentusHTMLParserAdapter
+)
+from app.src.features.get_fundamentus_eod_stock_metrics.infra.repositories.dynamodb_database_repository import (
+    DynamoDBDatabaseRepository
+)
+from app.src.features.get_fundamentus_eod_stock_metrics.use_case.get_fundamentus_screener_stock_metrics_use_case import (
+    GetFundamentusScreenerStockMetricsUseCase
+)
+
+from app.src.features.cross.infra.adapters.requests_http_client_adapter import RequestsHTTPClientAdapter
+from app.src.features.cross.infra.adapters.aiohttp_http_client_adapter import AIOHTTPClientAdapter
+from app.src.features.cross.infra.mappers.http_response_mapper import HTTPResponseMapper
+from app.src.features.cross.infra.repositories.dynamodb_batch_control_database_repository import (
+    DynamoDBBatchControlDatabaseRepository
+)
+
+
+# Initializing adapters and repositories
+http_client_adapter = (
+    AIOHTTPClientAdapter() if os.getenv("HTTP_CLIENT_BACKEND") == "aiohttp"
+    else RequestsHTTPClientAdapter()
+)
+html_parser_adapter = FundamentusHTMLParserAdapter()
+database_repository = DynamoDBDatabaseRepository()
+batch_control_database_repository = DynamoDBBatchControlDatabaseRepository()
+
+# Initializing use case
+use_case = GetFundamentusScreenerStockMetricsUseCase(
+    http_client_adapter=http_client_adapter,
+    html_parser_adapter=html_parser_adapter,
+    database_repository=database_repository,
+    batch_control_database_repository=batch_control_database_repository
+)
+
+
+# Defining a handler function for executing the use case in AWS Lambda
+def handler(event: dict[str, Any], context: Any = None) -> dict:
+    """
+    AWS Lambda handler function to execute the use case.
+
+    Args:
+        event (dict[str, Any]): The event data passed to the Lambda function.
+        context (Any): The context object provided by AWS Lambda.
+
+    Returns:
+        dict: The result of the use case execution.
+    """
+
+    output_dto = use_case.execute()
+
+    # Pool stats are only logged by batch_get, which the use case doesn't use
+    if isinstance(http_client_adapter, RequestsHTTPClientAdapter):
+        http_client_adapter.log_pool_stats()
+
+    return HTTPResponseMapper.map(output_dto)
@@ -1,5 +1,7 @@
 import os
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
 from app.src.features.get_fundamentus_eod_stock_metrics.domain.dtos.stock_messages_input_dto import (
     StockMessagesInputDTO
@@ -34,12 +36,92 @@ logger = LogUtils.setup_logger(name=__name__)
 class GetFundamentusEodStockMetricsUseCase:
     """
     Use case for retrieving end-of-day stock metrics from Fundamentus web site.
+
+    Args:
+        http_client_adapter (IHTTPClientAdapter): Adapter for making HTTP requests.
+        html_parser_adapter (IHTMLParserAdapter): Adapter for parsing stock metrics pages.
+        database_repository (IDatabaseRepository): Repository for saving stock metrics.
+        batch_control_database_repository (IBatchControlDatabaseRepository): Repository for
+            updating the batch process control data.
+        max_in_flight_requests (int): The maximum number of concurrent HTTP requests.
+        max_requests_per_second_per_host (Optional[float]): Optional rate cap for the requests
+            sent to the Fundamentus website.
+        parse_executor (Optional[Executor]): Optional (process pool) executor used to parse the
+            HTML pages out of the current process. When None, pages are parsed sequentially.
+        parse_worker (Optional[Callable[[bytes, str, HTTPClientRequestConfig], dict[str, Any]]]):
+            Optional module-level function (or a partial of one) submitted to the parse executor,
+            parsing a page with a parser adapter built once per worker process (e.g. by the pool
+            initializer). When
+            None, the parser adapter method is submitted (and the adapter pickled with each page).
+        skip_unchanged_pages (bool): Whether to skip parsing and saving the pages whose content hash
+            is the same of the latest stored stock metrics.
     """
 
     http_client_adapter: IHTTPClientAdapter
     html_parser_adapter: IHTMLParserAdapter
     database_repository: IDatabaseRepository
     batch_control_database_repository: IBatchControlDatabaseRepository
+    max_in_flight_requests: int = 1
+    max_requests_per_second_per_host: Optional[float] = None
+    parse_executor: Optional[Executor] = None
+    parse_worker: Optional[Callable[[bytes, str, HTTPClientRequestConfig], dict[str, Any]]] = None
+    skip_unchanged_pages: bool = True
+
+
+    def __build_request_config(self, stock_code: str) -> HTTPClientRequestConfig:
+        """
+        Builds the request configuration used to get the metrics page of a stock.
+
+        Args:
+            stock_code (str): The stock ticker code.
+
+        Returns:
+            HTTPClientRequestConfig: The request configuration for the stock metrics page.
+        """
+        return HTTPClientRequestConfig(
+            url=f"https://www.fundamentus.com.br/detalhes.php?papel={stock_code}",
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            },
+            timeout=10,
+            retry_config=HTTPClientRetryConfig(
+                num_retries=3,
+                backoff_factor=0.1,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        )
+
+
+    def __parse_http_response(
+        self,
+        http_response: HTTPClientResponse,
+        request_config: HTTPClientRequestConfig
+    ) -> dict[str, Any] | Future:
+        """
+        Parses a stock metrics page, submitting it to the parse executor when there is one.
+
+        Args:
+            http_response (HTTPClientResponse): The HTTP response of the stock metrics page.
+            request_config (HTTPClientRequestConfig): The request configuration of the page.
+
+        Returns:
+            The parsed stock metrics fields or a Future that will hold them.
+        """
+        if self.parse_executor is None:
+            return self.html_parser_adapter.parse_stock_metrics_fields(
+                html_content=http_response.content,
+                encoding=http_response.encoding,
+                request_config=request_config
+            )
+
+        # Only the raw bytes are sent to the worker and only the compact fields come back
+        return self.parse_executor.submit(
+            self.parse_worker or self.html_parser_adapter.parse_stock_metrics_fields,
+            html_content=http_response.content,
+            encoding=http_response.encoding,
+            request_config=request_config
+        )
 
 
     def execute(self, input_dto: StockMessagesInputDTO) -> OutputDTO:
@@ -54,48 +136,95 @@ class GetFundamentusEodStockMetricsUseCase:
         """
         
         stock_metrics_list: list[FundamentusStockMetrics] = []
-        
+        unchanged_stock_codes: list[str] = []
+
         try:
             stock_codes = [message.code for message in input_dto.messages]
             logger.info(f"Getting and parsing metrics for the following {len(stock_codes)} "
                         f"stock codes: {', '.join(stock_codes)}")
 
-            for stock_code in stock_codes:
-                # Building a request config object to handle HTTP requests
-                request_config = HTTPClientRequestConfig(
-                    url=f"https://www.fundamentus.com.br/detalhes.php?papel={stock_code}",
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                                    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                    },
-                    timeout=10,
-                    retry_config=HTTPClientRetryConfig(
-                        num_retries=3,
-                        backoff_factor=0.1,
-                        status_forcelist=[500, 502, 503, 504]
-                    )
-                )
+            # Getting the raw HTML content from Fundamentus overlapping the requests
+            request_configs = [self.__build_request_config(stock_code) for stock_code in stock_codes]
+            http_responses: list[HTTPClientResponse | Exception] = self.http_client_adapter.batch_get(
+                request_configs=request_configs,
+                max_in_flight=self.max_in_flight_requests,
+                max_requests_per_second_per_host=self.max_requests_per_second_per_host
+            )
 
-                # Getting the raw HTML content from Fundamentus
-                http_response: HTTPClientResponse = self.http_client_adapter.get(
-                    request_config=request_config
+            # Getting the hashes of the latest stored pages to skip the ones that didn't change
+            latest_content_hashes: dict[str, str] = {}
+            if self.skip_unchanged_pages:
+                latest_content_hashes = self.database_repository.get_latest_content_hashes(
+                    stock_codes=stock_codes
                 )
 
+            failed_stock_codes: list[str] = []
+            parsed_pages: list[tuple[str, str, dict[str, Any] | Future]] = []
+            for stock_code, request_config, http_response in zip(
+                stock_codes, request_configs, http_responses
+            ):
+                if isinstance(http_response, Exception):
+                    logger.error(f"Error getting metrics page for stock code {stock_code}: "
+                                 f"{http_response}")
+                    failed_stock_codes.append(stock_code)
+                    continue
+
+                content_hash = http_response.content_hash
+                if latest_content_hashes.get(stock_code) == content_hash:
+                    unchanged_stock_codes.append(stock_code)
+                    continue
+
                 # Parsing the HTML content to extract stock metrics
-                stock_metrics: FundamentusStockMetrics = self.html_parser_adapter.parse_html_content(
-                    html_content=http_response.content,
-                    encoding=http_response.encoding,
-                    request_config=request_config
-                )
+                try:
+                    parsed_pages.append((
+                        stock_code,
+                        content_hash,
+                        self.__parse_http_response(
+                            http_response=http_response,
+                            request_config=request_config
+                        )
+                    ))
+                except Exception:
+                    logger.exception(f"Error parsing metrics page for stock code {stock_code}")
+                    failed_stock_codes.append(stock_code)
+
+            for stock_code, content_hash, parsed_page in parsed_pages:
+                try:
+                    stock_metrics_fields = (
+                        parsed_page.result() if isinstance(parsed_page, Future) else parsed_page
+                    )
+                    stock_metrics_fields["content_hash"] = content_hash
+                    stock_metrics_list.append(FundamentusStockMetrics(**stock_metrics_fields))
+                except Exception:
+                    logger.exception(f"Error parsing metrics page for stock code {stock_code}")
+                    failed_stock_codes.append(stock_code)
 
-                stock_metrics_list.append(stock_metrics)
+            if failed_stock_codes:
+                raise RuntimeError(f"Failed to collect metrics for {len(failed_stock_codes)} stock "
+                                   f"codes: {', '.join(failed_stock_codes)}")
+
+            if unchanged_stock_codes:
+                logger.info(f"Skipping {len(unchanged_stock_codes)} stock codes whose pages didn't "
+                            "change since the latest stored metrics: "
+                            f"{', '.join(unchanged_stock_codes)}")
+
+            # Counting how many pages missed each field, which flags changes on the page layout
+            missing_fields_counts: dict[str, int] = {}
+            for stock_metrics in stock_metrics_list:
+                for field_name in stock_metrics.missing_fields:
+                    missing_fields_counts[field_name] = missing_fields_counts.get(field_name, 0) + 1
+
+            if missing_fields_counts:
+                logger.warning("Some fields were not found on the metrics pages: "
+                               f"{missing_fields_counts}")
         except Exception:
             logger.exception(f"Error collecting and parsing stock metrics")
             raise
 
         try:
             logger.info(f"Saving {len(stock_metrics_list)} stock metrics to the database table")
-            self.database_repository.batch_save_stock_metrics(stock_metrics_list)
+            if stock_metrics_list:
+                self.database_repository.batch_save_stock_metrics(stock_metrics_list)
         except Exception:
             logger.exception(f"Error saving stock metrics to the database repository")
             raise
@@ -105,10 +234,12 @@ class GetFundamentusEodStockMetricsUseCase:
             batch_process = BatchProcess(
                 process_name=BatchProcessName.PROCESS_FUNDAMENTUS_EOD_STOCK_METRICS,
                 total_items=int(input_dto.messages[0].total_expected_messages),
-                processed_items=len(stock_metrics_list),
+                # Unchanged pages were already stored before, so they also count as processed
+                processed_items=len(stock_metrics_list) + len(unchanged_stock_codes),
+            )
+            batch_process = self.batch_control_database_repository.update_batch_process_control(
+                batch_process
             )
-            self.batch_control_database_repository.update_batch_process_control(batch_process)
-            self.batch_control_database_repository.check_batch_process_completion(batch_process)
         except Exception:
             logger.exception("Error updating the batch process control record")
             raise        
@@ -117,6 +248,9 @@ class GetFundamentusEodStockMetricsUseCase:
             data={
                 "processed_stock_metrics": len(stock_metrics_list),
                 "stock_codes": [stock_metrics.nome_papel for stock_metrics in stock_metrics_list],
+                "unchanged_stock_codes": unchanged_stock_codes,
+                "missing_fields_counts": missing_fields_counts,
+                "batch_process_status": batch_process.process_status.value,
                 "dynamodb_table_name": os.getenv("DYNAMODB_FUNDAMENTUS_EOD_STOCK_METRICS_TABLE_NAME")
             }
         )
@@ -0,0 +1,126 @@
+import os
+from dataclasses import dataclass
+
+from app.src.features.get_fundamentus_eod_stock_metrics.domain.interfaces.html_parser_adapter_interface import (
+    IHTMLParserAdapter
+)
+from app.src.features.get_fundamentus_eod_stock_metrics.domain.interfaces.database_repository_interface import (
+    IDatabaseRepository
+)
+from app.src.features.get_fundamentus_eod_stock_metrics.domain.entities.fundamentus_stock_metrics import (
+    FundamentusStockMetrics
+)
+
+from app.src.features.cross.domain.interfaces.batch_control_database_repository_interface import (
+    IBatchControlDatabaseRepository
+)
+from app.src.features.cross.domain.interfaces.http_client_adapter import IHTTPClientAdapter
+from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
+from app.src.features.cross.domain.entities.http_client_retry_config import HTTPClientRetryConfig
+from app.src.features.cross.domain.entities.http_client_stream_response import HTTPClientStreamResponse
+from app.src.features.cross.domain.entities.batch_process import BatchProcess
+from app.src.features.cross.domain.dtos.output_dto import OutputDTO
+from app.src.features.cross.utils.log import LogUtils
+from app.src.features.cross.value_objects import BatchProcessName
+
+
+logger = LogUtils.setup_logger(name=__name__)
+
+
+@dataclass(frozen=True)
+class GetFundamentusScreenerStockMetricsUseCase:
+    """
+    Use case for retrieving the stock metrics of every active ticker from the Fundamentus screener
+    page with a single request.
+
+    The screener doesn't have all the fields of the detail pages, so the saved records are partial.
+    It is scheduled before the detail pages pipeline, which overwrites the records of the days it
+    runs with the complete data.
+
+    The records are saved without a content hash, so the detail pages pipeline never skips the
+    pages of the days the screener ran (its records would stay partial otherwise).
+
+    Args:
+        http_client_adapter (IHTTPClientAdapter): Adapter for making HTTP requests.
+        html_parser_adapter (IHTMLParserAdapter): Adapter for parsing the screener page.
+        database_repository (IDatabaseRepository): Repository for saving stock metrics.
+        batch_control_database_repository (IBatchControlDatabaseRepository): Repository for
+            updating the batch process control data.
+    """
+
+    http_client_adapter: IHTTPClientAdapter
+    html_parser_adapter: IHTMLParserAdapter
+    database_repository: IDatabaseRepository
+    batch_control_database_repository: IBatchControlDatabaseRepository
+
+
+    def execute(self) -> OutputDTO:
+        """
+        Implements the logic to execute the use case.
+
+        Returns:
+            OutputDTO: An instance of OutputDTO containing the result of the operation.
+        """
+
+        try:
+            request_config = HTTPClientRequestConfig(
+                url="https://www.fundamentus.com.br/resultado.php",
+                headers={
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+                },
+                timeout=10,
+                retry_config=HTTPClientRetryConfig(
+                    num_retries=3,
+                    backoff_factor=0.1,
+                    status_forcelist=[500, 502, 503, 504]
+                )
+            )
+
+            logger.info(f"Streaming the screener page from URL {request_config.url}")
+            http_response: HTTPClientStreamResponse = self.http_client_adapter.stream(
+                request_config=request_config
+            )
+
+            logger.info("Parsing the screener table into partial stock metrics as it is streamed")
+            try:
+                stock_metrics_list: list[FundamentusStockMetrics] = (
+                    self.html_parser_adapter.parse_screener_html_stream(
+                        chunks=http_response.chunks,
+                        encoding=http_response.encoding
+                    )
+                )
+            finally:
+                http_response.close()
+        except Exception:
+            logger.exception("Error collecting and parsing the screener stock metrics")
+            raise
+
+        try:
+            logger.info(f"Saving {len(stock_metrics_list)} stock metrics to the database table")
+            self.database_repository.batch_save_stock_metrics(stock_metrics_list)
+        except Exception:
+            logger.exception("Error saving stock metrics to the database repository")
+            raise
+
+        try:
+            logger.info("Updating the batch process control table with the processed items count")
+            batch_process = BatchProcess(
+                process_name=BatchProcessName.PROCESS_FUNDAMENTUS_SCREENER_STOCK_METRICS,
+                total_items=len(stock_metrics_list),
+                processed_items=len(stock_metrics_list),
+            )
+            batch_process = self.batch_control_database_repository.update_batch_process_control(
+                batch_process
+            )
+        except Exception:
+            logger.exception("Error updating the batch process control record")
+            raise
+
+        return OutputDTO.ok(
+            data={
+                "processed_stock_metrics": len(stock_metrics_list),
+                "batch_process_status": batch_process.process_status.value,
+                "dynamodb_table_name": os.getenv("DYNAMODB_FUNDAMENTUS_EOD_STOCK_METRICS_TABLE_NAME")
+            }
+        )
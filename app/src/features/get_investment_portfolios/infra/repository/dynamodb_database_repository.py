@@ -1,5 +1,5 @@
 import os
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from pynamodb.models import Model
@@ -7,7 +7,6 @@ from pynamodb.attributes import (
     UnicodeAttribute,
     JSONAttribute
 )
-from pynamodb.exceptions import DoesNotExist
 
 from app.src.features.get_investment_portfolios.domain.interfaces.database_repository_interface import (
     IDatabaseRepository
@@ -48,6 +47,40 @@ class DynamoDBDatabaseRepository(IDatabaseRepository):
 
     def __init__(self):
         self.logger = LogUtils.setup_logger(name=__name__)
+        self.max_workers = int(os.getenv("DYNAMODB_BULK_WRITE_MAX_WORKERS", "4"))
+
+
+    def __upsert_item(self, item: InvestmentPortfolio) -> None:
+        """
+        Creates or updates an investment portfolio with a single UpdateItem request (no reads).
+        The created_at of an existing portfolio is preserved through if_not_exists.
+
+        Args:
+            item (InvestmentPortfolio): The investment portfolio to save.
+        """
+        serialized_item = SerializationUtils.json_serialize(item)
+
+        # Update only mutable fields, setting created_at only when the portfolio is new
+        actions = [
+            InvestmentPortfolioModel.owner_name.set(serialized_item["owner_name"]),
+            InvestmentPortfolioModel.stocks.set(serialized_item["stocks"]),
+            InvestmentPortfolioModel.created_at.set(
+                InvestmentPortfolioModel.created_at | serialized_item["created_at"]
+            ),
+            InvestmentPortfolioModel.updated_at.set(serialized_item["updated_at"])
+        ]
+        if serialized_item.get("source_url") is not None:
+            actions.append(InvestmentPortfolioModel.source_url.set(serialized_item["source_url"]))
+        else:
+            actions.append(InvestmentPortfolioModel.source_url.remove())
+
+        try:
+            InvestmentPortfolioModel(owner_mail=serialized_item["owner_mail"]).update(actions=actions)
+
+        except Exception:
+            self.logger.exception("Failed to save investment portfolio to DynamoDB for "
+                                  f"hash_key={serialized_item['owner_mail']}")
+            raise
 
 
     @timing_decorator(enabled=True)
@@ -55,34 +88,18 @@ class DynamoDBDatabaseRepository(IDatabaseRepository):
         """
         Saves a list of investment portfolio data to the database repository.
 
+        Each portfolio is upserted with a single UpdateItem (no GetItem before it), and the requests are
+        sent in parallel on a thread pool.
+
         Args:
             items (list[InvestmentPortfolio]): The investment portfolio data to save.
         """
+        if not items:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(items)))) as executor:
+            # Consuming the results so the first failure is raised to the caller
+            list(executor.map(self.__upsert_item, items))
 
-        for item in items:
-            # Tries to update the item if it already exists (based on the hash key)
-            serialized_item = SerializationUtils.json_serialize(item)
-
-            try:
-                # Getting item if already exists and preserve created_at
-                existing_item = InvestmentPortfolioModel.get(serialized_item["owner_mail"])
-
-                # Update only mutable fields
-                existing_item.update(
-                    actions=[
-                        InvestmentPortfolioModel.owner_name.set(serialized_item["owner_name"]),
-                        InvestmentPortfolioModel.stocks.set(serialized_item["stocks"]),
-                        InvestmentPortfolioModel.source_url.set(serialized_item["source_url"]),
-                        InvestmentPortfolioModel.updated_at.set(serialized_item["updated_at"])
-                    ]
-                )
-
-            except DoesNotExist:
-                # If item does not exist, create a new one    
-                try:
-                    InvestmentPortfolioModel(**serialized_item).save()
-
-                except Exception:
-                    self.logger.exception("Failed to save investment portfolio to DynamoDB for "
-                                          f"hash_key={serialized_item['owner_mail']}")
-                    raise
+        self.logger.info(f"Successfully saved {len(items)} investment portfolios "
+                         f"to table {InvestmentPortfolioModel.Meta.table_name}")
@@ -1,3 +1,4 @@
+import os
 from typing import Any
 
 from app.src.features.cross.infra.mappers.dynamodb_streams_lambda_event_mapper import (
@@ -9,6 +10,9 @@ from app.src.features.cross.infra.adapters.awswrangler_cdc_data_catalog_sync_ada
 from app.src.features.store_dynamodb_streams_data.use_case.store_dynamodb_streams_data_use_case import (
     StoreDynamoDBStreamsDataUseCase
 )
+from app.src.features.store_dynamodb_streams_data.use_case.flush_staged_dynamodb_streams_data_use_case import (
+    FlushStagedDynamoDBStreamsDataUseCase
+)
 from app.src.features.cross.infra.mappers.http_response_mapper import HTTPResponseMapper
 
 
@@ -16,10 +20,13 @@ from app.src.features.cross.infra.mappers.http_response_mapper import HTTPRespon
 event_mapper = DynamoDBStreamsLambdaEventMapper()
 cdc_data_catalog_sync_adapter = AWSWranglerCDCDataCatalogSyncAdapter()
 
-# Build the use case
+# Build the use cases
 use_case = StoreDynamoDBStreamsDataUseCase(
     cdc_data_catalog_sync_adapter=cdc_data_catalog_sync_adapter
 )
+flush_use_case = FlushStagedDynamoDBStreamsDataUseCase(
+    cdc_data_catalog_sync_adapter=cdc_data_catalog_sync_adapter
+)
 
 
 # Defining a handler function for executing the use case in AWS Lambda
@@ -32,6 +39,9 @@ def handler(event: dict[str, Any], context: Any = None) -> dict[str, Any]:
     be reused by different Lambda functions by configuring the appropriate triggers and
     environment variables for each function.
 
+    Scheduled (EventBridge) events flush the data staged on the micro-batch buffer for the source
+    table of the function (DYNAMODB_SOURCE_TABLE_NAME environment variable).
+
     Args:
         event (dict): The event data passed to the Lambda function.
         context (Any): The context object provided by AWS Lambda.
@@ -40,6 +50,10 @@ def handler(event: dict[str, Any], context: Any = None) -> dict[str, Any]:
         dict[str, Any]: The result of the use case execution.
     """
 
+    if event.get("source") == "aws.events":
+        output_dto = flush_use_case.execute(table_name=os.environ["DYNAMODB_SOURCE_TABLE_NAME"])
+        return HTTPResponseMapper.map(output_dto)
+
     input_dto = event_mapper.map_event_to_input_dto(event=event)
     output_dto = use_case.execute(input_dto=input_dto)
 
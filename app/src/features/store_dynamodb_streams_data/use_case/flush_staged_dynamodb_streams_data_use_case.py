@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+from app.src.features.cross.domain.interfaces.cdc_data_catalog_sync_adapter_interface import (
+    ICDCDataCatalogSyncAdapter
+)
+from app.src.features.cross.domain.dtos.output_dto import OutputDTO
+from app.src.features.cross.utils.log import LogUtils
+
+
+logger = LogUtils.setup_logger(name=__name__)
+
+
+@dataclass(frozen=True)
+class FlushStagedDynamoDBStreamsDataUseCase:
+    """
+    Use case for flushing the CDC and SoR data staged (micro-batch buffer) for a source table.
+
+    Stream invocations only flush the staged data of a table when it receives new changes, so this
+    use case runs on a schedule to hold the maximum age of the buffer on quiet tables.
+    """
+
+    cdc_data_catalog_sync_adapter: ICDCDataCatalogSyncAdapter
+
+
+    def execute(self, table_name: str) -> OutputDTO:
+        """
+        Executes the use case to flush the staged data of a source table.
+
+        Args:
+            table_name (str): The name of the source table.
+
+        Returns:
+            OutputDTO: The output DTO containing the metrics of the flush of each output.
+        """
+        try:
+            metrics = self.cdc_data_catalog_sync_adapter.flush_staged_data(table_name=table_name)
+
+        except Exception:
+            logger.exception(f"Error flushing the staged CDC and SoR data of source table {table_name}")
+            raise
+
+        logger.info(f"Flushed the staged CDC and SoR data of source table {table_name}: {metrics}")
+
+        return OutputDTO.ok(
+            data={
+                "table_name": table_name,
+                "flush_metrics": metrics
+            }
+        )
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, UTC
+from typing import Callable
 import re
 
 from app.src.features.cross.domain.dtos.dynamodb_streams_input_dto import DynamoDBStreamsInputDTO
@@ -21,9 +23,16 @@ logger = LogUtils.setup_logger(name=__name__)
 class StoreDynamoDBStreamsDataUseCase:
     """
     Use case for streaming CDC data to a storage repository.
+
+    The output data is written to every sink (the CDC and SoR outputs of the sync adapter plus the
+    additional sinks registered by name) at the same time, so the latency of a batch is the one of
+    the slowest sink. Sinks fail independently and every failed sink is reported.
     """
 
     cdc_data_catalog_sync_adapter: ICDCDataCatalogSyncAdapter
+    additional_sinks: dict[str, Callable[[list[DynamoDBStreamsOutputData]], None]] = field(
+        default_factory=dict
+    )
 
 
     def __get_event_timestamp(self, approx_ts: int | float) -> datetime:
@@ -92,6 +101,59 @@ class StoreDynamoDBStreamsDataUseCase:
             return event_source.split(":")[-1]  # Fallback if parsing fails
 
 
+    def __get_sinks(self) -> dict[str, Callable[[list[DynamoDBStreamsOutputData]], None]]:
+        """
+        Gets the sinks where the output data is written, keyed by name.
+
+        Returns:
+            dict[str, Callable[[list[DynamoDBStreamsOutputData]], None]]: The function writing the
+                output data of each sink.
+        """
+        return {
+            "cdc": self.cdc_data_catalog_sync_adapter.store_and_sync_cdc_data,
+            "sor": self.cdc_data_catalog_sync_adapter.store_and_sync_sor_data,
+            **self.additional_sinks
+        }
+
+
+    def __write_to_sinks(self, data: list[DynamoDBStreamsOutputData]) -> list[str]:
+        """
+        Writes the output data to all the sinks concurrently.
+
+        Args:
+            data (list[DynamoDBStreamsOutputData]): The output data of the batch.
+
+        Returns:
+            list[str]: The names of the sinks.
+
+        Raises:
+            RuntimeError: When one or more sinks fail (after all of them finish), chained to the
+                error of the first failed sink.
+        """
+        sinks = self.__get_sinks()
+
+        errors: dict[str, Exception] = {}
+        with ThreadPoolExecutor(max_workers=len(sinks)) as executor:
+            futures = {
+                name: executor.submit(write_data, data=data) for name, write_data in sinks.items()
+            }
+            for name, future in futures.items():
+                try:
+                    future.result()
+                    logger.info(f"Successfully stored and synced data on sink '{name}'.")
+
+                except Exception as error:
+                    logger.error(f"Error storing and syncing data on sink '{name}'.", exc_info=error)
+                    errors[name] = error
+
+        if errors:
+            raise RuntimeError(
+                f"Failed to store and sync data on sinks {list(errors)}"
+            ) from next(iter(errors.values()))
+
+        return list(sinks)
+
+
     def execute(self, input_dto: DynamoDBStreamsInputDTO) -> OutputDTO:
         """
         Executes the use case to map the AWS Lambda event to InputDTO.
@@ -136,11 +198,9 @@ class StoreDynamoDBStreamsDataUseCase:
                 raise
 
         try:
-            logger.info("Storing and syncing CDC data from DynamoDB Streams to a CDC table in the data catalog.")
-            self.cdc_data_catalog_sync_adapter.store_and_sync_cdc_data(data=streams_output_data)
-
-            logger.info("Storing and syncing SoR data from DynamoDB Streams to a SoR table in the data catalog.")
-            self.cdc_data_catalog_sync_adapter.store_and_sync_sor_data(data=streams_output_data)
+            logger.info("Storing and syncing data from DynamoDB Streams to the CDC and SoR tables in "
+                        "the data catalog.")
+            sink_names = self.__write_to_sinks(data=streams_output_data)
 
         except Exception:
             logger.exception("Error storing and syncing CDC and SoR data to the data catalog.")
@@ -153,6 +213,7 @@ class StoreDynamoDBStreamsDataUseCase:
             data={
                 "total_table_records": len(streams_output_data),
                 "cdc_table_name": f"cdc_{streams_output_data[0].table_name}",
-                "sor_table_name": f"sor_{streams_output_data[0].table_name}"
+                "sor_table_name": f"sor_{streams_output_data[0].table_name}",
+                "sinks": sink_names
             }
         )
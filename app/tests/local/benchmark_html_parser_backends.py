@@ -0,0 +1,87 @@
+"""
+Benchmark of the HTML parser backends available for the Fundamentus stock metrics parser.
+
+Usage:
+    python -m app.tests.local.benchmark_html_parser_backends PETR4 VALE3 ITUB4
+
+The pages are downloaded only once and then parsed a number of times by each backend. The script
+prints the average per-page parse time of each backend (page by page and in batch mode with
+parse_many) and checks that all of them produce the same FundamentusStockMetrics entities.
+"""
+import sys
+import time
+from dataclasses import asdict
+
+from app.src.features.get_fundamentus_eod_stock_metrics.infra.adapters.fundamentus_html_parser_adapter import (
+    FundamentusHTMLParserAdapter
+)
+from app.src.features.cross.infra.adapters.requests_http_client_adapter import RequestsHTTPClientAdapter
+from app.src.features.cross.domain.entities.http_client_request_config import HTTPClientRequestConfig
+from app.src.features.cross.domain.entities.http_client_retry_config import HTTPClientRetryConfig
+from app.src.features.cross.value_objects import HTMLParserBackend
+
+
+NUM_ROUNDS = 20
+
+
+def build_request_config(stock_code: str) -> HTTPClientRequestConfig:
+    return HTTPClientRequestConfig(
+        url=f"https://www.fundamentus.com.br/detalhes.php?papel={stock_code}",
+        headers={
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                          "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        },
+        timeout=10,
+        retry_config=HTTPClientRetryConfig()
+    )
+
+
+def comparable(stock_metrics) -> dict:
+    # The execution timestamp is generated on each parse and can't be compared
+    stock_metrics_dict = asdict(stock_metrics)
+    stock_metrics_dict.pop("execution_timestamp")
+    return {k: (None if v != v else v) for k, v in stock_metrics_dict.items()}  # NaN -> None
+
+
+if __name__ == "__main__":
+    stock_codes = sys.argv[1:] or ["PETR4", "VALE3", "ITUB4", "BBDC4", "WEGE3"]
+
+    http_client_adapter = RequestsHTTPClientAdapter()
+    request_configs = [build_request_config(stock_code) for stock_code in stock_codes]
+    http_responses = http_client_adapter.batch_get(request_configs=request_configs)
+
+    results = {}
+    for backend in HTMLParserBackend:
+        html_parser_adapter = FundamentusHTMLParserAdapter(parser_backend=backend)
+        if html_parser_adapter.parser_backend != backend:
+            print(f"{backend.value:>15}: not installed, skipping")
+            continue
+
+        start_time = time.perf_counter()
+        for _ in range(NUM_ROUNDS):
+            parsed = [
+                html_parser_adapter.parse_html_content(
+                    html_content=http_response.content,
+                    encoding=http_response.encoding,
+                    request_config=request_config
+                )
+                for http_response, request_config in zip(http_responses, request_configs)
+            ]
+        elapsed_time = time.perf_counter() - start_time
+
+        results[backend] = [comparable(stock_metrics) for stock_metrics in parsed]
+        per_page_ms = 1000 * elapsed_time / (NUM_ROUNDS * len(http_responses))
+        print(f"{backend.value:>15}: {per_page_ms:.2f} ms per page")
+
+        start_time = time.perf_counter()
+        for _ in range(NUM_ROUNDS):
+            html_parser_adapter.parse_many(pages=http_responses, as_frame=True)
+        elapsed_time = time.perf_counter() - start_time
+
+        per_page_ms = 1000 * elapsed_time / (NUM_ROUNDS * len(http_responses))
+        print(f"{backend.value:>15}: {per_page_ms:.2f} ms per page (parse_many)")
+
+    reference = results.get(HTMLParserBackend.BEAUTIFULSOUP)
+    for backend, parsed in results.items():
+        status = "identical" if parsed == reference else "DIFFERENT"
+        print(f"{backend.value:>15}: output {status} to BeautifulSoup")
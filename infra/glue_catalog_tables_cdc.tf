@@ -17,7 +17,7 @@
 /* --------------------------------------------------------
    GLUE TABLE: cdc_tbl_b3stocks_investment_portfolio
    CDC table containing investment portfolio change events
-   captured from DynamoDB Streams and stored in S3 as JSON.
+   captured from DynamoDB Streams and stored in S3 as Parquet.
    Partitioned by event_date for efficient querying.
 -------------------------------------------------------- */
 /*
@@ -29,17 +29,21 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_investment_portfolio" {
   table_type = "EXTERNAL_TABLE"
 
   parameters = {
-    classification = "json"
+    classification = "parquet"
   }
 
   storage_descriptor {
     location      = "s3://${aws_s3_bucket.analytics_cdc.bucket}/dynamodb/cdc_tbl_b3stocks_investment_portfolio/"
-    input_format  = "org.apache.hadoop.mapred.TextInputFormat"
-    output_format = "org.apache.hadoop.hive.ql.io.HiveIgnoreKeyTextOutputFormat"
+    input_format  = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat"
+    output_format = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat"
 
     ser_de_info {
-      name                  = "json"
-      serialization_library = "org.openx.data.jsonserde.JsonSerDe"
+      name                  = "parquet"
+      serialization_library = "org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe"
+
+      parameters = {
+        "serialization.format" = 1
+      }
     }
 
     columns {
@@ -72,6 +76,12 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_investment_portfolio" {
       comment = "Source service that generated the event (aws:dynamodb)"
     }
 
+    columns {
+      name    = "event_source_service"
+      type    = "string"
+      comment = "Name of the source service (dynamodb), also used as the S3 prefix of the table"
+    }
+
     columns {
       name    = "aws_region"
       type    = "string"
@@ -80,20 +90,26 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_investment_portfolio" {
 
     columns {
       name    = "table_keys"
-      type    = "string"
+      type    = "struct<owner_mail:string>"
       comment = "Primary key values of the affected source table record"
     }
 
     columns {
       name    = "table_new_image"
-      type    = "string"
-      comment = "JSON representation of the item after modification"
+      type    = "struct<created_at:string,owner_mail:string,owner_name:string,source_url:string,stocks:string,updated_at:string>"
+      comment = "Struct with the attributes of the item after modification"
     }
 
     columns {
       name    = "table_old_image"
+      type    = "struct<created_at:string,owner_mail:string,owner_name:string,source_url:string,stocks:string,updated_at:string>"
+      comment = "Struct with the attributes of the item before modification"
+    }
+
+    columns {
+      name    = "sequence_number"
       type    = "string"
-      comment = "JSON representation of the item before modification"
+      comment = "Sequence number of the DynamoDB stream record"
     }
 
     columns {
@@ -132,7 +148,7 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_investment_portfolio" {
 /* --------------------------------------------------------
    GLUE TABLE: cdc_tbl_b3stocks_active_stocks
    CDC table containing active stocks change events captured
-   from DynamoDB Streams and stored in S3 as JSON.
+   from DynamoDB Streams and stored in S3 as Parquet.
    Partitioned by event_date for efficient querying.
 -------------------------------------------------------- */
 
@@ -144,17 +160,21 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_active_stocks" {
   table_type = "EXTERNAL_TABLE"
 
   parameters = {
-    classification = "json"
+    classification = "parquet"
   }
 
   storage_descriptor {
     location      = "s3://${aws_s3_bucket.analytics_cdc.bucket}/dynamodb/cdc_tbl_b3stocks_active_stocks/"
-    input_format  = "org.apache.hadoop.mapred.TextInputFormat"
-    output_format = "org.apache.hadoop.hive.ql.io.HiveIgnoreKeyTextOutputFormat"
+    input_format  = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat"
+    output_format = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat"
 
     ser_de_info {
-      name                  = "json"
-      serialization_library = "org.openx.data.jsonserde.JsonSerDe"
+      name                  = "parquet"
+      serialization_library = "org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe"
+
+      parameters = {
+        "serialization.format" = 1
+      }
     }
 
     columns {
@@ -187,6 +207,12 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_active_stocks" {
       comment = "Source service that generated the event (aws:dynamodb)"
     }
 
+    columns {
+      name    = "event_source_service"
+      type    = "string"
+      comment = "Name of the source service (dynamodb), also used as the S3 prefix of the table"
+    }
+
     columns {
       name    = "aws_region"
       type    = "string"
@@ -195,20 +221,26 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_active_stocks" {
 
     columns {
       name    = "table_keys"
-      type    = "string"
+      type    = "struct<code:string>"
       comment = "Primary key values of the affected source table record"
     }
 
     columns {
       name    = "table_new_image"
-      type    = "string"
-      comment = "JSON representation of the stock item after modification"
+      type    = "struct<code:string,company_name:string,created_at:string,request_config:map<string,string>,updated_at:string>"
+      comment = "Struct with the attributes of the stock item after modification"
     }
 
     columns {
       name    = "table_old_image"
+      type    = "struct<code:string,company_name:string,created_at:string,request_config:map<string,string>,updated_at:string>"
+      comment = "Struct with the attributes of the stock item before modification"
+    }
+
+    columns {
+      name    = "sequence_number"
       type    = "string"
-      comment = "JSON representation of the stock item before modification"
+      comment = "Sequence number of the DynamoDB stream record"
     }
 
     columns {
@@ -247,7 +279,7 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_active_stocks" {
 /* --------------------------------------------------------
    GLUE TABLE: cdc_tbl_b3stocks_fundamentus_eod_stock_metrics
    CDC table containing eod stock metrics data captured from
-   DynamoDB Streams and stored in S3 as JSON.
+   DynamoDB Streams and stored in S3 as Parquet.
    Partitioned by event_date for efficient querying.
 -------------------------------------------------------- */
 
@@ -259,17 +291,21 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_fundamentus_eod_stock_metric
   table_type = "EXTERNAL_TABLE"
 
   parameters = {
-    classification = "json"
+    classification = "parquet"
   }
 
   storage_descriptor {
     location      = "s3://${aws_s3_bucket.analytics_cdc.bucket}/dynamodb/cdc_tbl_b3stocks_fundamentus_eod_stock_metrics/"
-    input_format  = "org.apache.hadoop.mapred.TextInputFormat"
-    output_format = "org.apache.hadoop.hive.ql.io.HiveIgnoreKeyTextOutputFormat"
+    input_format  = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat"
+    output_format = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat"
 
     ser_de_info {
-      name                  = "json"
-      serialization_library = "org.openx.data.jsonserde.JsonSerDe"
+      name                  = "parquet"
+      serialization_library = "org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe"
+
+      parameters = {
+        "serialization.format" = 1
+      }
     }
 
     columns {
@@ -302,6 +338,12 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_fundamentus_eod_stock_metric
       comment = "Source service that generated the event (aws:dynamodb)"
     }
 
+    columns {
+      name    = "event_source_service"
+      type    = "string"
+      comment = "Name of the source service (dynamodb), also used as the S3 prefix of the table"
+    }
+
     columns {
       name    = "aws_region"
       type    = "string"
@@ -310,20 +352,26 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_fundamentus_eod_stock_metric
 
     columns {
       name    = "table_keys"
-      type    = "string"
+      type    = "struct<execution_date:string,nome_papel:string>"
       comment = "Primary key values of the affected source table record"
     }
 
     columns {
       name    = "table_new_image"
-      type    = "string"
-      comment = "JSON representation of the item after modification"
+      type    = "struct<content_hash:string,dt_ult_balanco_proc:string,dt_ult_cot:string,execution_date:string,execution_timestamp:string,missing_fields:array<string>,nome_empresa:string,nome_papel:string,nome_setor:string,nome_subsetor:string,num_acoes:double,pct_cresc_rec_liq_ult_5a:double,pct_var_12m:double,pct_var_30d:double,pct_var_ano_a0:double,pct_var_ano_a1:double,pct_var_ano_a2:double,pct_var_ano_a3:double,pct_var_ano_a4:double,pct_var_ano_a5:double,pct_var_dia:double,pct_var_mes:double,tipo_papel:string,vlr_ativ_circulante:double,vlr_ativo:double,vlr_cot:double,vlr_cot_max_52_sem:double,vlr_cot_min_52_sem:double,vlr_disponibilidades:double,vlr_div_yield:double,vlr_divida_bruta:double,vlr_divida_bruta_sobre_patrim:double,vlr_divida_liq:double,vlr_ebit_sobre_ativo:double,vlr_ebit_ult_12m:double,vlr_ebit_ult_3m:double,vlr_ev_sobre_ebit:double,vlr_ev_sobre_ebitda:double,vlr_firma:double,vlr_giro_ativos:double,vlr_liquidez_corr:double,vlr_lpa:double,vlr_lucro_liq_ult_12m:double,vlr_lucro_liq_ult_3m:double,vlr_margem_bruta:double,vlr_margem_ebit:double,vlr_margem_liq:double,vlr_mercado:double,vlr_p_sobre_ativ:double,vlr_p_sobre_ativ_circ_liq:double,vlr_p_sobre_cap_giro:double,vlr_p_sobre_ebit:double,vlr_p_sobre_l:double,vlr_p_sobre_vp:double,vlr_patrim_liq:double,vlr_psr:double,vlr_receita_liq_ult_12m:double,vlr_receita_liq_ult_3m:double,vlr_roe:double,vlr_roic:double,vlr_vpa:double,vol_med_neg_2m:double>"
+      comment = "Struct with the attributes of the item after modification"
     }
 
     columns {
       name    = "table_old_image"
+      type    = "struct<content_hash:string,dt_ult_balanco_proc:string,dt_ult_cot:string,execution_date:string,execution_timestamp:string,missing_fields:array<string>,nome_empresa:string,nome_papel:string,nome_setor:string,nome_subsetor:string,num_acoes:double,pct_cresc_rec_liq_ult_5a:double,pct_var_12m:double,pct_var_30d:double,pct_var_ano_a0:double,pct_var_ano_a1:double,pct_var_ano_a2:double,pct_var_ano_a3:double,pct_var_ano_a4:double,pct_var_ano_a5:double,pct_var_dia:double,pct_var_mes:double,tipo_papel:string,vlr_ativ_circulante:double,vlr_ativo:double,vlr_cot:double,vlr_cot_max_52_sem:double,vlr_cot_min_52_sem:double,vlr_disponibilidades:double,vlr_div_yield:double,vlr_divida_bruta:double,vlr_divida_bruta_sobre_patrim:double,vlr_divida_liq:double,vlr_ebit_sobre_ativo:double,vlr_ebit_ult_12m:double,vlr_ebit_ult_3m:double,vlr_ev_sobre_ebit:double,vlr_ev_sobre_ebitda:double,vlr_firma:double,vlr_giro_ativos:double,vlr_liquidez_corr:double,vlr_lpa:double,vlr_lucro_liq_ult_12m:double,vlr_lucro_liq_ult_3m:double,vlr_margem_bruta:double,vlr_margem_ebit:double,vlr_margem_liq:double,vlr_mercado:double,vlr_p_sobre_ativ:double,vlr_p_sobre_ativ_circ_liq:double,vlr_p_sobre_cap_giro:double,vlr_p_sobre_ebit:double,vlr_p_sobre_l:double,vlr_p_sobre_vp:double,vlr_patrim_liq:double,vlr_psr:double,vlr_receita_liq_ult_12m:double,vlr_receita_liq_ult_3m:double,vlr_roe:double,vlr_roic:double,vlr_vpa:double,vol_med_neg_2m:double>"
+      comment = "Struct with the attributes of the item before modification"
+    }
+
+    columns {
+      name    = "sequence_number"
       type    = "string"
-      comment = "JSON representation of the item before modification"
+      comment = "Sequence number of the DynamoDB stream record"
     }
 
     columns {
@@ -362,7 +410,7 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_fundamentus_eod_stock_metric
 /* --------------------------------------------------------
    GLUE TABLE: cdc_tbl_b3stocks_batch_process_control
    CDC table containing batch process control data captured
-   from DynamoDB Streams and stored in S3 as JSON.
+   from DynamoDB Streams and stored in S3 as Parquet.
    Partitioned by event_date for efficient querying.
 -------------------------------------------------------- */
 
@@ -374,17 +422,21 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_batch_process_control" {
   table_type = "EXTERNAL_TABLE"
 
   parameters = {
-    classification = "json"
+    classification = "parquet"
   }
 
   storage_descriptor {
     location      = "s3://${aws_s3_bucket.analytics_cdc.bucket}/dynamodb/cdc_tbl_b3stocks_batch_process_control/"
-    input_format  = "org.apache.hadoop.mapred.TextInputFormat"
-    output_format = "org.apache.hadoop.hive.ql.io.HiveIgnoreKeyTextOutputFormat"
+    input_format  = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat"
+    output_format = "org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat"
 
     ser_de_info {
-      name                  = "json"
-      serialization_library = "org.openx.data.jsonserde.JsonSerDe"
+      name                  = "parquet"
+      serialization_library = "org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe"
+
+      parameters = {
+        "serialization.format" = 1
+      }
     }
 
     columns {
@@ -417,6 +469,12 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_batch_process_control" {
       comment = "Source service that generated the event (aws:dynamodb)"
     }
 
+    columns {
+      name    = "event_source_service"
+      type    = "string"
+      comment = "Name of the source service (dynamodb), also used as the S3 prefix of the table"
+    }
+
     columns {
       name    = "aws_region"
       type    = "string"
@@ -425,20 +483,26 @@ resource "aws_glue_catalog_table" "cdc_tbl_b3stocks_batch_process_control" {
 
     columns {
       name    = "table_keys"
-      type    = "string"
+      type    = "struct<execution_date:string,process_name:string>"
       comment = "Primary key values of the affected source table record"
     }
 
     columns {
       name    = "table_new_image"
-      type    = "string"
-      comment = "JSON representation of the item after modification"
+      type    = "struct<created_at:string,execution_date:string,finished_at:string,process_name:string,process_status:string,processed_items:double,total_items:double,updated_at:string>"
+      comment = "Struct with the attributes of the item after modification"
     }
 
     columns {
       name    = "table_old_image"
+      type    = "struct<created_at:string,execution_date:string,finished_at:string,process_name:string,process_status:string,processed_items:double,total_items:double,updated_at:string>"
+      comment = "Struct with the attributes of the item before modification"
+    }
+
+    columns {
+      name    = "sequence_number"
       type    = "string"
-      comment = "JSON representation of the item before modification"
+      comment = "Sequence number of the DynamoDB stream record"
     }
 
     columns {
@@ -144,7 +144,7 @@ resource "aws_glue_catalog_table" "sor_tbl_b3stocks_active_stocks" {
 
     columns {
       name    = "request_config"
-      type    = "string"
+      type    = "map<string,string>"
       comment = "Configuration parameters for data extraction requests"
     }
 
@@ -560,6 +560,18 @@ resource "aws_glue_catalog_table" "sor_tbl_b3stocks_fundamentus_eod_stock_metric
       type    = "timestamp"
       comment = "Execution timestamp when the data was extracted and processed"
     }
+
+    columns {
+      name    = "content_hash"
+      type    = "string"
+      comment = "SHA-256 hash of the raw page content the metrics were parsed from"
+    }
+
+    columns {
+      name    = "missing_fields"
+      type    = "array<string>"
+      comment = "Fields whose headings were not found on the page and were left empty"
+    }
   }
 
   partition_keys {
@@ -11,10 +11,12 @@ DESCRIPTION:
 ROLES:
   - role-b3stocks-lambda-get-active-stocks: Lambda role for stock data collection
   - role-b3stocks-lambda-get-fundamentus-eod-stock-metrics: Lambda role for metrics collection
+  - role-b3stocks-lambda-get-fundamentus-screener-stock-metrics: Lambda role for bulk screener metrics collection
   - role-b3stocks-lambda-stream-active-stocks: Lambda role for stocks CDC processing
   - role-b3stocks-lambda-stream-fundamentus-eod-stock-metrics: Lambda role for metrics CDC processing
   - role-b3stocks-lambda-stream-batch-process-control: Lambda role for batch process control CDC
   - role-b3stocks-lambda-check-batch-processes-completion: Lambda role for checking batch process completion
+  - role-b3stocks-lambda-compact-data-catalog-partitions: Lambda role for compacting CDC and SoR partitions
 ----------------------------------------------------------------------------- */
 
 module "aws_iam_roles" {
@@ -76,6 +78,14 @@ module "aws_iam_roles" {
         "arn:aws:iam::${local.account_id}:policy/policy-b3stocks-get-fundamentus-eod-stock-metrics",
       ]
     },
+    {
+      role_name             = "role-b3stocks-lambda-get-fundamentus-screener-stock-metrics"
+      trust_policy_filepath = "${path.module}/assets/iam/trust_policies/trust-lambda.json"
+      policies_arns = [
+        "arn:aws:iam::${local.account_id}:policy/policy-b3stocks-lambda-cloudwatch-logs",
+        "arn:aws:iam::${local.account_id}:policy/policy-b3stocks-get-fundamentus-screener-stock-metrics",
+      ]
+    },
     {
       role_name             = "role-b3stocks-lambda-stream-fundamentus-eod-stock-metrics"
       trust_policy_filepath = "${path.module}/assets/iam/trust_policies/trust-lambda.json"
@@ -117,6 +127,14 @@ module "aws_iam_roles" {
         "arn:aws:iam::${local.account_id}:policy/policy-b3stocks-lambda-cloudwatch-logs",
         "arn:aws:iam::${local.account_id}:policy/policy-b3stocks-send-batch-processes-completion-mails",
       ]
+    },
+    {
+      role_name             = "role-b3stocks-lambda-compact-data-catalog-partitions"
+      trust_policy_filepath = "${path.module}/assets/iam/trust_policies/trust-lambda.json"
+      policies_arns = [
+        "arn:aws:iam::${local.account_id}:policy/policy-b3stocks-lambda-cloudwatch-logs",
+        "arn:aws:iam::${local.account_id}:policy/policy-b3stocks-compact-data-catalog-partitions",
+      ]
     }
   ]
 }
@@ -12,6 +12,8 @@ FUNCTIONS:
   - b3stocks-get-investment-portfolios: Retrieves and processes user investment portfolios
   - b3stocks-get-active-stocks: Collects active stock data from B3 sources
   - b3stocks-get-fundamentus-eod-stock-metrics: Fetches end-of-day stock metrics from Fundamentus
+  - b3stocks-get-fundamentus-screener-stock-metrics: Fetches partial metrics of every ticker at once
+  - b3stocks-compact-data-catalog-partitions: Compacts the small files of past CDC and SoR partitions
 ----------------------------------------------------------------------------- */
 
 /* --------------------------------------------------------
@@ -39,6 +41,7 @@ module "aws_lambda_function_get_investment_portfolios" {
     S3_ARTIFACTS_BUCKET_NAME_PREFIX          = var.s3_artifacts_bucket_name_prefix
     S3_INVESTMENT_PORTFOLIOS_KEY_PREFIX      = var.s3_investment_portfolios_key_prefix
     DYNAMODB_INVESTMENT_PORTFOLIO_TABLE_NAME = module.aws_dynamodb_table_tbl_b3stocks_investment_portfolio.table_name
+    DYNAMODB_BULK_WRITE_MAX_WORKERS          = "4"
   }
 
   layers_arns = [
@@ -79,6 +82,7 @@ module "aws_lambda_function_get_active_stocks" {
   environment_variables = {
     DYNAMODB_ACTIVE_STOCKS_TABLE_NAME = module.aws_dynamodb_table_tbl_b3stocks_active_stocks.table_name
     SNS_ACTIVE_STOCKS_TOPIC_NAME      = module.sns_topic_active_stocks.topic_name
+    DYNAMODB_BULK_WRITE_MAX_WORKERS   = "4"
   }
 
   layers_arns = [
@@ -119,6 +123,11 @@ module "aws_lambda_function_get_fundamentus_eod_stock_metrics" {
   environment_variables = {
     DYNAMODB_FUNDAMENTUS_EOD_STOCK_METRICS_TABLE_NAME = module.aws_dynamodb_table_tbl_b3stocks_fundamentus_eod_stock_metrics.table_name
     DYNAMODB_BATCH_PROCESS_CONTROL_TABLE_NAME         = module.aws_dynamodb_table_tbl_b3stocks_batch_process_control.table_name
+    FUNDAMENTUS_MAX_IN_FLIGHT_REQUESTS                = "8"
+    FUNDAMENTUS_MAX_REQUESTS_PER_SECOND               = "10"
+    FUNDAMENTUS_PARSER_PROCESSES                      = "0"
+    DYNAMODB_BULK_WRITE_MAX_WORKERS                   = "4"
+    BATCH_PROCESS_CONTROL_NUM_SHARDS                  = "1"
   }
 
   layers_arns = [
@@ -152,6 +161,50 @@ resource "aws_lambda_event_source_mapping" "queue-fundamentus-eod-stock-metrics"
 }
 
 
+/* --------------------------------------------------------
+   LAMBDA FUNCTION: get-fundamentus-screener-stock-metrics
+   Fetches the Fundamentus screener page and stores partial
+   metrics of every active ticker with a single request.
+   Scheduled daily at 20:45 UTC, before the detail pages
+   pipeline that overwrites the records with complete data.
+-------------------------------------------------------- */
+
+module "aws_lambda_function_get_fundamentus_screener_stock_metrics" {
+  source = "git::https://github.com/ThiagoPanini/tfbox.git?ref=aws/lambda-function/v0.7.0"
+
+  function_name = "b3stocks-get-fundamentus-screener-stock-metrics"
+  description   = "Fetches partial stock metrics of every ticker from Fundamentus screener page"
+  runtime       = "python3.12"
+  timeout       = 180
+
+  role_arn = module.aws_iam_roles.roles_arns["role-b3stocks-lambda-get-fundamentus-screener-stock-metrics"]
+
+  source_code_path = "../app"
+  lambda_handler   = "app.src.features.get_fundamentus_eod_stock_metrics.presentation.get_fundamentus_screener_stock_metrics_presentation.handler"
+
+  environment_variables = {
+    DYNAMODB_FUNDAMENTUS_EOD_STOCK_METRICS_TABLE_NAME = module.aws_dynamodb_table_tbl_b3stocks_fundamentus_eod_stock_metrics.table_name
+    DYNAMODB_BATCH_PROCESS_CONTROL_TABLE_NAME         = module.aws_dynamodb_table_tbl_b3stocks_batch_process_control.table_name
+    DYNAMODB_BULK_WRITE_MAX_WORKERS                   = "4"
+    BATCH_PROCESS_CONTROL_NUM_SHARDS                  = "1"
+  }
+
+  layers_arns = [
+    module.aws_lambda_layers.layers_arns["b3stocks-deps"],
+    "arn:aws:lambda:${local.region_name}:336392948345:layer:AWSSDKPandas-Python312:18"
+  ]
+
+  create_eventbridge_trigger = true
+  cron_expression            = "cron(45 20 * * ? *)"
+
+  tags = var.tags
+
+  depends_on = [
+    module.aws_iam_roles
+  ]
+}
+
+
 /* --------------------------------------------------------
    LAMBDA FUNCTION: check-batch-processes-completion
    Checks the completion status of the batch processes
@@ -171,6 +224,10 @@ module "aws_lambda_function_check_batch_processes_completion" {
   source_code_path = "../app"
   lambda_handler   = "app.src.features.check_batch_processes_completion.presentation.check_batch_processes_completion_presentation.handler"
 
+  environment_variables = {
+    DYNAMODB_BATCH_PROCESS_CONTROL_TABLE_NAME = module.aws_dynamodb_table_tbl_b3stocks_batch_process_control.table_name
+  }
+
   layers_arns = [
     module.aws_lambda_layers.layers_arns["b3stocks-deps"]
   ]
@@ -226,3 +283,60 @@ module "aws_lambda_function_send_batch_processes_completion_mails" {
   ]
 }
 
+
+/* --------------------------------------------------------
+   LAMBDA FUNCTION: compact-data-catalog-partitions
+   Rewrites the small JSON and Parquet files of past CDC
+   and SoR partitions into target sized Snappy Parquet
+   files and swaps the Glue partition locations. Scheduled
+   daily at 06:00 UTC.
+-------------------------------------------------------- */
+
+module "aws_lambda_function_compact_data_catalog_partitions" {
+  source = "git::https://github.com/ThiagoPanini/tfbox.git?ref=aws/lambda-function/v0.7.0"
+
+  function_name = "b3stocks-compact-data-catalog-partitions"
+  description   = "Compacts the small files of past CDC and SoR partitions into Parquet files"
+  runtime       = "python3.12"
+  timeout       = 900
+
+  role_arn = module.aws_iam_roles.roles_arns["role-b3stocks-lambda-compact-data-catalog-partitions"]
+
+  source_code_path = "../app"
+  lambda_handler   = "app.src.features.compact_data_catalog_partitions.presentation.compact_data_catalog_partitions_presentation.handler"
+
+  environment_variables = {
+    COMPACTION_TARGET_FILE_SIZE_BYTES   = "134217728"
+    COMPACTION_MIN_PARTITION_AGE_DAYS   = "2"
+    COMPACTION_LATE_FILES_LOOKBACK_DAYS = "7"
+    COMPACTION_TABLES = jsonencode(concat(
+      [
+        for table in [
+          aws_glue_catalog_table.cdc_tbl_b3stocks_active_stocks,
+          aws_glue_catalog_table.cdc_tbl_b3stocks_fundamentus_eod_stock_metrics,
+          aws_glue_catalog_table.cdc_tbl_b3stocks_batch_process_control
+        ] : { database = table.database_name, table = table.name, partition_col = "event_date" }
+      ],
+      [
+        for table in [
+          aws_glue_catalog_table.sor_tbl_b3stocks_active_stocks,
+          aws_glue_catalog_table.sor_tbl_b3stocks_fundamentus_eod_stock_metrics,
+          aws_glue_catalog_table.sor_tbl_b3stocks_batch_process_control
+        ] : { database = table.database_name, table = table.name, partition_col = "execution_date" }
+      ]
+    ))
+  }
+
+  layers_arns = [
+    "arn:aws:lambda:${local.region_name}:336392948345:layer:AWSSDKPandas-Python312:18"
+  ]
+
+  create_eventbridge_trigger = true
+  cron_expression            = "cron(0 6 * * ? *)"
+
+  tags = var.tags
+
+  depends_on = [
+    module.aws_iam_roles
+  ]
+}
@@ -20,7 +20,7 @@ EVENT SOURCE MAPPINGS:
 /* --------------------------------------------------------
    LAMBDA FUNCTION: stream-investment-portfolios
    Processes Change Data Capture events from investment
-   portfolio DynamoDB table and stores JSON records in S3
+   portfolio DynamoDB table and stores Parquet records in S3
    partitioned by event_date for analytics processing.
 -------------------------------------------------------- */
 /*
@@ -38,16 +38,24 @@ module "aws_lambda_function_stream_investment_portfolios" {
   lambda_handler   = "app.src.features.store_dynamodb_streams_data.presentation.store_dynamodb_streams_data_presentation.handler"
 
   environment_variables = {
-    S3_ANALYTICS_CDC_BUCKET_NAME_PREFIX = var.s3_analytics_cdc_bucket_name_prefix
-    S3_ANALYTICS_SOR_BUCKET_NAME_PREFIX = var.s3_analytics_sor_bucket_name_prefix
-    DATA_CATALOG_CDC_DATABASE_NAME      = aws_glue_catalog_database.b3stocks_analytics_cdc.name
-    DATA_CATALOG_SOR_DATABASE_NAME      = aws_glue_catalog_database.b3stocks_analytics_sor.name
+    S3_ANALYTICS_CDC_BUCKET_NAME_PREFIX    = var.s3_analytics_cdc_bucket_name_prefix
+    S3_ANALYTICS_SOR_BUCKET_NAME_PREFIX    = var.s3_analytics_sor_bucket_name_prefix
+    DATA_CATALOG_CDC_DATABASE_NAME         = aws_glue_catalog_database.b3stocks_analytics_cdc.name
+    DATA_CATALOG_SOR_DATABASE_NAME         = aws_glue_catalog_database.b3stocks_analytics_sor.name
+    CDC_MICRO_BATCH_BUFFER_ENABLED         = "true"
+    CDC_MICRO_BATCH_BUFFER_MAX_BYTES       = "33554432"
+    CDC_MICRO_BATCH_BUFFER_MAX_AGE_SECONDS = "900"
+    DYNAMODB_SOURCE_TABLE_NAME             = module.aws_dynamodb_table_tbl_b3stocks_investment_portfolio.table_name
   }
 
   layers_arns = [
     "arn:aws:lambda:${local.region_name}:336392948345:layer:AWSSDKPandas-Python312:18"
   ]
 
+  # Flushes the staged CDC and SoR data of quiet source tables (micro-batch buffer maximum age)
+  create_eventbridge_trigger = true
+  cron_expression            = "cron(0/15 * * * ? *)"
+
   tags = var.tags
 
   depends_on = [
@@ -91,16 +99,24 @@ module "aws_lambda_function_stream_active_stocks" {
   lambda_handler   = "app.src.features.store_dynamodb_streams_data.presentation.store_dynamodb_streams_data_presentation.handler"
 
   environment_variables = {
-    S3_ANALYTICS_CDC_BUCKET_NAME_PREFIX = var.s3_analytics_cdc_bucket_name_prefix
-    S3_ANALYTICS_SOR_BUCKET_NAME_PREFIX = var.s3_analytics_sor_bucket_name_prefix
-    DATA_CATALOG_CDC_DATABASE_NAME      = aws_glue_catalog_database.b3stocks_analytics_cdc.name
-    DATA_CATALOG_SOR_DATABASE_NAME      = aws_glue_catalog_database.b3stocks_analytics_sor.name
+    S3_ANALYTICS_CDC_BUCKET_NAME_PREFIX    = var.s3_analytics_cdc_bucket_name_prefix
+    S3_ANALYTICS_SOR_BUCKET_NAME_PREFIX    = var.s3_analytics_sor_bucket_name_prefix
+    DATA_CATALOG_CDC_DATABASE_NAME         = aws_glue_catalog_database.b3stocks_analytics_cdc.name
+    DATA_CATALOG_SOR_DATABASE_NAME         = aws_glue_catalog_database.b3stocks_analytics_sor.name
+    CDC_MICRO_BATCH_BUFFER_ENABLED         = "true"
+    CDC_MICRO_BATCH_BUFFER_MAX_BYTES       = "33554432"
+    CDC_MICRO_BATCH_BUFFER_MAX_AGE_SECONDS = "900"
+    DYNAMODB_SOURCE_TABLE_NAME             = module.aws_dynamodb_table_tbl_b3stocks_active_stocks.table_name
   }
 
   layers_arns = [
     "arn:aws:lambda:${local.region_name}:336392948345:layer:AWSSDKPandas-Python312:18"
   ]
 
+  # Flushes the staged CDC and SoR data of quiet source tables (micro-batch buffer maximum age)
+  create_eventbridge_trigger = true
+  cron_expression            = "cron(0/15 * * * ? *)"
+
   tags = var.tags
 
   depends_on = [
@@ -144,16 +160,24 @@ module "aws_lambda_function_stream_fundamentus_eod_stock_metrics" {
   lambda_handler   = "app.src.features.store_dynamodb_streams_data.presentation.store_dynamodb_streams_data_presentation.handler"
 
   environment_variables = {
-    S3_ANALYTICS_CDC_BUCKET_NAME_PREFIX = var.s3_analytics_cdc_bucket_name_prefix
-    S3_ANALYTICS_SOR_BUCKET_NAME_PREFIX = var.s3_analytics_sor_bucket_name_prefix
-    DATA_CATALOG_CDC_DATABASE_NAME      = aws_glue_catalog_database.b3stocks_analytics_cdc.name
-    DATA_CATALOG_SOR_DATABASE_NAME      = aws_glue_catalog_database.b3stocks_analytics_sor.name
+    S3_ANALYTICS_CDC_BUCKET_NAME_PREFIX    = var.s3_analytics_cdc_bucket_name_prefix
+    S3_ANALYTICS_SOR_BUCKET_NAME_PREFIX    = var.s3_analytics_sor_bucket_name_prefix
+    DATA_CATALOG_CDC_DATABASE_NAME         = aws_glue_catalog_database.b3stocks_analytics_cdc.name
+    DATA_CATALOG_SOR_DATABASE_NAME         = aws_glue_catalog_database.b3stocks_analytics_sor.name
+    CDC_MICRO_BATCH_BUFFER_ENABLED         = "true"
+    CDC_MICRO_BATCH_BUFFER_MAX_BYTES       = "33554432"
+    CDC_MICRO_BATCH_BUFFER_MAX_AGE_SECONDS = "900"
+    DYNAMODB_SOURCE_TABLE_NAME             = module.aws_dynamodb_table_tbl_b3stocks_fundamentus_eod_stock_metrics.table_name
   }
 
   layers_arns = [
     "arn:aws:lambda:${local.region_name}:336392948345:layer:AWSSDKPandas-Python312:18"
   ]
 
+  # Flushes the staged CDC and SoR data of quiet source tables (micro-batch buffer maximum age)
+  create_eventbridge_trigger = true
+  cron_expression            = "cron(0/15 * * * ? *)"
+
   tags = var.tags
 
   depends_on = [
@@ -197,16 +221,24 @@ module "aws_lambda_function_stream_batch_process_control" {
   lambda_handler   = "app.src.features.store_dynamodb_streams_data.presentation.store_dynamodb_streams_data_presentation.handler"
 
   environment_variables = {
-    S3_ANALYTICS_CDC_BUCKET_NAME_PREFIX = var.s3_analytics_cdc_bucket_name_prefix
-    S3_ANALYTICS_SOR_BUCKET_NAME_PREFIX = var.s3_analytics_sor_bucket_name_prefix
-    DATA_CATALOG_CDC_DATABASE_NAME      = aws_glue_catalog_database.b3stocks_analytics_cdc.name
-    DATA_CATALOG_SOR_DATABASE_NAME      = aws_glue_catalog_database.b3stocks_analytics_sor.name
+    S3_ANALYTICS_CDC_BUCKET_NAME_PREFIX    = var.s3_analytics_cdc_bucket_name_prefix
+    S3_ANALYTICS_SOR_BUCKET_NAME_PREFIX    = var.s3_analytics_sor_bucket_name_prefix
+    DATA_CATALOG_CDC_DATABASE_NAME         = aws_glue_catalog_database.b3stocks_analytics_cdc.name
+    DATA_CATALOG_SOR_DATABASE_NAME         = aws_glue_catalog_database.b3stocks_analytics_sor.name
+    CDC_MICRO_BATCH_BUFFER_ENABLED         = "true"
+    CDC_MICRO_BATCH_BUFFER_MAX_BYTES       = "33554432"
+    CDC_MICRO_BATCH_BUFFER_MAX_AGE_SECONDS = "900"
+    DYNAMODB_SOURCE_TABLE_NAME             = module.aws_dynamodb_table_tbl_b3stocks_batch_process_control.table_name
   }
 
   layers_arns = [
     "arn:aws:lambda:${local.region_name}:336392948345:layer:AWSSDKPandas-Python312:18"
   ]
 
+  # Flushes the staged CDC and SoR data of quiet source tables (micro-batch buffer maximum age)
+  create_eventbridge_trigger = true
+  cron_expression            = "cron(0/15 * * * ? *)"
+
   tags = var.tags
 
   depends_on = [
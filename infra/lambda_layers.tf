@@ -10,7 +10,7 @@ DESCRIPTION:
 
 LAYERS:
   - b3stocks-deps: Core dependencies including PynamoDB, PyYAML, requests,
-    BeautifulSoup4, and lxml for AWS service interaction and web scraping
+    BeautifulSoup4, lxml and aiohttp for AWS service interaction and web scraping
 ----------------------------------------------------------------------------- */
 
 module "aws_lambda_layers" {
@@ -24,7 +24,8 @@ module "aws_lambda_layers" {
         "PyYAML==6.0.2",
         "requests==2.32.3",
         "beautifulsoup4==4.13.3",
-        "lxml==5.3.1"
+        "lxml==5.3.1",
+        "aiohttp==3.11.13"
       ],
       runtime     = ["python3.12", "python3.13"]
       description = "Dependencies for b3stocks project, including useful packages to extract investment data and interact with AWS services"